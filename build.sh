@@ -32,8 +32,10 @@ if [ "$FRESH" = true ]; then
     echo ""
     echo "[1/4] Fresh rebuild - clearing old content..."
     rm -f content/articles/2*.md
-    echo "[]" > data/seen_urls.json
-    echo "  Cleared articles and seen URLs"
+    rm -f data/seen_urls.tsv data/cache/seen_urls.sqlite3
+    echo "{}" > data/feed_state.json
+    rm -rf data/cache/checkpoints
+    echo "  Cleared articles, seen URLs, feed state and run checkpoints"
 else
     echo ""
     echo "[1/4] Incremental build (use --fresh to clear old content)"
@@ -52,6 +54,8 @@ if [ "$THEMES" = true ]; then
 else
     python -m pipeline.generator
 fi
+python -m pipeline.image_gc
+python -m pipeline.stream_flow
 
 # Build Hugo
 echo ""
@@ -0,0 +1,243 @@
+"""Batched AI annotation: summary and tags for many articles per request."""
+
+import json
+import threading
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+from .fetcher import Article
+from .llm_cache import cached_chat_completion
+from .llm_executor import get_executor, get_openai_client
+from .summarizer import clean_description, summarize_article
+from .tagger import TAG_DESCRIPTIONS, VALID_TAGS, auto_tag
+
+
+# Default articles per request and prompt-token budget per request
+DEFAULT_BATCH_SIZE = 10
+MAX_PROMPT_TOKENS = 6000
+
+# Per-article content sent to the model and output allowance
+CONTENT_CHARS = 1500
+OUTPUT_TOKENS_PER_ARTICLE = 160
+
+SYSTEM_PROMPT = """You are an expert fly fishing editor. For each article you are given, write a summary and assign tags.
+
+Summary (2-3 sentences):
+1. Lead with the most interesting or actionable insight
+2. Include specific details (species, fly patterns, water types, techniques)
+3. Use fly fishing terminology naturally and write like an experienced fly angler
+4. Never start with "In this article" or similar meta-commentary; keep it punchy
+
+Tags (2-5 per article), chosen only from:
+{tag_context}
+
+Tag rules:
+- Always include at least one species/water tag: trout, salmon, steelhead, saltwater, warmwater
+- Add technique tags (dry-fly, nymphing, streamers, spey, euro-nymph) when relevant
+- "fly-tying" only for articles about tying flies; "beginner" for introductory content
+- "hatches" for entomology or matching-the-hatch content
+
+Return one entry per article, using the article's id."""
+
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "article_annotations",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "articles": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "summary": {"type": "string"},
+                            "tags": {"type": "array", "items": {"type": "string", "enum": VALID_TAGS}},
+                        },
+                        "required": ["id", "summary", "tags"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["articles"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return len(text) // 4 + 1
+
+
+def article_payload(index: int, article: Article) -> dict:
+    """The per-article JSON sent to the model."""
+    return {
+        "id": index,
+        "title": article.title,
+        "source": article.source_name,
+        "content": (article.description or "")[:CONTENT_CHARS],
+    }
+
+
+def plan_batches(
+    articles: list[Article],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_prompt_tokens: int = MAX_PROMPT_TOKENS,
+) -> list[list[int]]:
+    """Group article indices into batches by count and prompt-token budget.
+
+    Args:
+        articles: Articles to annotate
+        batch_size: Maximum articles per request
+        max_prompt_tokens: Approximate prompt-token budget per request
+
+    Returns:
+        List of batches, each a list of indices into articles
+    """
+    budget = max_prompt_tokens - estimate_tokens(SYSTEM_PROMPT) - estimate_tokens(str(TAG_DESCRIPTIONS))
+    batches: list[list[int]] = []
+    current: list[int] = []
+    used = 0
+
+    for i, article in enumerate(articles):
+        cost = estimate_tokens(json.dumps(article_payload(i, article)))
+        if current and (len(current) >= batch_size or used + cost > budget):
+            batches.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += cost
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_annotations(content: str, indices: list[int]) -> dict[int, tuple[str, list[str]]]:
+    """Validate a batch response and keep only well-formed entries.
+
+    Args:
+        content: Raw JSON response text
+        indices: Article ids that were sent in this batch
+
+    Returns:
+        Dict of id -> (summary, tags) for entries that passed validation
+    """
+    expected = set(indices)
+    valid: dict[int, tuple[str, list[str]]] = {}
+
+    for item in json.loads(content).get("articles", []):
+        if not isinstance(item, dict):
+            continue
+        article_id = item.get("id")
+        summary = item.get("summary")
+        tags = item.get("tags")
+        if article_id not in expected or article_id in valid:
+            continue
+        if not isinstance(summary, str) or not summary.strip():
+            continue
+        if not isinstance(tags, list):
+            continue
+        tags = [t for t in dict.fromkeys(str(t).strip().lower() for t in tags) if t in VALID_TAGS]
+        if not tags:
+            continue
+        valid[article_id] = (summary.strip().strip('"'), tags[:5])
+
+    return valid
+
+
+def annotate_batch(client, articles: list[Article], indices: list[int]) -> dict[int, tuple[str, list[str]]]:
+    """Summarize and tag one batch of articles in a single request."""
+    tag_context = "\n".join(f"- {tag}: {desc}" for tag, desc in TAG_DESCRIPTIONS.items())
+    payload = [article_payload(i, articles[i]) for i in indices]
+
+    content = cached_chat_completion(
+        client,
+        validate=json.loads,
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT.format(tag_context=tag_context)},
+            {"role": "user", "content": json.dumps({"articles": payload}, ensure_ascii=False)},
+        ],
+        max_tokens=OUTPUT_TOKENS_PER_ARTICLE * len(indices) + 50,
+        temperature=0.5,
+        response_format=RESPONSE_FORMAT,
+    )
+    return parse_annotations(content, indices)
+
+
+def _short_summary(article: Article) -> Optional[str]:
+    """Match summarize_article for articles with too little text to summarize."""
+    description = article.description
+    if not description or len(description.strip()) < 50:
+        return clean_description(description) if description else f"Read more about {article.title}."
+    return None
+
+
+def annotate_article(article: Article, log: Callable[[str], None] = print) -> tuple[str, list[str]]:
+    """Summarize and tag a single article (two requests, or local fallbacks)."""
+    return (
+        summarize_article(article.title, article.description, article.source_name, log),
+        auto_tag(article.title, article.description, article.source_name, log),
+    )
+
+
+class BatchAnnotator:
+    """Per-article annotation backed by shared batch requests.
+
+    Calling it with an article index returns that article's (summary, tags).
+    The first call for any article in a batch sends the whole batch on the
+    LLM executor; the other articles of that batch wait for the same
+    response. This lets a staged pipeline pull articles one at a time while
+    still paying for one request per batch. An article missing from its
+    batch response, or returned malformed, falls back to the single-article
+    summarize_article/auto_tag path, so every article gets a summary and
+    tags. A failed batch request is reported through the log of the
+    batch's first article, so it appears once and in a fixed place.
+
+    Call it from threads outside the LLM executor (fallbacks run inline).
+    """
+
+    def __init__(
+        self,
+        articles: list[Article],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_prompt_tokens: int = MAX_PROMPT_TOKENS,
+    ):
+        self.articles = articles
+        self.client = get_openai_client()
+        self.fallbacks = 0
+        self._batches = plan_batches(articles, batch_size, max_prompt_tokens) if self.client else []
+        self._batch_of = {i: n for n, batch in enumerate(self._batches) for i in batch}
+        self._futures: dict[int, Future] = {}
+        self._lock = threading.Lock()
+
+    def _run_batch(self, indices: list[int]) -> tuple[dict[int, tuple[str, list[str]]], Optional[str]]:
+        """Annotations of one batch, and the error message if the request failed."""
+        try:
+            return annotate_batch(self.client, self.articles, indices), None
+        except Exception as e:
+            return {}, f"  Batch annotation error ({len(indices)} articles): {e}"
+
+    def __call__(self, index: int, log: Callable[[str], None] = print) -> tuple[str, list[str]]:
+        article = self.articles[index]
+        batch = self._batch_of.get(index)
+        if batch is not None:
+            with self._lock:
+                if batch not in self._futures:
+                    self._futures[batch] = get_executor().submit(self._run_batch, self._batches[batch])
+                future = self._futures[batch]
+            annotations, error = future.result()
+            if error and index == self._batches[batch][0]:
+                log(error)
+            annotation = annotations.get(index)
+            if annotation is not None:
+                summary, tags = annotation
+                return _short_summary(article) or summary, tags
+
+        with self._lock:
+            self.fallbacks += 1
+        return annotate_article(article, log)
@@ -0,0 +1,276 @@
+"""Persistent metadata index of published article markdown files.
+
+Theme extraction needs the title, summary, tags, source and date of recent
+articles. Instead of re-reading and parsing every file in content/articles
+on each run, the parsed frontmatter is kept in SQLite alongside each
+file's mtime, size and content hash. Reconciling the index only stats the
+directory; files are re-parsed when they are new or changed, and rows for
+deleted files are dropped. Date-range queries use an index on the date.
+
+The index is a cache: deleting data/cache/articles.sqlite3 just triggers a
+(parallel) rebuild on the next run.
+
+The same index also covers content/themes and content/digests (one
+database per section), where it is used to find every image that content
+still references.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+
+CONTENT_DIR = Path(__file__).parent.parent / "content"
+ARTICLES_DIR = CONTENT_DIR / "articles"
+INDEX_DB_PATH = Path(__file__).parent.parent / "data" / "cache" / "articles.sqlite3"
+
+# Content sections with frontmatter worth indexing
+SECTIONS = ("articles", "themes", "digests")
+
+# Image paths anywhere in frontmatter (image:, srcset entries, digest themes)
+IMAGE_REF_RE = re.compile(r"/images/[^\s\"',)]+")
+
+# Below this many files to parse, a process pool costs more than it saves
+PARALLEL_THRESHOLD = 200
+
+# Seconds a writer waits for another process to release the database
+BUSY_TIMEOUT = 30
+
+
+def parse_frontmatter(content: str) -> Optional[dict]:
+    """Parse the fields of an article's frontmatter used for indexing.
+
+    Returns:
+        Dict with title, summary, source_name, date (ISO string or ""),
+        image, tags and images (every /images/ path referenced), or None
+        if the file has no frontmatter
+    """
+    if not content.startswith("---"):
+        return None
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        return None
+
+    fields = {"title": "", "summary": "", "source_name": "", "date": "", "image": "", "tags": []}
+    for line in parts[1].strip().split("\n"):
+        if line.startswith("title:"):
+            fields["title"] = line.split(":", 1)[1].strip().strip('"')
+        elif line.startswith("summary:"):
+            fields["summary"] = line.split(":", 1)[1].strip().strip('"')
+        elif line.startswith("source_name:"):
+            fields["source_name"] = line.split(":", 1)[1].strip().strip('"')
+        elif line.startswith("date:"):
+            fields["date"] = line.split(":", 1)[1].strip()
+        elif line.startswith("image:"):
+            fields["image"] = line.split(":", 1)[1].strip().strip('"')
+        elif line.strip().startswith('- "'):
+            fields["tags"].append(line.strip()[3:-1])  # Remove '- "' and '"'
+    fields["images"] = sorted(set(IMAGE_REF_RE.findall(parts[1])))
+    return fields
+
+
+def normalize_date(date_str: str) -> Optional[str]:
+    """Convert a frontmatter date to a sortable UTC 'YYYY-MM-DDTHH:MM:SS'."""
+    if not date_str:
+        return None
+    try:
+        date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if date.tzinfo is not None:
+        date = date.astimezone(timezone.utc).replace(tzinfo=None)
+    return date.isoformat(timespec="seconds")
+
+
+def index_file(path: str) -> Optional[tuple]:
+    """Read and parse one article file into an index row.
+
+    Module-level so it can run in worker processes.
+
+    Returns:
+        Row tuple for the articles table, or None if unreadable
+    """
+    try:
+        raw = Path(path).read_bytes()
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    fields = parse_frontmatter(raw.decode("utf-8", errors="replace"))
+    if fields is None:
+        return None
+    return (
+        Path(path).name,
+        fields["title"],
+        fields["summary"],
+        json.dumps(fields["tags"]),
+        fields["source_name"],
+        normalize_date(fields["date"]),
+        fields["image"],
+        json.dumps(fields["images"]),
+        stat.st_mtime,
+        stat.st_size,
+        hashlib.sha256(raw).hexdigest(),
+    )
+
+
+class ArticleIndex:
+    """SQLite index of article frontmatter, kept in sync with the files.
+
+    Usage:
+        with ArticleIndex() as index:
+            index.reconcile()
+            rows = index.recent(days=14)
+
+        with ArticleIndex.for_section("themes") as index:
+            ...
+    """
+
+    def __init__(self, path: Path = INDEX_DB_PATH, content_dir: Path = ARTICLES_DIR):
+        self.path = path
+        self.content_dir = content_dir
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(articles)")}
+        if columns and "images" not in columns:
+            # Indexed before image references were recorded: rebuild
+            self._conn.execute("DROP TABLE articles")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS articles (
+                   filename TEXT PRIMARY KEY,
+                   title TEXT NOT NULL,
+                   summary TEXT NOT NULL,
+                   tags TEXT NOT NULL,
+                   source_name TEXT NOT NULL,
+                   date TEXT,
+                   image TEXT NOT NULL,
+                   images TEXT NOT NULL,
+                   mtime REAL NOT NULL,
+                   size INTEGER NOT NULL,
+                   content_hash TEXT NOT NULL
+               )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS articles_date ON articles (date)")
+        self._conn.commit()
+
+    @classmethod
+    def for_section(cls, section: str) -> "ArticleIndex":
+        """Open the index of one content section (e.g. "themes")."""
+        return cls(INDEX_DB_PATH.with_name(f"{section}.sqlite3"), CONTENT_DIR / section)
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def _upsert(self, rows: list[tuple]) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO articles (filename, title, summary, tags, source_name, "
+            "date, image, images, mtime, size, content_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def update(self, path: Path) -> None:
+        """Index (or re-index) one file, e.g. right after writing it."""
+        row = index_file(str(path))
+        if row is not None:
+            self._upsert([row])
+            self._conn.commit()
+
+    def reconcile(self, workers: Optional[int] = None) -> dict:
+        """Bring the index in line with the files on disk.
+
+        Only files whose mtime or size changed are read. Changed files
+        whose content hash is unchanged just get their stat refreshed.
+
+        Args:
+            workers: Processes for parsing many files (e.g. a cold
+                rebuild); defaults to the CPU count
+
+        Returns:
+            Counts of added/updated and removed files
+        """
+        on_disk = {}
+        if self.content_dir.exists():
+            with os.scandir(self.content_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md") and entry.name != "_index.md" and entry.is_file():
+                        stat = entry.stat()
+                        on_disk[entry.name] = (entry.path, stat.st_mtime, stat.st_size)
+
+        indexed = {
+            filename: (mtime, size)
+            for filename, mtime, size in self._conn.execute(
+                "SELECT filename, mtime, size FROM articles"
+            )
+        }
+
+        removed = [(name,) for name in indexed if name not in on_disk]
+        stale = [
+            path for name, (path, mtime, size) in on_disk.items()
+            if indexed.get(name) != (mtime, size)
+        ]
+
+        if len(stale) >= PARALLEL_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                rows = list(pool.map(index_file, stale, chunksize=64))
+        else:
+            rows = [index_file(path) for path in stale]
+
+        self._conn.executemany("DELETE FROM articles WHERE filename = ?", removed)
+        self._upsert([row for row in rows if row is not None])
+        self._conn.commit()
+
+        return {"updated": len(stale), "removed": len(removed)}
+
+    def recent(self, days: int) -> list[dict]:
+        """Articles dated within the last N days, newest first.
+
+        Returns:
+            List of dicts with filename, title, summary, tags, source_name,
+            date (timezone-aware UTC datetime) and image
+        """
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).replace(tzinfo=None)
+        rows = self._conn.execute(
+            "SELECT filename, title, summary, tags, source_name, date, image FROM articles "
+            "WHERE date >= ? ORDER BY date DESC, filename",
+            (cutoff.isoformat(timespec="seconds"),),
+        )
+        return [
+            {
+                "filename": filename,
+                "title": title,
+                "summary": summary,
+                "tags": json.loads(tags),
+                "source_name": source_name,
+                "date": datetime.fromisoformat(date).replace(tzinfo=timezone.utc),
+                "image": image,
+            }
+            for filename, title, summary, tags, source_name, date, image in rows
+        ]
+
+    def image_references(self) -> set[str]:
+        """Every /images/ path referenced by an indexed file."""
+        return {
+            path
+            for (images,) in self._conn.execute("SELECT images FROM articles")
+            for path in json.loads(images)
+        }
+
+    def close(self) -> None:
+        """Commit, fold the WAL back into the main file and close."""
+        self._conn.commit()
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._conn.close()
+
+    def __enter__(self) -> "ArticleIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
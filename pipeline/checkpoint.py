@@ -0,0 +1,128 @@
+"""Per-run checkpoint files for resumable multi-step jobs.
+
+A checkpoint is a small JSON file mapping step names to their outputs.
+Wrapping a step in Checkpoint.run() returns the recorded output if the step
+already completed in an earlier (crashed or repeated) run, and otherwise
+runs it and records the result before moving on.
+
+Steps that produce files outside data/cache (which a fresh CI checkout
+would not have) can keep copies next to the checkpoint and restore them.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+CHECKPOINT_DIR = Path(__file__).parent.parent / "data" / "cache" / "checkpoints"
+
+# Checkpoints older than this are deleted
+MAX_AGE_DAYS = 7
+
+
+class Checkpoint:
+    """JSON-file record of completed steps, safe to share between threads.
+
+    Usage:
+        checkpoint = Checkpoint.for_run("themes", "2024-05-01")
+        themes = checkpoint.run("themes", identify)
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._steps: dict[str, Any] = {}
+        if path.exists():
+            try:
+                self._steps = json.loads(path.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, OSError):
+                print(f"Ignoring unreadable checkpoint {path.name}")
+
+    @classmethod
+    def for_run(cls, job: str, run_id: str, directory: Path = CHECKPOINT_DIR) -> "Checkpoint":
+        """Open the checkpoint for one run of a job (e.g. one date)."""
+        return cls(directory / f"{job}-{run_id}.json")
+
+    def __contains__(self, step: str) -> bool:
+        with self._lock:
+            return step in self._steps
+
+    def get(self, step: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._steps.get(step, default)
+
+    def save(self, step: str, value: Any) -> None:
+        """Record a step's output and write the file atomically."""
+        with self._lock:
+            self._steps[step] = value
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._steps, indent=2, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.path)
+
+    @property
+    def files_dir(self) -> Path:
+        """Directory holding copies of files produced by steps."""
+        return self.path.with_suffix("")
+
+    def keep_files(self, paths: list[Path]) -> None:
+        """Copy files produced by a step next to the checkpoint."""
+        self.files_dir.mkdir(parents=True, exist_ok=True)
+        for path in paths:
+            shutil.copy2(path, self.files_dir / path.name)
+
+    def restore_files(self, paths: list[Path]) -> bool:
+        """Put back any missing files from the kept copies.
+
+        Returns:
+            True if every file exists afterwards
+        """
+        for path in paths:
+            kept = self.files_dir / path.name
+            if not path.exists() and kept.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(kept, path)
+        return all(path.exists() for path in paths)
+
+    def run(self, step: str, fn: Callable[[], Any], keep: Optional[Callable[[Any], Any]] = None) -> Any:
+        """Return a step's recorded output, or run it and record the output.
+
+        Args:
+            step: Step name, unique within the run
+            fn: Computes the step's JSON-serializable output
+            keep: Optional check on a fresh output; falsy means the step
+                degraded (e.g. fell back after an API error) and is not
+                recorded, so a re-run tries it again
+
+        Returns:
+            The step's output
+        """
+        with self._lock:
+            if step in self._steps:
+                return self._steps[step]
+        value = fn()
+        if keep is None or keep(value):
+            self.save(step, value)
+        return value
+
+
+def prune_checkpoints(directory: Path = CHECKPOINT_DIR, max_age_days: int = MAX_AGE_DAYS) -> int:
+    """Delete checkpoints (and their kept files) older than max_age_days.
+
+    Returns:
+        Number of checkpoints deleted
+    """
+    if not directory.exists():
+        return 0
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for path in directory.glob("*.json"):
+        if path.stat().st_mtime < cutoff:
+            shutil.rmtree(path.with_suffix(""), ignore_errors=True)
+            path.unlink()
+            removed += 1
+    return removed
@@ -8,6 +8,7 @@ from pathlib import Path
 
 import yaml
 
+from .llm_cache import report_cache_stats
 from .theme_extractor import classify_category, extract_themes_data
 from .weblinks_fetcher import fetch_all_weblinks
 
@@ -140,7 +141,7 @@ def generate_daily_digest(
     if not skip_themes:
         print("\n[1/2] Extracting themes...")
         if os.environ.get("OPENAI_API_KEY"):
-            themes = extract_themes_data(min_articles=min_articles_per_theme, days=7)
+            themes = extract_themes_data(min_articles=min_articles_per_theme, days=7, run_date=target_date)
             print(f"Generated {len(themes)} themes")
         else:
             print("Skipping themes (requires OPENAI_API_KEY)")
@@ -291,6 +292,7 @@ Examples:
         skip_themes=args.skip_themes,
         skip_weblinks=args.skip_weblinks
     )
+    report_cache_stats()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 """Fetch content from RSS feeds, NewsAPI, and Reddit."""
 
+import asyncio
+import html as html_lib
 import json
 import os
 import re
@@ -13,6 +15,11 @@ import httpx
 from bs4 import BeautifulSoup
 from dateutil import parser as date_parser
 
+from .keywords import get_engine
+from .near_dup import article_fingerprint
+from .seen_store import SeenStore
+from .transport import async_client, get_client
+
 
 # Keywords that indicate fly fishing content
 FISHING_KEYWORDS = [
@@ -51,9 +58,13 @@ EXCLUDE_KEYWORDS = [
     r'\bcrankbait', r'\bspinnerbait', r'\bbass boat', r'\btournament bass',
 ]
 
-# Compiled patterns for efficiency
-_FISHING_PATTERNS = [re.compile(kw, re.IGNORECASE) for kw in FISHING_KEYWORDS]
-_EXCLUDE_PATTERNS = [re.compile(kw, re.IGNORECASE) for kw in EXCLUDE_KEYWORDS]
+# Async ingestion limits: connections per host and seconds per source
+MAX_CONCURRENT_PER_HOST = 4
+SOURCE_TIMEOUT = 30
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TAG_GAP_RE = re.compile(r"\s*<[^>]+>\s*")
+_SPACE_RE = re.compile(r"\s+")
 
 
 def is_fishing_content(title: str, description: str) -> bool:
@@ -66,13 +77,14 @@ def is_fishing_content(title: str, description: str) -> bool:
     Returns:
         True if the content is fishing-related
     """
-    text = f"{title} {description}".lower()
+    return is_fishing_score(get_engine().scan(f"{title} {description}"))
 
-    # Count fishing keyword matches
-    fishing_score = sum(1 for p in _FISHING_PATTERNS if p.search(text))
 
-    # Count exclude keyword matches
-    exclude_score = sum(1 for p in _EXCLUDE_PATTERNS if p.search(text))
+def is_fishing_score(hits: dict[str, int]) -> bool:
+    """Decide fishing vs. non-fishing from keyword engine hit counts."""
+    # Count fishing and exclude keyword matches (one scan for both lists)
+    fishing_score = hits["fishing"]
+    exclude_score = hits["exclude"]
 
     # Article is fishing content if:
     # 1. Has at least one fishing keyword, AND
@@ -80,6 +92,57 @@ def is_fishing_content(title: str, description: str) -> bool:
     return fishing_score > 0 and fishing_score >= exclude_score
 
 
+def filter_fishing_content(articles: list["Article"]) -> list[bool]:
+    """Batch version of is_fishing_content for many articles at once."""
+    hits = get_engine().scan_many(f"{a.title} {a.description}" for a in articles)
+    return [is_fishing_score(h) for h in hits]
+
+
+class EntryFilter:
+    """Cheap checks on raw feed entries, run before an Article is built.
+
+    Most entries of a daily run were already published. Checking the seen
+    store and a keyword pre-filter first means date parsing, image
+    extraction and HTML parsing (BeautifulSoup for Reddit) only run for
+    entries that can still become new articles. fetch_all_content still
+    applies the full is_fishing_content check to the survivors.
+    """
+
+    def __init__(self, seen: "SeenStore"):
+        self.seen = seen
+        self.already_seen = 0
+        self.prefiltered = 0
+
+    def is_new(self, url: str) -> bool:
+        """True if the entry's URL was not published before."""
+        if url and url in self.seen:
+            self.already_seen += 1
+            return False
+        return True
+
+    def might_be_fishing(self, title: str, raw_text: str) -> bool:
+        """True if the title or raw entry text has any fishing keyword.
+
+        raw_text is the entry's HTML or text before extraction. It is
+        scanned as is (RSS descriptions keep their HTML, so that is what
+        is_fishing_content sees), and also with tags replaced by spaces
+        and with tags and the whitespace around them removed (Reddit
+        descriptions are get_text(strip=True) output, which glues
+        adjacent elements). An entry with no fishing keyword
+        in any of these would be rejected by is_fishing_content anyway.
+        """
+        spaced = _SPACE_RE.sub(" ", html_lib.unescape(_TAG_RE.sub(" ", raw_text)))
+        glued = html_lib.unescape(_TAG_GAP_RE.sub("", raw_text))
+        if get_engine().scan(f"{title} {raw_text} {spaced} {glued}")["fishing"] > 0:
+            return True
+        self.prefiltered += 1
+        return False
+
+    def keep(self, url: str, title: str, raw_text: str) -> bool:
+        """Both checks: new URL and possible fishing content."""
+        return self.is_new(url) and self.might_be_fishing(title, raw_text)
+
+
 @dataclass
 class Article:
     """Raw article data from any source."""
@@ -99,74 +162,205 @@ def load_sources() -> dict:
         return json.load(f)
 
 
-def load_seen_urls() -> set:
-    """Load previously seen URLs for deduplication."""
-    seen_path = Path(__file__).parent.parent / "data" / "seen_urls.json"
-    if seen_path.exists():
-        with open(seen_path) as f:
-            return set(json.load(f))
-    return set()
+def parse_rss_entries(feed, feed_config: dict, entry_filter: Optional[EntryFilter] = None) -> list[Article]:
+    """Build Articles from a parsed RSS/Atom feed.
+
+    Entries rejected by entry_filter (if given) are skipped before any
+    further parsing.
+    """
+    articles = []
+
+    for entry in feed.entries[:10]:  # Limit per feed
+        if entry_filter and not entry_filter.keep(
+            entry.get("link", ""), entry.get("title", ""),
+            entry.get("summary") or entry.get("description", ""),
+        ):
+            continue
+
+        # Parse date
+        published = None
+        if hasattr(entry, "published_parsed") and entry.published_parsed:
+            published = datetime(*entry.published_parsed[:6])
+        elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
+            published = datetime(*entry.updated_parsed[:6])
+        else:
+            published = datetime.now()
+
+        # Extract image from media content or enclosures
+        image_url = None
+        if hasattr(entry, "media_content") and entry.media_content:
+            for media in entry.media_content:
+                if media.get("medium") == "image" or media.get("type", "").startswith("image"):
+                    image_url = media.get("url")
+                    break
+        if not image_url and hasattr(entry, "enclosures"):
+            for enc in entry.enclosures:
+                if enc.get("type", "").startswith("image"):
+                    image_url = enc.get("href") or enc.get("url")
+                    break
+
+        # Get description
+        description = ""
+        if hasattr(entry, "summary"):
+            description = entry.summary
+        elif hasattr(entry, "description"):
+            description = entry.description
+
+        articles.append(Article(
+            title=entry.title,
+            url=entry.link,
+            source_name=feed_config["name"],
+            published=published,
+            description=description,
+            image_url=image_url,
+            author=getattr(entry, "author", None)
+        ))
+
+    return articles
+
+
+FEED_STATE_PATH = Path(__file__).parent.parent / "data" / "feed_state.json"
+
+# Entry identifiers in RSS (<guid>) and Atom (<id>) documents
+_ENTRY_ID_RE = re.compile(rb"<(guid|id)\b[^>]*>\s*(.*?)\s*</\1>", re.DOTALL)
+
+
+def load_feed_state() -> dict:
+    """Load per-feed conditional-GET validators from data/feed_state.json.
+
+    Returns:
+        Dict mapping feed URL to its 'etag', 'last_modified' and
+        'entry_ids' from the previous fetch
+    """
+    if FEED_STATE_PATH.exists():
+        try:
+            with open(FEED_STATE_PATH, encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            pass
+    return {}
+
+
+def save_feed_state(state: dict) -> None:
+    """Persist per-feed validators to disk."""
+    FEED_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(FEED_STATE_PATH, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+
+def conditional_headers(url: str, feed_state: Optional[dict]) -> dict:
+    """Build If-None-Match / If-Modified-Since headers for a feed."""
+    entry = (feed_state or {}).get(url, {})
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def extract_entry_ids(body: bytes) -> list[str]:
+    """Pull entry guids/ids out of a feed body without a full parse."""
+    ids = {m.group(2).decode("utf-8", "replace") for m in _ENTRY_ID_RE.finditer(body)}
+    return sorted(ids)
 
 
-def save_seen_urls(urls: set) -> None:
-    """Save seen URLs to disk."""
-    seen_path = Path(__file__).parent.parent / "data" / "seen_urls.json"
-    # Keep only last 5000 URLs to prevent unbounded growth
-    urls_list = list(urls)[-5000:]
-    with open(seen_path, "w") as f:
-        json.dump(urls_list, f, indent=2)
+def feed_unchanged(url: str, response: httpx.Response, feed_state: Optional[dict]) -> bool:
+    """Check a feed response against the stored validators.
 
+    A 304 response, or a body whose entry IDs match the previous fetch,
+    counts as unchanged and the caller can skip parsing it. When the
+    entry IDs match, the new ETag/Last-Modified are stored so the next
+    request can get a 304; otherwise the stored validators are left
+    alone and record_feed_state is called once the body has been turned
+    into articles.
 
-def fetch_rss_feeds(sources: dict) -> list[Article]:
-    """Fetch articles from configured RSS feeds."""
+    Args:
+        url: Feed URL (state key)
+        response: Response to the conditional request
+        feed_state: Mutable per-feed state dict, or None to disable
+
+    Returns:
+        True if the feed has nothing new since the last fetch
+    """
+    if feed_state is None:
+        return False
+
+    entry = feed_state.setdefault(url, {})
+    entry["checked"] = datetime.now().isoformat(timespec="seconds")
+    if response.status_code == 304:
+        return True
+
+    entry_ids = extract_entry_ids(response.content)
+    if not entry_ids or entry_ids != entry.get("entry_ids"):
+        return False
+    # Same entries, so the new validators are safe to keep
+    entry["etag"] = response.headers.get("etag")
+    entry["last_modified"] = response.headers.get("last-modified")
+    return True
+
+
+def record_feed_state(url: str, response: httpx.Response, feed_state: Optional[dict]) -> None:
+    """Store a feed's validators and entry IDs after it was processed.
+
+    Only called once the entries were parsed into articles, so a failure
+    in between never makes the next run treat the feed as unchanged.
+    """
+    if feed_state is None or response.status_code == 304:
+        return
+    entry = feed_state.setdefault(url, {})
+    entry["etag"] = response.headers.get("etag")
+    entry["last_modified"] = response.headers.get("last-modified")
+    entry["entry_ids"] = extract_entry_ids(response.content)
+
+
+def fetch_feed(client: httpx.Client, url: str, parse, feed_state: Optional[dict] = None) -> list[Article]:
+    """Conditionally fetch a feed and parse its entries.
+
+    Args:
+        client: HTTP client
+        url: Feed URL
+        parse: Callable turning the feedparser result into Articles
+        feed_state: Per-feed validators for conditional requests (optional)
+
+    Returns:
+        Parsed articles, or an empty list if the feed is unchanged
+    """
+    response = client.get(url, headers=conditional_headers(url, feed_state))
+    if response.status_code != 304:
+        response.raise_for_status()
+    if feed_unchanged(url, response, feed_state):
+        return []
+    articles = parse(feedparser.parse(response.content, response_headers=dict(response.headers)))
+    record_feed_state(url, response, feed_state)
+    return articles
+
+
+def fetch_rss_feeds(
+    sources: dict,
+    feed_state: Optional[dict] = None,
+    entry_filter: Optional[EntryFilter] = None,
+) -> list[Article]:
+    """Fetch articles from configured RSS feeds.
+
+    Args:
+        sources: Source configuration
+        feed_state: Per-feed validators for conditional requests (optional)
+        entry_filter: Skips seen/non-fishing entries before parsing them
+    """
     articles = []
+    client = get_client()
 
     for feed_config in sources.get("rss_feeds", []):
         if not feed_config.get("enabled", True):
             continue
 
         try:
-            feed = feedparser.parse(feed_config["url"])
-
-            for entry in feed.entries[:10]:  # Limit per feed
-                # Parse date
-                published = None
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    published = datetime(*entry.published_parsed[:6])
-                elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                    published = datetime(*entry.updated_parsed[:6])
-                else:
-                    published = datetime.now()
-
-                # Extract image from media content or enclosures
-                image_url = None
-                if hasattr(entry, "media_content") and entry.media_content:
-                    for media in entry.media_content:
-                        if media.get("medium") == "image" or media.get("type", "").startswith("image"):
-                            image_url = media.get("url")
-                            break
-                if not image_url and hasattr(entry, "enclosures"):
-                    for enc in entry.enclosures:
-                        if enc.get("type", "").startswith("image"):
-                            image_url = enc.get("href") or enc.get("url")
-                            break
-
-                # Get description
-                description = ""
-                if hasattr(entry, "summary"):
-                    description = entry.summary
-                elif hasattr(entry, "description"):
-                    description = entry.description
-
-                articles.append(Article(
-                    title=entry.title,
-                    url=entry.link,
-                    source_name=feed_config["name"],
-                    published=published,
-                    description=description,
-                    image_url=image_url,
-                    author=getattr(entry, "author", None)
-                ))
+            articles.extend(fetch_feed(
+                client, feed_config["url"],
+                lambda feed: parse_rss_entries(feed, feed_config, entry_filter),
+                feed_state,
+            ))
 
         except Exception as e:
             print(f"Error fetching {feed_config['name']}: {e}")
@@ -175,7 +369,50 @@ def fetch_rss_feeds(sources: dict) -> list[Article]:
     return articles
 
 
-def fetch_newsapi(sources: dict) -> list[Article]:
+def newsapi_params(newsapi_config: dict, api_key: str) -> dict:
+    """Build NewsAPI query parameters from the source config."""
+    return {
+        "q": newsapi_config.get("query", "fishing"),
+        "language": newsapi_config.get("language", "en"),
+        "sortBy": newsapi_config.get("sort_by", "publishedAt"),
+        "pageSize": newsapi_config.get("page_size", 20),
+        "apiKey": api_key
+    }
+
+
+def parse_newsapi_articles(data: dict, entry_filter: Optional[EntryFilter] = None) -> list[Article]:
+    """Build Articles from a NewsAPI JSON response, skipping items
+    rejected by entry_filter (if given)."""
+    articles = []
+
+    for item in data.get("articles", []):
+        if entry_filter and not entry_filter.keep(
+            item.get("url") or "", item.get("title") or "", item.get("description") or ""
+        ):
+            continue
+
+        published = datetime.now()
+        if item.get("publishedAt"):
+            try:
+                published = date_parser.parse(item["publishedAt"])
+                published = published.replace(tzinfo=None)
+            except:
+                pass
+
+        articles.append(Article(
+            title=item.get("title", ""),
+            url=item.get("url", ""),
+            source_name=item.get("source", {}).get("name", "News"),
+            published=published,
+            description=item.get("description", ""),
+            image_url=item.get("urlToImage"),
+            author=item.get("author")
+        ))
+
+    return articles
+
+
+def fetch_newsapi(sources: dict, entry_filter: Optional[EntryFilter] = None) -> list[Article]:
     """Fetch articles from NewsAPI."""
     newsapi_config = sources.get("newsapi", {})
     if not newsapi_config.get("enabled", False):
@@ -189,38 +426,12 @@ def fetch_newsapi(sources: dict) -> list[Article]:
     articles = []
 
     try:
-        with httpx.Client(timeout=30) as client:
-            response = client.get(
-                "https://newsapi.org/v2/everything",
-                params={
-                    "q": newsapi_config.get("query", "fishing"),
-                    "language": newsapi_config.get("language", "en"),
-                    "sortBy": newsapi_config.get("sort_by", "publishedAt"),
-                    "pageSize": newsapi_config.get("page_size", 20),
-                    "apiKey": api_key
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            for item in data.get("articles", []):
-                published = datetime.now()
-                if item.get("publishedAt"):
-                    try:
-                        published = date_parser.parse(item["publishedAt"])
-                        published = published.replace(tzinfo=None)
-                    except:
-                        pass
-
-                articles.append(Article(
-                    title=item.get("title", ""),
-                    url=item.get("url", ""),
-                    source_name=item.get("source", {}).get("name", "News"),
-                    published=published,
-                    description=item.get("description", ""),
-                    image_url=item.get("urlToImage"),
-                    author=item.get("author")
-                ))
+        response = get_client().get(
+            "https://newsapi.org/v2/everything",
+            params=newsapi_params(newsapi_config, api_key)
+        )
+        response.raise_for_status()
+        articles = parse_newsapi_articles(response.json(), entry_filter)
 
     except Exception as e:
         print(f"Error fetching NewsAPI: {e}")
@@ -228,59 +439,90 @@ def fetch_newsapi(sources: dict) -> list[Article]:
     return articles
 
 
-def fetch_reddit(sources: dict) -> list[Article]:
+def reddit_feed_url(subreddit: str, reddit_config: dict) -> str:
+    """Build the RSS URL for a subreddit listing."""
+    sort = reddit_config.get("sort", "hot")
+    limit = reddit_config.get("limit", 10)
+    return f"https://www.reddit.com/r/{subreddit}/{sort}.rss?limit={limit}"
+
+
+def parse_reddit_entries(feed, subreddit: str, entry_filter: Optional[EntryFilter] = None) -> list[Article]:
+    """Build Articles from a parsed subreddit RSS feed.
+
+    Posts rejected by entry_filter (if given) are skipped before their
+    HTML is parsed.
+    """
+    articles = []
+
+    for entry in feed.entries:
+        # Skip stickied/mod posts
+        if entry.title.startswith("[MOD POST"):
+            continue
+
+        html = entry.content[0].value if hasattr(entry, "content") else ""
+        if entry_filter and not entry_filter.keep(entry.get("link", ""), entry.title, html):
+            continue
+
+        # Parse published date
+        published = datetime.now()
+        if hasattr(entry, "published_parsed") and entry.published_parsed:
+            published = datetime(*entry.published_parsed[:6])
+
+        # Extract image URL from HTML content
+        image_url = None
+        if html:
+            soup = BeautifulSoup(html, "html.parser")
+            img = soup.select_one("img")
+            if img and img.get("src"):
+                image_url = img["src"]
+
+            # Extract text description from self-posts
+            md_div = soup.select_one("div.md")
+            description = md_div.get_text(strip=True)[:500] if md_div else ""
+        else:
+            description = ""
+
+        articles.append(Article(
+            title=entry.title,
+            url=entry.link,
+            source_name=f"Reddit r/{subreddit}",
+            published=published,
+            description=description,
+            image_url=image_url,
+            author=getattr(entry, "author", "").replace("/u/", "") or None,
+        ))
+
+    return articles
+
+
+def fetch_reddit(
+    sources: dict,
+    feed_state: Optional[dict] = None,
+    entry_filter: Optional[EntryFilter] = None,
+) -> list[Article]:
     """Fetch posts from Reddit via RSS feeds.
 
     Uses RSS since Reddit's JSON API now blocks unauthenticated requests.
+
+    Args:
+        sources: Source configuration
+        feed_state: Per-feed validators for conditional requests (optional)
+        entry_filter: Skips seen/non-fishing posts before parsing their HTML
     """
     reddit_config = sources.get("reddit", {})
     if not reddit_config.get("enabled", False):
         return []
 
     articles = []
-    sort = reddit_config.get("sort", "hot")
-    limit = reddit_config.get("limit", 10)
+    client = get_client()
 
     for subreddit in reddit_config.get("subreddits", []):
         try:
-            feed = feedparser.parse(
-                f"https://www.reddit.com/r/{subreddit}/{sort}.rss?limit={limit}"
-            )
-
-            for entry in feed.entries:
-                # Skip stickied/mod posts
-                if entry.title.startswith("[MOD POST"):
-                    continue
-
-                # Parse published date
-                published = datetime.now()
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    published = datetime(*entry.published_parsed[:6])
-
-                # Extract image URL from HTML content
-                image_url = None
-                html = entry.content[0].value if hasattr(entry, "content") else ""
-                if html:
-                    soup = BeautifulSoup(html, "html.parser")
-                    img = soup.select_one("img")
-                    if img and img.get("src"):
-                        image_url = img["src"]
-
-                    # Extract text description from self-posts
-                    md_div = soup.select_one("div.md")
-                    description = md_div.get_text(strip=True)[:500] if md_div else ""
-                else:
-                    description = ""
-
-                articles.append(Article(
-                    title=entry.title,
-                    url=entry.link,
-                    source_name=f"Reddit r/{subreddit}",
-                    published=published,
-                    description=description,
-                    image_url=image_url,
-                    author=getattr(entry, "author", "").replace("/u/", "") or None,
-                ))
+            articles.extend(fetch_feed(
+                client, reddit_feed_url(subreddit, reddit_config),
+                lambda feed: parse_reddit_entries(feed, subreddit, entry_filter),
+                feed_state,
+            ))
 
         except Exception as e:
             print(f"Error fetching r/{subreddit}: {e}")
@@ -289,37 +531,183 @@ def fetch_reddit(sources: dict) -> list[Article]:
     return articles
 
 
-def fetch_all_content() -> list[Article]:
-    """Fetch content from all configured sources, deduplicated and filtered."""
+async def _fetch_source(
+    client: httpx.AsyncClient,
+    name: str,
+    url: str,
+    parse,
+    params: Optional[dict] = None,
+    timeout: float = SOURCE_TIMEOUT,
+    feed_state: Optional[dict] = None,
+) -> list[Article]:
+    """Fetch one source within its timeout, then parse it.
+
+    The client's transport caps concurrent requests per host and retries
+    transient failures; the timeout covers the retries too.
+
+    Args:
+        client: Shared async HTTP client
+        name: Source name for error messages
+        url: URL to fetch
+        parse: Callable turning the httpx.Response into a list of Articles
+        params: Optional query parameters
+        timeout: Overall seconds allowed for this source
+        feed_state: Per-feed validators; enables conditional requests
+
+    Returns:
+        Parsed articles, or an empty list on any error or unchanged feed
+    """
+    try:
+        headers = conditional_headers(url, feed_state)
+        response = await asyncio.wait_for(
+            client.get(url, params=params, headers=headers), timeout
+        )
+        if response.status_code != 304:
+            response.raise_for_status()
+        if feed_unchanged(url, response, feed_state):
+            return []
+        articles = parse(response)
+        record_feed_state(url, response, feed_state)
+        return articles
+    except asyncio.TimeoutError:
+        print(f"Timed out fetching {name} after {timeout}s")
+    except Exception as e:
+        print(f"Error fetching {name}: {e}")
+    return []
+
+
+async def fetch_all_sources_async(
+    sources: dict,
+    max_per_host: int = MAX_CONCURRENT_PER_HOST,
+    timeout: float = SOURCE_TIMEOUT,
+    feed_state: Optional[dict] = None,
+    entry_filter: Optional[EntryFilter] = None,
+) -> list[Article]:
+    """Fetch RSS feeds, NewsAPI and Reddit concurrently.
+
+    All requests share one pooled async client from pipeline.transport. Feed bodies are parsed with
+    feedparser from the downloaded bytes, so a slow feed only delays its
+    own results. Articles are returned in the same order as the serial
+    fetchers (RSS, NewsAPI, Reddit).
+
+    Args:
+        sources: Source configuration from data/sources.json
+        max_per_host: Maximum concurrent requests to a single host
+        timeout: Seconds allowed per source
+        feed_state: Per-feed validators for conditional requests (optional)
+        entry_filter: Skips seen/non-fishing entries before parsing them
+
+    Returns:
+        List of Article objects from all sources
+    """
+    tasks = []
+
+    async with async_client(max_per_host) as client:
+        for feed_config in sources.get("rss_feeds", []):
+            if not feed_config.get("enabled", True):
+                continue
+            tasks.append(_fetch_source(
+                client, feed_config["name"], feed_config["url"],
+                lambda r, fc=feed_config: parse_rss_entries(
+                    feedparser.parse(r.content, response_headers=dict(r.headers)), fc, entry_filter
+                ),
+                timeout=timeout,
+                feed_state=feed_state,
+            ))
+
+        newsapi_config = sources.get("newsapi", {})
+        if newsapi_config.get("enabled", False):
+            api_key = os.environ.get("NEWS_API_KEY")
+            if api_key:
+                tasks.append(_fetch_source(
+                    client, "NewsAPI", "https://newsapi.org/v2/everything",
+                    lambda r: parse_newsapi_articles(r.json(), entry_filter),
+                    params=newsapi_params(newsapi_config, api_key),
+                    timeout=timeout,
+                ))
+            else:
+                print("NEWS_API_KEY not set, skipping NewsAPI")
+
+        reddit_config = sources.get("reddit", {})
+        if reddit_config.get("enabled", False):
+            for subreddit in reddit_config.get("subreddits", []):
+                tasks.append(_fetch_source(
+                    client, f"r/{subreddit}",
+                    reddit_feed_url(subreddit, reddit_config),
+                    lambda r, sub=subreddit: parse_reddit_entries(
+                        feedparser.parse(r.content, response_headers=dict(r.headers)), sub, entry_filter
+                    ),
+                    timeout=timeout,
+                    feed_state=feed_state,
+                ))
+
+        results = await asyncio.gather(*tasks)
+
+    return [article for batch in results for article in batch]
+
+
+def fetch_all_content(concurrent: bool = True) -> list[Article]:
+    """Fetch content from all configured sources, deduplicated and filtered.
+
+    Args:
+        concurrent: Fetch every source at once with asyncio instead of
+            one after another
+    """
     sources = load_sources()
-    seen_urls = load_seen_urls()
+    feed_state = load_feed_state()
 
     all_articles = []
 
-    # Fetch from all sources
-    all_articles.extend(fetch_rss_feeds(sources))
-    all_articles.extend(fetch_newsapi(sources))
-    all_articles.extend(fetch_reddit(sources))
-
-    # Deduplicate and filter to fishing content only
+    # Deduplicate (exact URL, then near-duplicate content) and filter to
+    # fishing content only. Seen and clearly non-fishing entries are
+    # dropped while parsing, before any enrichment
     new_articles = []
     filtered_count = 0
-    for article in all_articles:
-        if article.url and article.url not in seen_urls:
-            # Filter to fishing content only
-            if is_fishing_content(article.title, article.description):
-                new_articles.append(article)
+    duplicate_count = 0
+    with SeenStore() as seen_urls:
+        entry_filter = EntryFilter(seen_urls)
+
+        # Fetch from all sources
+        if concurrent:
+            all_articles.extend(asyncio.run(fetch_all_sources_async(
+                sources, feed_state=feed_state, entry_filter=entry_filter
+            )))
+        else:
+            all_articles.extend(fetch_rss_feeds(sources, feed_state, entry_filter))
+            all_articles.extend(fetch_newsapi(sources, entry_filter))
+            all_articles.extend(fetch_reddit(sources, feed_state, entry_filter))
+
+        for article in all_articles:
+            if article.url and article.url not in seen_urls:
+                # Filter to fishing content only
+                if not is_fishing_content(article.title, article.description):
+                    filtered_count += 1
+                    continue
+
+                # Collapse copies of a story already published under another URL
                 seen_urls.add(article.url)
-            else:
-                filtered_count += 1
+                fingerprint = article_fingerprint(article.title, article.description)
+                if fingerprint is not None:
+                    canonical = seen_urls.find_near_duplicate(fingerprint)
+                    if canonical:
+                        print(f"  [dedup] '{article.title[:50]}' duplicates {canonical}")
+                        duplicate_count += 1
+                        continue
+                    seen_urls.add_fingerprint(article.url, fingerprint)
+
+                new_articles.append(article)
 
-    # Save updated seen URLs
-    save_seen_urls(seen_urls)
+        # Age out old URLs, then save feed validators alongside the store
+        seen_urls.prune()
+    save_feed_state(feed_state)
 
     # Sort by publish date (newest first)
     new_articles.sort(key=lambda a: a.published, reverse=True)
 
-    print(f"Fetched {len(new_articles)} fishing articles ({filtered_count} non-fishing filtered out, from {len(all_articles)} total)")
+    total = len(all_articles) + entry_filter.already_seen + entry_filter.prefiltered
+    print(f"Fetched {len(new_articles)} fishing articles ({entry_filter.already_seen} already seen, "
+          f"{filtered_count + entry_filter.prefiltered} non-fishing filtered out, "
+          f"{duplicate_count} near-duplicates collapsed, from {total} total)")
 
     return new_articles
 
@@ -1,17 +1,24 @@
 """Fetch fishing reports from Orvis fishing reports site."""
 
+import hashlib
 import json
+import math
 import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
 import httpx
 from bs4 import BeautifulSoup
 
+from .ratelimit import TokenBucket
+from .transport import get_client, new_client
+
 
 @dataclass
 class FishingReport:
@@ -45,12 +52,72 @@ REGIONS = {
              "oregon", "utah", "washington", "wyoming"],
 }
 
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-}
+REPORTS_PATH = Path(__file__).parent.parent / "static" / "data" / "fishing-reports.json"
+
+# Per-tile shards and their manifest, for the Local Waters widget
+TILES_DIR = REPORTS_PATH.parent / "fishing-reports"
+
+# Grid cell size in degrees of latitude and longitude. The widget loads
+# the few cells nearest the user, so its download depends on report
+# density, not on how many rivers are crawled overall
+TILE_DEGREES = 2
+
+# Per-state river lists and per-river validators from earlier crawls
+CRAWL_STATE_PATH = Path(__file__).parent.parent / "data" / "fishing_report_state.json"
 
+# River lists almost never change; reports are updated about weekly, so a
+# river page fetched within RIVER_TTL is not requested again
+RIVER_LIST_TTL = timedelta(days=7)
+RIVER_TTL = timedelta(hours=6)
 
-def fetch_state_rivers(region: str, state: str) -> list[dict]:
+# Crawl politeness budget per host: requests per second, with no bursts
+# (one request every 0.5s, as the serial crawl's sleeps allowed at most),
+# and requests in flight
+REQUESTS_PER_SECOND = 2
+CRAWL_WORKERS = 4
+
+
+class PoliteCrawler:
+    """Rate-limited GETs for crawling a site from several threads.
+
+    Every host gets its own token bucket holding a single token, so
+    requests to it start at most `rate` times per second however many
+    workers are waiting; the workers only overlap network latency. The
+    crawler sends through its own client that takes a token before every
+    attempt, so transport retries and redirects stay within the budget.
+
+    Usage:
+        crawler = PoliteCrawler()
+        response = crawler.get(url)
+    """
+
+    def __init__(self, rate: float = REQUESTS_PER_SECOND, workers: int = CRAWL_WORKERS):
+        self.rate = rate
+        self.workers = workers
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._client = new_client(before_attempt=self._take_token)
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, per=1, capacity=1)
+            return self._buckets[host]
+
+    def _take_token(self, request: httpx.Request) -> None:
+        self._bucket(str(request.url)).acquire()
+
+    def get(self, url: str, headers: Optional[dict] = None) -> httpx.Response:
+        """GET url, each attempt waiting until its host's budget allows."""
+        return self._client.get(url, headers=headers)
+
+
+def _get(url: str, crawler: Optional[PoliteCrawler], headers: Optional[dict] = None) -> httpx.Response:
+    return crawler.get(url, headers) if crawler else get_client().get(url, headers=headers)
+
+
+def fetch_state_rivers(region: str, state: str, crawler: Optional[PoliteCrawler] = None) -> list[dict]:
     """Fetch list of rivers from a state page.
 
     Returns list of dicts with name, url, lat, lon for each river.
@@ -59,59 +126,58 @@ def fetch_state_rivers(region: str, state: str) -> list[dict]:
     url = f"{BASE_URL}/{region}/{state}"
 
     try:
-        with httpx.Client(timeout=30, headers=HEADERS, follow_redirects=True) as client:
-            response = client.get(url)
-            if response.status_code != 200:
-                return []
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Look for JavaScript data containing river info
-            scripts = soup.find_all("script")
-            for script in scripts:
-                if script.string and "dataProvider" in script.string:
-                    # Extract the dataProvider array
-                    match = re.search(r'dataProvider:\s*\[(.*?)\]', script.string, re.DOTALL)
-                    if match:
-                        # Parse each river object
-                        data_str = match.group(1)
-                        # Find all objects in the array
-                        objects = re.findall(r'\{[^}]+\}', data_str)
-                        for obj_str in objects:
-                            try:
-                                # Extract fields using regex
-                                name_match = re.search(r'location_name:\s*["\']([^"\']+)["\']', obj_str)
-                                lat_match = re.search(r'latitude:\s*([-\d.]+)', obj_str)
-                                lon_match = re.search(r'longitude:\s*([-\d.]+)', obj_str)
-                                alias_match = re.search(r'alias:\s*["\']([^"\']+)["\']', obj_str)
-
-                                if name_match and lat_match and lon_match and alias_match:
-                                    rivers.append({
-                                        "name": name_match.group(1),
-                                        "lat": float(lat_match.group(1)),
-                                        "lon": float(lon_match.group(1)),
-                                        "alias": alias_match.group(1),
-                                        "url": f"{BASE_URL}/{region}/{state}/{alias_match.group(1)}"
-                                    })
-                            except (ValueError, AttributeError):
-                                continue
-
-            # Fallback: parse links if no JS data found
-            if not rivers:
-                links = soup.select('a[href*="/' + state + '/"]')
-                for link in links:
-                    href = link.get("href", "")
-                    if href.count("/") >= 3 and not href.endswith(state):
-                        name = link.get_text(strip=True)
-                        if name and len(name) > 2:
-                            full_url = urljoin(BASE_URL, href)
-                            rivers.append({
-                                "name": name,
-                                "url": full_url,
-                                "lat": 0,
-                                "lon": 0,
-                                "alias": href.split("/")[-1]
-                            })
+        response = _get(url, crawler)
+        if response.status_code != 200:
+            return []
+
+        soup = BeautifulSoup(response.text, "html.parser")
+
+        # Look for JavaScript data containing river info
+        scripts = soup.find_all("script")
+        for script in scripts:
+            if script.string and "dataProvider" in script.string:
+                # Extract the dataProvider array
+                match = re.search(r'dataProvider:\s*\[(.*?)\]', script.string, re.DOTALL)
+                if match:
+                    # Parse each river object
+                    data_str = match.group(1)
+                    # Find all objects in the array
+                    objects = re.findall(r'\{[^}]+\}', data_str)
+                    for obj_str in objects:
+                        try:
+                            # Extract fields using regex
+                            name_match = re.search(r'location_name:\s*["\']([^"\']+)["\']', obj_str)
+                            lat_match = re.search(r'latitude:\s*([-\d.]+)', obj_str)
+                            lon_match = re.search(r'longitude:\s*([-\d.]+)', obj_str)
+                            alias_match = re.search(r'alias:\s*["\']([^"\']+)["\']', obj_str)
+
+                            if name_match and lat_match and lon_match and alias_match:
+                                rivers.append({
+                                    "name": name_match.group(1),
+                                    "lat": float(lat_match.group(1)),
+                                    "lon": float(lon_match.group(1)),
+                                    "alias": alias_match.group(1),
+                                    "url": f"{BASE_URL}/{region}/{state}/{alias_match.group(1)}"
+                                })
+                        except (ValueError, AttributeError):
+                            continue
+
+        # Fallback: parse links if no JS data found
+        if not rivers:
+            links = soup.select('a[href*="/' + state + '/"]')
+            for link in links:
+                href = link.get("href", "")
+                if href.count("/") >= 3 and not href.endswith(state):
+                    name = link.get_text(strip=True)
+                    if name and len(name) > 2:
+                        full_url = urljoin(BASE_URL, href)
+                        rivers.append({
+                            "name": name,
+                            "url": full_url,
+                            "lat": 0,
+                            "lon": 0,
+                            "alias": href.split("/")[-1]
+                        })
 
     except Exception as e:
         print(f"    Error fetching {state}: {e}")
@@ -119,131 +185,327 @@ def fetch_state_rivers(region: str, state: str) -> list[dict]:
     return rivers
 
 
-def fetch_river_report(river: dict, region: str, state: str) -> Optional[FishingReport]:
+def parse_river_report(html: str, river: dict, region: str, state: str) -> Optional[FishingReport]:
+    """Extract a river's report from its page; None if it has no coordinates."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Extract report details
+    water_temp = None
+    conditions = None
+    updated = None
+    source = None
+    flies = None
+    rating = None
+    lat = river.get("lat", 0)
+    lon = river.get("lon", 0)
+
+    # Try to get coordinates from page if not in river data
+    if lat == 0 or lon == 0:
+        scripts = soup.find_all("script")
+        for script in scripts:
+            if script.string:
+                lat_match = re.search(r'latitude["\']?\s*[:=]\s*([-\d.]+)', script.string)
+                lon_match = re.search(r'longitude["\']?\s*[:=]\s*([-\d.]+)', script.string)
+                if lat_match and lon_match:
+                    lat = float(lat_match.group(1))
+                    lon = float(lon_match.group(1))
+                    break
+
+    # Water temperature
+    temp_el = soup.find(string=re.compile(r'Water Temperature', re.I))
+    if temp_el:
+        parent = temp_el.find_parent()
+        if parent:
+            temp_match = re.search(r'(\d+)\s*°?\s*F', parent.get_text())
+            if temp_match:
+                water_temp = f"{temp_match.group(1)}°F"
+
+    # Last updated
+    updated_el = soup.find(string=re.compile(r'Last Updated|Updated', re.I))
+    if updated_el:
+        parent = updated_el.find_parent()
+        if parent:
+            # Look for date pattern
+            date_match = re.search(r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})', parent.get_text())
+            if date_match:
+                updated = date_match.group(1)
+
+    # Report source (guide shop)
+    source_el = soup.find(string=re.compile(r'Report Source|Submitted by', re.I))
+    if source_el:
+        parent = source_el.find_parent()
+        if parent:
+            source_text = parent.get_text()
+            # Extract the source name after the label
+            source_match = re.search(r'(?:Report Source|Submitted by)[:\s]+([^,\n]+)', source_text, re.I)
+            if source_match:
+                source = source_match.group(1).strip()
+
+    # Conditions - look for main report text
+    conditions_section = soup.select_one("#CurrentConditions, .current-conditions, .report-content")
+    if conditions_section:
+        paragraphs = conditions_section.find_all("p")
+        if paragraphs:
+            conditions = " ".join(p.get_text(strip=True) for p in paragraphs[:2])
+            if len(conditions) > 200:
+                conditions = conditions[:197] + "..."
+
+    # Recommended flies
+    flies_section = soup.find(string=re.compile(r'Recommended Flies|Hot Flies|Fly Patterns', re.I))
+    if flies_section:
+        parent = flies_section.find_parent()
+        if parent:
+            # Get sibling or child content
+            next_el = parent.find_next_sibling()
+            if next_el:
+                flies = next_el.get_text(strip=True)[:100]
+
+    # Rating from map legend classes or explicit rating
+    rating_el = soup.select_one(".rating, .conditions-rating, [class*='hot-spot'], [class*='excellent']")
+    if rating_el:
+        rating_class = " ".join(rating_el.get("class", []))
+        if "hot" in rating_class.lower():
+            rating = "Hot Spot"
+        elif "excellent" in rating_class.lower():
+            rating = "Excellent"
+        elif "good" in rating_class.lower():
+            rating = "Good"
+
+    # Skip if we couldn't get coordinates
+    if lat == 0 and lon == 0:
+        return None
+
+    return FishingReport(
+        name=river["name"],
+        url=river["url"],
+        state=state.replace("-", " ").title(),
+        region=region.title(),
+        lat=lat,
+        lon=lon,
+        water_temp=water_temp,
+        conditions=conditions,
+        updated=updated,
+        source=source,
+        flies=flies,
+        rating=rating
+    )
+
+
+def fetch_river_report(
+    river: dict, region: str, state: str, crawler: Optional[PoliteCrawler] = None
+) -> Optional[FishingReport]:
     """Fetch detailed report for a single river."""
     try:
-        with httpx.Client(timeout=30, headers=HEADERS, follow_redirects=True) as client:
-            response = client.get(river["url"])
-            if response.status_code != 200:
-                return None
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Extract report details
-            water_temp = None
-            conditions = None
-            updated = None
-            source = None
-            flies = None
-            rating = None
-            lat = river.get("lat", 0)
-            lon = river.get("lon", 0)
-
-            # Try to get coordinates from page if not in river data
-            if lat == 0 or lon == 0:
-                scripts = soup.find_all("script")
-                for script in scripts:
-                    if script.string:
-                        lat_match = re.search(r'latitude["\']?\s*[:=]\s*([-\d.]+)', script.string)
-                        lon_match = re.search(r'longitude["\']?\s*[:=]\s*([-\d.]+)', script.string)
-                        if lat_match and lon_match:
-                            lat = float(lat_match.group(1))
-                            lon = float(lon_match.group(1))
-                            break
-
-            # Water temperature
-            temp_el = soup.find(string=re.compile(r'Water Temperature', re.I))
-            if temp_el:
-                parent = temp_el.find_parent()
-                if parent:
-                    temp_match = re.search(r'(\d+)\s*°?\s*F', parent.get_text())
-                    if temp_match:
-                        water_temp = f"{temp_match.group(1)}°F"
-
-            # Last updated
-            updated_el = soup.find(string=re.compile(r'Last Updated|Updated', re.I))
-            if updated_el:
-                parent = updated_el.find_parent()
-                if parent:
-                    # Look for date pattern
-                    date_match = re.search(r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})', parent.get_text())
-                    if date_match:
-                        updated = date_match.group(1)
-
-            # Report source (guide shop)
-            source_el = soup.find(string=re.compile(r'Report Source|Submitted by', re.I))
-            if source_el:
-                parent = source_el.find_parent()
-                if parent:
-                    source_text = parent.get_text()
-                    # Extract the source name after the label
-                    source_match = re.search(r'(?:Report Source|Submitted by)[:\s]+([^,\n]+)', source_text, re.I)
-                    if source_match:
-                        source = source_match.group(1).strip()
-
-            # Conditions - look for main report text
-            conditions_section = soup.select_one("#CurrentConditions, .current-conditions, .report-content")
-            if conditions_section:
-                paragraphs = conditions_section.find_all("p")
-                if paragraphs:
-                    conditions = " ".join(p.get_text(strip=True) for p in paragraphs[:2])
-                    if len(conditions) > 200:
-                        conditions = conditions[:197] + "..."
-
-            # Recommended flies
-            flies_section = soup.find(string=re.compile(r'Recommended Flies|Hot Flies|Fly Patterns', re.I))
-            if flies_section:
-                parent = flies_section.find_parent()
-                if parent:
-                    # Get sibling or child content
-                    next_el = parent.find_next_sibling()
-                    if next_el:
-                        flies = next_el.get_text(strip=True)[:100]
-
-            # Rating from map legend classes or explicit rating
-            rating_el = soup.select_one(".rating, .conditions-rating, [class*='hot-spot'], [class*='excellent']")
-            if rating_el:
-                rating_class = " ".join(rating_el.get("class", []))
-                if "hot" in rating_class.lower():
-                    rating = "Hot Spot"
-                elif "excellent" in rating_class.lower():
-                    rating = "Excellent"
-                elif "good" in rating_class.lower():
-                    rating = "Good"
-
-            # Skip if we couldn't get coordinates
-            if lat == 0 and lon == 0:
-                return None
-
-            return FishingReport(
-                name=river["name"],
-                url=river["url"],
-                state=state.replace("-", " ").title(),
-                region=region.title(),
-                lat=lat,
-                lon=lon,
-                water_temp=water_temp,
-                conditions=conditions,
-                updated=updated,
-                source=source,
-                flies=flies,
-                rating=rating
-            )
+        response = _get(river["url"], crawler)
+        if response.status_code != 200:
+            return None
+        return parse_river_report(response.text, river, region, state)
 
     except Exception as e:
         print(f"      Error fetching {river['name']}: {e}")
         return None
 
 
-def fetch_all_reports(max_per_state: int = 20) -> list[FishingReport]:
+def empty_crawl_state() -> dict:
+    """Crawl state with nothing fetched yet."""
+    return {"states": {}, "rivers": {}}
+
+
+def load_crawl_state() -> dict:
+    """Load crawl state from data/fishing_report_state.json.
+
+    Returns:
+        Dict with 'states' (region/state -> 'fetched' time and 'rivers'
+        list) and 'rivers' (river URL -> 'updated', 'hash', 'etag',
+        'last_modified' and 'fetched' from its last fetch)
+    """
+    state = empty_crawl_state()
+    if CRAWL_STATE_PATH.exists():
+        try:
+            with open(CRAWL_STATE_PATH, encoding="utf-8") as f:
+                state.update(json.load(f))
+        except (json.JSONDecodeError, OSError):
+            pass
+    return state
+
+
+def save_crawl_state(state: dict) -> None:
+    """Persist crawl state to disk."""
+    CRAWL_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(CRAWL_STATE_PATH, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+
+def is_fresh(entry: Optional[dict], ttl: timedelta) -> bool:
+    """Whether a crawl state entry was fetched less than ttl ago."""
+    if not entry or not entry.get("fetched"):
+        return False
+    return datetime.now() - datetime.fromisoformat(entry["fetched"]) < ttl
+
+
+def refresh_state_rivers(
+    region: str, state: str, crawl_state: dict, crawler: Optional[PoliteCrawler] = None
+) -> list[dict]:
+    """Fetch a state's river list and cache it in the crawl state.
+
+    If the page fails or lists nothing, the cached list (if any) is kept
+    and is tried again next run.
+    """
+    key = f"{region}/{state}"
+    rivers = fetch_state_rivers(region, state, crawler)
+    if rivers:
+        crawl_state["states"][key] = {
+            "fetched": datetime.now().isoformat(timespec="seconds"),
+            "rivers": rivers,
+        }
+        return rivers
+    return crawl_state["states"].get(key, {}).get("rivers", [])
+
+
+def refresh_river_report(
+    river: dict,
+    region: str,
+    state: str,
+    crawl_state: dict,
+    previous: Optional[FishingReport] = None,
+    crawler: Optional[PoliteCrawler] = None,
+) -> Optional[FishingReport]:
+    """Re-fetch a river page, parsing it only if it changed.
+
+    The request is conditional on the stored ETag/Last-Modified; a 304,
+    or a body hashing the same as last time, keeps the previous report.
+    On errors the previous report is kept and the river stays stale.
+
+    Args:
+        river: River dict from the state's river list
+        region: Region slug
+        state: State slug
+        crawl_state: Mutable crawl state, updated with this fetch
+        previous: The river's report from the last run, if any
+        crawler: Rate limiter (optional)
+
+    Returns:
+        The river's current report, or None if it has none
+    """
+    entry = dict(crawl_state["rivers"].get(river["url"], {}))
+    headers = {}
+    if previous is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        response = _get(river["url"], crawler, headers)
+        if response.status_code == 304:
+            report = previous
+        elif response.status_code != 200:
+            return previous
+        else:
+            digest = hashlib.sha256(response.content).hexdigest()
+            if previous is not None and digest == entry.get("hash"):
+                report = previous
+            else:
+                report = parse_river_report(response.text, river, region, state)
+            entry.update(
+                hash=digest,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+            )
+    except Exception as e:
+        print(f"      Error fetching {river['name']}: {e}")
+        return previous
+
+    entry["updated"] = report.updated if report else None
+    entry["fetched"] = datetime.now().isoformat(timespec="seconds")
+    crawl_state["rivers"][river["url"]] = entry
+    return report
+
+
+def crawl_all_reports(
+    max_per_state: int = 20,
+    crawler: Optional[PoliteCrawler] = None,
+    crawl_state: Optional[dict] = None,
+    previous: Optional[dict[str, FishingReport]] = None,
+) -> list[FishingReport]:
+    """Fetch stale state and river pages concurrently within the crawl budget.
+
+    State pages are queued first and each state's stale rivers as soon as
+    its list is known, so the crawl takes about (requests / rate) seconds
+    instead of sleeps plus sequential latency. Fresh river lists and
+    reports are taken from crawl_state and previous. Reports come back in
+    the same order as the serial crawl.
+
+    Args:
+        max_per_state: Maximum rivers to fetch per state
+        crawler: Rate limiter and worker count (default PoliteCrawler())
+        crawl_state: Crawl state from load_crawl_state(), updated in place
+            (default: empty, so everything is fetched)
+        previous: Reports from the last run by river URL
+
+    Returns:
+        List of FishingReport objects
+    """
+    crawler = crawler or PoliteCrawler()
+    crawl_state = crawl_state if crawl_state is not None else empty_crawl_state()
+    previous = previous or {}
+    river_results = []  # FishingReport/None, or a Future for a refetch
+
+    with ThreadPoolExecutor(crawler.workers, thread_name_prefix="reports") as pool:
+        state_lists = []
+        for region, states in REGIONS.items():
+            for state in states:
+                cached = crawl_state["states"].get(f"{region}/{state}")
+                if is_fresh(cached, RIVER_LIST_TTL):
+                    state_lists.append((region, state, cached["rivers"], True))
+                else:
+                    future = pool.submit(refresh_state_rivers, region, state, crawl_state, crawler)
+                    state_lists.append((region, state, future, False))
+
+        for region, state, rivers, cached in state_lists:
+            rivers = rivers if cached else rivers.result()
+            note = " (cached list)" if cached else ""
+            print(f"    State: {state.replace('-', ' ').title()}... found {len(rivers)} rivers{note}")
+            for river in rivers[:max_per_state]:
+                if is_fresh(crawl_state["rivers"].get(river["url"]), RIVER_TTL):
+                    river_results.append(previous.get(river["url"]))
+                else:
+                    river_results.append(pool.submit(
+                        refresh_river_report, river, region, state, crawl_state,
+                        previous.get(river["url"]), crawler,
+                    ))
+
+    refetched = sum(isinstance(result, Future) for result in river_results)
+    print(f"  Re-fetched {refetched} of {len(river_results)} river pages")
+    reports = [result.result() if isinstance(result, Future) else result for result in river_results]
+    return [report for report in reports if report]
+
+
+def fetch_all_reports(
+    max_per_state: int = 20, concurrent: bool = True, full: bool = False
+) -> list[FishingReport]:
     """Fetch fishing reports from all regions and states.
 
+    Only stale river lists and river pages are requested; reports of
+    rivers fetched recently are merged in from REPORTS_PATH. Crawl state
+    is saved to CRAWL_STATE_PATH afterwards.
+
     Args:
         max_per_state: Maximum rivers to fetch per state (to avoid rate limits)
+        concurrent: Crawl with PoliteCrawler instead of one page at a time
+        full: Ignore earlier crawl state and fetch every page
 
     Returns:
         List of FishingReport objects
     """
+    crawl_state = empty_crawl_state() if full else load_crawl_state()
+    previous = {} if full else {report["url"]: FishingReport(**report) for report in load_reports(REPORTS_PATH)}
+
+    if concurrent:
+        all_reports = crawl_all_reports(max_per_state, crawl_state=crawl_state, previous=previous)
+        save_crawl_state(crawl_state)
+        return all_reports
+
     all_reports = []
 
     for region, states in REGIONS.items():
@@ -252,22 +514,30 @@ def fetch_all_reports(max_per_state: int = 20) -> list[FishingReport]:
         for state in states:
             print(f"    State: {state.replace('-', ' ').title()}...", end=" ", flush=True)
 
-            rivers = fetch_state_rivers(region, state)
+            cached = crawl_state["states"].get(f"{region}/{state}")
+            if is_fresh(cached, RIVER_LIST_TTL):
+                rivers = cached["rivers"]
+            else:
+                rivers = refresh_state_rivers(region, state, crawl_state)
+                time.sleep(1)  # Pause between states
             print(f"found {len(rivers)} rivers")
 
             # Limit rivers per state
             rivers = rivers[:max_per_state]
 
             for river in rivers:
-                report = fetch_river_report(river, region, state)
+                if is_fresh(crawl_state["rivers"].get(river["url"]), RIVER_TTL):
+                    report = previous.get(river["url"])
+                else:
+                    report = refresh_river_report(
+                        river, region, state, crawl_state, previous.get(river["url"])
+                    )
+                    # Be polite to the server
+                    time.sleep(0.5)
                 if report:
                     all_reports.append(report)
 
-                # Be polite to the server
-                time.sleep(0.5)
-
-            time.sleep(1)  # Pause between states
-
+    save_crawl_state(crawl_state)
     return all_reports
 
 
@@ -284,6 +554,48 @@ def save_reports(reports: list[FishingReport], output_path: Path):
         json.dump(data, f, indent=2)
 
     print(f"Saved {len(reports)} reports to {output_path}")
+    save_report_tiles(reports)
+
+
+def tile_key(lat: float, lon: float) -> str:
+    """Grid cell of a point: "{row}_{col}" in TILE_DEGREES steps."""
+    return f"{math.floor(lat / TILE_DEGREES)}_{math.floor(lon / TILE_DEGREES)}"
+
+
+def save_report_tiles(reports: list[FishingReport]) -> dict:
+    """Shard reports by grid cell into TILES_DIR/tiles plus a manifest.
+
+    manifest.json lists every non-empty cell with its report count; the
+    cell's bounds follow from its key and tile_degrees. Shards of cells
+    that no longer have reports are removed.
+
+    Returns:
+        The manifest
+    """
+    tiles: dict[str, list[dict]] = {}
+    for report in reports:
+        tiles.setdefault(tile_key(report.lat, report.lon), []).append(asdict(report))
+
+    tiles_dir = TILES_DIR / "tiles"
+    tiles_dir.mkdir(parents=True, exist_ok=True)
+    for key, tile_reports in tiles.items():
+        with open(tiles_dir / f"{key}.json", "w") as f:
+            json.dump({"reports": tile_reports}, f, separators=(",", ":"))
+    for path in tiles_dir.glob("*.json"):
+        if path.stem not in tiles:
+            path.unlink()
+
+    manifest = {
+        "generated": datetime.now().isoformat(),
+        "count": len(reports),
+        "tile_degrees": TILE_DEGREES,
+        "tiles": {key: {"count": len(tile_reports)} for key, tile_reports in sorted(tiles.items())},
+    }
+    with open(TILES_DIR / "manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"Saved {len(tiles)} report tiles to {TILES_DIR}")
+    return manifest
 
 
 def load_reports(input_path: Path) -> list[dict]:
@@ -298,11 +610,16 @@ def load_reports(input_path: Path) -> list[dict]:
 
 
 if __name__ == "__main__":
+    import sys
+
+    if "--tiles-only" in sys.argv:
+        save_report_tiles([FishingReport(**r) for r in load_reports(REPORTS_PATH)])
+        sys.exit()
+
     print("Fetching Orvis fishing reports...")
     reports = fetch_all_reports(max_per_state=10)
 
-    output_path = Path(__file__).parent.parent / "static" / "data" / "fishing-reports.json"
-    save_reports(reports, output_path)
+    save_reports(reports, REPORTS_PATH)
 
     print(f"\nSample reports:")
     for r in reports[:5]:
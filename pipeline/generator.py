@@ -3,16 +3,24 @@
 import argparse
 import os
 import re
+from contextlib import closing
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
+from .annotator import DEFAULT_BATCH_SIZE, BatchAnnotator
+from .article_index import ArticleIndex
 from .fetcher import Article, fetch_all_content
-from .summarizer import summarize_article, clean_description
+from .llm_executor import MAX_WORKERS
+from .stages import DEFAULT_QUEUE_SIZE, Stage, run_stages
+from .summarizer import summarize_article
 from .tagger import auto_tag
-from .image_extractor import process_article_image, create_placeholder_image
+from .image_extractor import ImageCandidate, create_placeholder_image, submit_article_images
+from .image_variants import Lqip
 from .theme_extractor import extract_and_save_themes
 from .digest_generator import generate_daily_digest
+from .llm_cache import report_cache_stats
 
 
 def slugify(text: str) -> str:
@@ -31,7 +39,8 @@ def generate_markdown(
     summary: str,
     image_path: str,
     tags: list[str],
-    author: Optional[str] = None
+    author: Optional[str] = None,
+    image_lqip: Optional[Lqip] = None
 ) -> str:
     """Generate Hugo-compatible markdown content."""
     # Escape for YAML
@@ -52,6 +61,9 @@ tags:
 {tags_yaml}
 '''
 
+    if image_lqip:
+        frontmatter += f'image_color: "{image_lqip.color}"\nimage_preview: "{image_lqip.preview}"\n'
+
     if author:
         frontmatter += f'author: "{author}"\n'
 
@@ -62,8 +74,25 @@ tags:
     return frontmatter + body
 
 
-def save_article(article: Article, summary: str, tags: list[str], image_path: str) -> Path:
-    """Save a processed article as a Hugo markdown file."""
+def save_article(
+    article: Article,
+    summary: str,
+    tags: list[str],
+    image_path: str,
+    index: Optional[ArticleIndex] = None,
+    image_lqip: Optional[Lqip] = None
+) -> Path:
+    """Save a processed article as a Hugo markdown file.
+
+    Args:
+        article: The article
+        summary: Summary text
+        tags: Tags for the frontmatter
+        image_path: Hugo-relative image path
+        index: Article index to record the file in (opened per call if
+            not given)
+        image_lqip: Placeholder painted while the image loads
+    """
     date_prefix = article.published.strftime("%Y-%m-%d")
     slug = slugify(article.title)
     filename = f"{date_prefix}-{slug}.md"
@@ -79,73 +108,181 @@ def save_article(article: Article, summary: str, tags: list[str], image_path: st
         summary=summary,
         image_path=image_path,
         tags=tags,
-        author=article.author
+        author=article.author,
+        image_lqip=image_lqip
     )
 
     file_path = content_dir / filename
     file_path.write_text(markdown, encoding="utf-8")
 
+    if index is not None:
+        index.update(file_path)
+    else:
+        with ArticleIndex() as index:
+            index.update(file_path)
+
     return file_path
 
 
-def process_articles(articles: list[Article], max_articles: int = 50) -> list[Path]:
-    """Process a batch of articles and generate markdown files."""
+@dataclass
+class ArticleJob:
+    """An article moving through the processing stages."""
+    article: Article
+    index: int
+    summary: str = ""
+    tags: list[str] = field(default_factory=list)
+    image_path: str = ""
+    image_lqip: Optional[Lqip] = None
+
+
+# Worker threads per processing stage
+DEFAULT_STAGE_WORKERS = {
+    "annotate": MAX_WORKERS,   # batched summary + tags
+    "summarize": MAX_WORKERS,  # unbatched
+    "tag": MAX_WORKERS,        # unbatched
+    "image": 2,  # only waits for the background image downloads
+}
+
+
+def process_articles(
+    articles: list[Article],
+    max_articles: int = 50,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    stage_workers: Optional[dict[str, int]] = None,
+    queue_size: int = DEFAULT_QUEUE_SIZE
+) -> list[Path]:
+    """Process a batch of articles and generate markdown files.
+
+    Articles flow through concurrent stages (summary and tags, image) with
+    bounded queues in between, while all images download in the
+    background; markdown files are written in input order, so filenames
+    and the console report match a serial run.
+
+    Args:
+        articles: Articles to process
+        max_articles: Maximum articles to process
+        batch_size: Articles per AI annotation request (1 = one summary
+            and one tagging call per article)
+        stage_workers: Worker threads per stage name, overriding
+            DEFAULT_STAGE_WORKERS
+        queue_size: Articles buffered between two stages
+    """
     create_placeholder_image()
 
     generated_files = []
     ai_enabled = os.environ.get("OPENAI_API_KEY") is not None
+    articles = articles[:max_articles]
+    workers = {**DEFAULT_STAGE_WORKERS, **(stage_workers or {})}
 
     if ai_enabled:
         print("  AI mode: ON (using GPT-4o-mini for summaries and tags)")
     else:
         print("  AI mode: OFF (set OPENAI_API_KEY for AI features)")
 
-    for i, article in enumerate(articles[:max_articles]):
-        print(f"\nProcessing {i+1}/{min(len(articles), max_articles)}: {article.title[:50]}...")
-
-        try:
-            # Generate summary (AI or fallback)
-            summary = summarize_article(
-                title=article.title,
-                description=article.description,
-                source_name=article.source_name
-            )
-
-            # Generate tags (AI or fallback)
-            tags = auto_tag(
-                title=article.title,
-                description=article.description,
-                source_name=article.source_name
-            )
-
-            # Process image
-            date_str = article.published.strftime("%Y-%m-%d")
-            image_path = process_article_image(
-                image_url=article.image_url,
-                article_title=article.title,
-                date_str=date_str,
-                fallback_html=article.description
-            )
-
-            # Save article
-            file_path = save_article(article, summary, tags, image_path)
-            generated_files.append(file_path)
-            print(f"  -> Saved: {file_path.name}")
-            print(f"     Tags: {', '.join(tags)}")
-
-        except Exception as e:
-            print(f"  -> Error processing article: {e}")
-            continue
+    def summarize(job: ArticleJob, log: Callable[[str], None]) -> ArticleJob:
+        article = job.article
+        job.summary = summarize_article(article.title, article.description, article.source_name, log)
+        return job
+
+    def tag(job: ArticleJob, log: Callable[[str], None]) -> ArticleJob:
+        article = job.article
+        job.tags = auto_tag(article.title, article.description, article.source_name, log)
+        return job
+
+    # Images for all articles download concurrently from the start (pooled
+    # client, resizing in a process pool); the image stage collects them
+    images = submit_article_images([
+        ImageCandidate(
+            image_url=article.image_url,
+            article_title=article.title,
+            date_str=article.published.strftime("%Y-%m-%d"),
+            fallback_html=article.description
+        )
+        for article in articles
+    ])
+
+    def collect_image(job: ArticleJob, log: Callable[[str], None]) -> ArticleJob:
+        image = images[job.index].result()
+        job.image_path, job.image_lqip = image.path, image.lqip
+        if image.error:
+            log(image.error)
+        return job
+
+    # Summaries and tags: one request per batch of articles, or one of
+    # each per article (AI or fallback)
+    annotator = None
+    if ai_enabled and batch_size > 1:
+        print(f"  Annotating {len(articles)} articles in batches of up to {batch_size}...")
+        annotator = BatchAnnotator(articles, batch_size=batch_size)
+
+        def annotate(job: ArticleJob, log: Callable[[str], None]) -> ArticleJob:
+            job.summary, job.tags = annotator(job.index, log)
+            return job
+
+        stages = [Stage("annotate", annotate, workers["annotate"])]
+    else:
+        stages = [
+            Stage("summarize", summarize, workers["summarize"]),
+            Stage("tag", tag, workers["tag"]),
+        ]
+    stages.append(Stage("image", collect_image, workers["image"]))
+
+    jobs = (ArticleJob(article, i) for i, article in enumerate(articles))
+    with ArticleIndex() as index, closing(run_stages(jobs, stages, queue_size=queue_size)) as results:
+        for result in results:
+            job = result.value
+            print(f"\nProcessing {result.index+1}/{len(articles)}: {job.article.title[:50]}...")
+            for line in result.log:
+                print(line)
+
+            try:
+                if result.error:
+                    raise result.error
+
+                # Save article (in input order, so filename clashes resolve
+                # the same way every run)
+                file_path = save_article(job.article, job.summary, job.tags, job.image_path, index=index,
+                                         image_lqip=job.image_lqip)
+                generated_files.append(file_path)
+                print(f"  -> Saved: {file_path.name}")
+                print(f"     Tags: {', '.join(job.tags)}")
+
+            except Exception as e:
+                print(f"  -> Error processing article: {e}")
+                continue
+
+    if annotator and annotator.fallbacks:
+        print(f"  {annotator.fallbacks} articles fell back to single-article annotation")
 
     return generated_files
 
 
-def run_pipeline(extract_themes: bool = False, max_articles: int = 50) -> None:
+def parse_stage_workers(spec: str) -> dict[str, int]:
+    """Parse a --workers value like "image=8,summarize=4"."""
+    workers = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, _, count = part.partition("=")
+        if name not in DEFAULT_STAGE_WORKERS or not count.isdigit() or int(count) < 1:
+            raise ValueError(f"invalid stage worker setting: {part}")
+        workers[name] = int(count)
+    return workers
+
+
+def run_pipeline(
+    extract_themes: bool = False,
+    max_articles: int = 50,
+    concurrent_fetch: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    stage_workers: Optional[dict[str, int]] = None
+) -> None:
     """Run the full content pipeline.
 
     Args:
         extract_themes: Whether to run theme extraction after processing
         max_articles: Maximum articles to process per run
+        concurrent_fetch: Fetch all sources concurrently (asyncio)
+        batch_size: Articles per AI annotation request
+        stage_workers: Worker threads per article processing stage
     """
     print("=" * 60)
     print("Windknots Content Pipeline")
@@ -153,14 +290,15 @@ def run_pipeline(extract_themes: bool = False, max_articles: int = 50) -> None:
 
     # Fetch content
     print("\n[1/3] Fetching content from sources...")
-    articles = fetch_all_content()
+    articles = fetch_all_content(concurrent=concurrent_fetch)
 
     if not articles:
         print("No new articles found.")
     else:
         # Process and generate
         print(f"\n[2/3] Processing {len(articles)} articles...")
-        generated = process_articles(articles, max_articles)
+        generated = process_articles(articles, max_articles, batch_size=batch_size,
+                                     stage_workers=stage_workers)
         print(f"\nGenerated {len(generated)} article files.")
 
     # Theme extraction
@@ -192,6 +330,24 @@ if __name__ == "__main__":
         default=50,
         help="Maximum articles to process (default: 50)"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Articles per AI summary/tagging request (default: {DEFAULT_BATCH_SIZE}, 1 disables batching)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=str,
+        default="",
+        help="Worker threads per processing stage, e.g. 'image=8,summarize=4' "
+             f"(stages: {', '.join(DEFAULT_STAGE_WORKERS)})"
+    )
+    parser.add_argument(
+        "--serial-fetch",
+        action="store_true",
+        help="Fetch sources one at a time instead of concurrently"
+    )
     parser.add_argument(
         "--themes-only",
         action="store_true",
@@ -209,6 +365,10 @@ if __name__ == "__main__":
     )
 
     args = parser.parse_args()
+    try:
+        stage_workers = parse_stage_workers(args.workers)
+    except ValueError as e:
+        parser.error(str(e))
 
     if args.themes_only:
         print("=" * 60)
@@ -221,7 +381,13 @@ if __name__ == "__main__":
             print("Theme extraction requires OPENAI_API_KEY")
     else:
         # Always fetch and process new articles first
-        run_pipeline(extract_themes=args.themes, max_articles=args.max_articles)
+        run_pipeline(
+            extract_themes=args.themes,
+            max_articles=args.max_articles,
+            concurrent_fetch=not args.serial_fetch,
+            batch_size=args.batch_size,
+            stage_workers=stage_workers
+        )
 
         # Then generate digest if requested
         if args.digest:
@@ -234,3 +400,5 @@ if __name__ == "__main__":
                     print(f"Invalid date format: {args.digest_date}. Use YYYY-MM-DD.")
                     exit(1)
             generate_daily_digest(target_date=target_date)
+
+    report_cache_stats()
@@ -1,7 +1,12 @@
 """Extract and cache article images."""
 
 import hashlib
+import multiprocessing
+import os
 import re
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
 from typing import Optional
@@ -10,6 +15,10 @@ from urllib.parse import urlparse
 import httpx
 from PIL import Image
 
+from .image_manifest import get_manifest
+from .image_variants import Lqip, make_lqip
+from .transport import get_client
+
 
 # Maximum image dimensions
 MAX_WIDTH = 800
@@ -19,14 +28,57 @@ QUALITY = 85
 # Supported image formats
 SUPPORTED_FORMATS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 
+# Formats accepted after sniffing the image header (Pillow names)
+DECODABLE_FORMATS = {"JPEG", "PNG", "GIF", "WEBP", "MPO"}
+
+# Downloads larger than this are abandoned mid-stream
+MAX_IMAGE_BYTES = 10 * 1024 * 1024
+
+# Images with more pixels than this are rejected from the header alone.
+# Other formats are fully decoded (up to ~64 MB of RGBA); JPEGs are
+# decoded in draft mode at up to 1/8 scale, so they may be larger.
+MAX_IMAGE_PIXELS = 16_000_000
+MAX_JPEG_PIXELS = 64_000_000
+
+# Bytes buffered before the header (format and dimensions) is checked;
+# the probe is retried at doubling sizes up to MAX_HEADER_BYTES
+HEADER_PROBE_BYTES = 64 * 1024
+MAX_HEADER_BYTES = 1024 * 1024
+
+# dHash grid size (DHASH_SIZE**2 bits)
+DHASH_SIZE = 8
+
 # Placeholder image path (relative to Hugo static)
 PLACEHOLDER_IMAGE = "/images/placeholder.jpg"
 
+STATIC_DIR = Path(__file__).parent.parent / "static"
+
+# Concurrent image downloads, and processes for decoding/resizing
+DOWNLOAD_WORKERS = 8
+RESIZE_WORKERS = os.cpu_count() or 1
+
+
+@dataclass
+class ImageCandidate:
+    """Where to look for one article's image."""
+    image_url: Optional[str]  # Direct URL (from feed/API)
+    article_title: str  # For the filename
+    date_str: str  # YYYY-MM-DD, for the directory
+    fallback_html: str = ""  # Searched for og:image / first <img> if no URL
+
+
+@dataclass
+class ImageResult:
+    """Outcome of ingesting one article's image."""
+    path: str  # Hugo-relative path, or PLACEHOLDER_IMAGE
+    lqip: Optional[Lqip] = None  # Placeholder to paint while it loads
+    error: Optional[str] = None  # Why the placeholder image is used
+
 
 def get_image_dir(date_str: str) -> Path:
     """Get the image directory for a given date (YYYY-MM-DD)."""
     year, month, _ = date_str.split("-")[:3]
-    img_dir = Path(__file__).parent.parent / "static" / "images" / year / month
+    img_dir = STATIC_DIR / "images" / year / month
     img_dir.mkdir(parents=True, exist_ok=True)
     return img_dir
 
@@ -48,6 +100,148 @@ def generate_image_filename(url: str, title: str) -> str:
     return f"{slug}-{url_hash}{ext}"
 
 
+def check_image_header(img: Image.Image) -> None:
+    """Reject unsupported formats and oversized dimensions before decoding.
+
+    Raises:
+        ValueError: If the image should not be decoded
+    """
+    if img.format not in DECODABLE_FORMATS:
+        raise ValueError(f"Unsupported image format: {img.format}")
+    max_pixels = MAX_JPEG_PIXELS if img.format in ("JPEG", "MPO") else MAX_IMAGE_PIXELS
+    if img.width * img.height > max_pixels:
+        raise ValueError(f"Image too large: {img.width}x{img.height}")
+
+
+def _probe_header(data: bytes) -> bool:
+    """Check a partial download's header if it can be parsed yet.
+
+    Returns:
+        True once the header was parsed and checked, False if more bytes
+        are needed (e.g. a JPEG with large metadata before its frame)
+
+    Raises:
+        ValueError: If the header is unusable, or still unreadable after
+            MAX_HEADER_BYTES (not an image, e.g. a mislabeled video)
+    """
+    try:
+        img = Image.open(BytesIO(data))
+    except Image.DecompressionBombError as e:
+        raise ValueError(f"Image too large: {e}")
+    except Exception:
+        if len(data) >= MAX_HEADER_BYTES:
+            raise ValueError("Not a recognizable image")
+        return False
+    check_image_header(img)
+    return True
+
+
+def fetch_image(client: httpx.Client, url: str, max_bytes: int = MAX_IMAGE_BYTES) -> bytes:
+    """Stream an image download, stopping early if it can't be used.
+
+    The download is abandoned if Content-Length or the received bytes
+    exceed max_bytes, or as soon as the buffered header shows an
+    unsupported format or oversized dimensions.
+
+    Raises:
+        httpx.HTTPError: On request failure
+        ValueError: If the response is not a usable image
+    """
+    with client.stream("GET", url) as response:
+        response.raise_for_status()
+
+        content_type = response.headers.get("content-type", "")
+        if not content_type.startswith("image/"):
+            raise ValueError(f"Invalid content type: {content_type}")
+
+        length = response.headers.get("content-length")
+        if length and length.isdigit() and int(length) > max_bytes:
+            raise ValueError(f"Image too large: {int(length)} bytes")
+
+        buffer = bytearray()
+        next_probe = HEADER_PROBE_BYTES
+        for chunk in response.iter_bytes():
+            buffer += chunk
+            if len(buffer) > max_bytes:
+                raise ValueError(f"Image too large: over {max_bytes} bytes")
+            if next_probe and len(buffer) >= next_probe:
+                next_probe = 0 if _probe_header(bytes(buffer)) else min(next_probe * 2, MAX_HEADER_BYTES)
+
+    return bytes(buffer)
+
+
+def resize_image(data: bytes, output_path: str) -> tuple[int, int]:
+    """Decode, downscale and convert an image, then save it.
+
+    JPEGs are decoded in draft mode at the smallest DCT scale that still
+    covers MAX_WIDTH x MAX_HEIGHT, and other formats are shrunk with
+    reduce() before resampling, so full-resolution pixels are never held
+    for large images. Mode conversion happens after downscaling.
+
+    Module-level so it can run in worker processes.
+
+    Returns:
+        (width, height) of the saved image
+    """
+    output_path = Path(output_path)
+    img = Image.open(BytesIO(data))
+    check_image_header(img)
+
+    # Palette/bilevel images only resample with NEAREST: shrink them
+    # cheaply to twice the target size in that mode, then convert
+    if img.mode in ("P", "1"):
+        img.thumbnail((MAX_WIDTH * 2, MAX_HEIGHT * 2), Image.Resampling.NEAREST)
+        img = img.convert("RGBA")
+
+    # Resize if too large (thumbnail drafts JPEGs and reduces others)
+    if img.width > MAX_WIDTH or img.height > MAX_HEIGHT:
+        img.draft("RGB", (MAX_WIDTH, MAX_HEIGHT))
+        img.thumbnail((MAX_WIDTH, MAX_HEIGHT), Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+    # Convert RGBA to RGB if needed (for JPEG output)
+    if img.mode == "RGBA" and output_path.suffix.lower() in (".jpg", ".jpeg"):
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        img = background
+    elif img.mode != "RGB":
+        img = img.convert("RGB")
+
+    # Save
+    img.save(output_path, quality=QUALITY, optimize=True)
+    return img.size
+
+
+def dhash(img: Image.Image) -> int:
+    """64-bit difference hash: brightness gradients of a 9x8 grayscale thumbnail.
+
+    Robust to rescaling and recompression, so the same photo served at
+    different sizes or qualities hashes to (nearly) the same value.
+    """
+    img.draft("L", (DHASH_SIZE * 8, DHASH_SIZE * 8))
+    small = img.convert("L").resize((DHASH_SIZE + 1, DHASH_SIZE), Image.Resampling.LANCZOS,
+                                    reducing_gap=2.0)
+    pixels = list(small.getdata())
+    value = 0
+    for row in range(DHASH_SIZE):
+        for col in range(DHASH_SIZE):
+            left = pixels[row * (DHASH_SIZE + 1) + col]
+            value = value << 1 | (left > pixels[row * (DHASH_SIZE + 1) + col + 1])
+    return value
+
+
+def fingerprint_image(data: bytes) -> tuple[int, Lqip]:
+    """dHash and low-quality placeholder of an encoded image.
+
+    Both come from one small decode (JPEGs in draft mode at up to 1/8
+    scale). Module-level so it can run in worker processes.
+    """
+    img = Image.open(BytesIO(data))
+    check_image_header(img)
+    img.draft("RGB", (DHASH_SIZE * 8, DHASH_SIZE * 8))
+    img.load()
+    return dhash(img), make_lqip(img)
+
+
 def download_and_resize_image(url: str, output_path: Path) -> bool:
     """Download an image and resize it if necessary.
 
@@ -59,40 +253,8 @@ def download_and_resize_image(url: str, output_path: Path) -> bool:
         True if successful, False otherwise
     """
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-
-        with httpx.Client(timeout=30, follow_redirects=True, headers=headers) as client:
-            response = client.get(url)
-            response.raise_for_status()
-
-            # Check content type
-            content_type = response.headers.get("content-type", "")
-            if not content_type.startswith("image/"):
-                print(f"Invalid content type: {content_type}")
-                return False
-
-            # Open and process image
-            img = Image.open(BytesIO(response.content))
-
-            # Convert RGBA to RGB if needed (for JPEG output)
-            if img.mode in ("RGBA", "P") and output_path.suffix.lower() in (".jpg", ".jpeg"):
-                background = Image.new("RGB", img.size, (255, 255, 255))
-                if img.mode == "P":
-                    img = img.convert("RGBA")
-                background.paste(img, mask=img.split()[-1])
-                img = background
-            elif img.mode != "RGB":
-                img = img.convert("RGB")
-
-            # Resize if too large
-            if img.width > MAX_WIDTH or img.height > MAX_HEIGHT:
-                img.thumbnail((MAX_WIDTH, MAX_HEIGHT), Image.Resampling.LANCZOS)
-
-            # Save
-            img.save(output_path, quality=QUALITY, optimize=True)
-            return True
+        resize_image(fetch_image(get_client(), url), str(output_path))
+        return True
 
     except Exception as e:
         print(f"Error downloading image {url}: {e}")
@@ -134,6 +296,36 @@ def extract_first_image(html: str) -> Optional[str]:
     return None
 
 
+def resolve_image_url(image_url: Optional[str], fallback_html: str = "") -> Optional[str]:
+    """Pick an absolute image URL from the feed URL or the article HTML."""
+    # Try to find image URL
+    url = image_url
+
+    if not url and fallback_html:
+        # Try og:image first
+        url = extract_og_image(fallback_html)
+
+        # Fall back to first image in content
+        if not url:
+            url = extract_first_image(fallback_html)
+
+    if not url:
+        return None
+
+    # Ensure URL is absolute
+    if url.startswith("//"):
+        url = "https:" + url
+    elif not url.startswith("http"):
+        return None
+
+    return url
+
+
+def public_path(output_path: Path) -> str:
+    """Hugo-relative path (e.g. "/images/2024/01/article-abc123.jpg")."""
+    return f"/{output_path.relative_to(STATIC_DIR).as_posix()}"
+
+
 def process_article_image(
     image_url: Optional[str],
     article_title: str,
@@ -152,43 +344,149 @@ def process_article_image(
         Relative path to image for Hugo (e.g., "/images/2024/01/article-abc123.jpg")
         or placeholder path if no image found
     """
-    # Try to find image URL
-    url = image_url
+    candidate = ImageCandidate(image_url, article_title, date_str, fallback_html)
+    return process_article_images([candidate])[0]
 
-    if not url and fallback_html:
-        # Try og:image first
-        url = extract_og_image(fallback_html)
 
-        # Fall back to first image in content
+_download_executor: Optional[ThreadPoolExecutor] = None
+_resize_pool: Optional[ProcessPoolExecutor] = None
+_pools_lock = threading.Lock()
+
+
+def _get_pools() -> tuple[ThreadPoolExecutor, ProcessPoolExecutor]:
+    """Shared image download threads and resize processes."""
+    global _download_executor, _resize_pool
+    with _pools_lock:
+        if _download_executor is None:
+            _download_executor = ThreadPoolExecutor(DOWNLOAD_WORKERS, thread_name_prefix="image")
+            # Workers are started on demand from download threads; forking
+            # a threaded process can copy a held lock into the child
+            _resize_pool = ProcessPoolExecutor(RESIZE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _download_executor, _resize_pool
+
+
+def _ingest(url: str, output_path: Path) -> ImageResult:
+    """Download on the shared client, resize in the process pool.
+
+    Images whose bytes or dHash match a file already stored (the same
+    photo under another URL) reuse that file instead of being resized and
+    saved again. The outcome is recorded in the image manifest either way.
+    """
+    _, resize_pool = _get_pools()
+    manifest = get_manifest()
+    path = public_path(output_path)
+    reserved = False
+    try:
+        data = fetch_image(get_client(), url)
+        digest = hashlib.sha256(data).hexdigest()
+        match = manifest.find_by_digest(digest)
+        lqip = manifest.lqip(match) if match else None
+        if lqip is None:
+            fingerprint, lqip = resize_pool.submit(fingerprint_image, data).result()
+            if match is None:
+                match = manifest.match_or_reserve(path, digest, fingerprint)
+                reserved = match is None
+        if match is not None:
+            manifest.record_reuse(url, match)
+            return ImageResult(match, lqip)
+        width, height = resize_pool.submit(resize_image, data, str(output_path)).result()
+    except Exception as e:
+        if reserved:
+            manifest.release(path)
+        manifest.record_failure(url, str(e) or type(e).__name__,
+                                host_error=isinstance(e, (httpx.ConnectError, httpx.TimeoutException)))
+        return ImageResult(PLACEHOLDER_IMAGE, error=f"Error downloading image {url}: {e}")
+
+    manifest.record_success(url, path, width, height, digest, fingerprint, lqip)
+    return ImageResult(path, lqip)
+
+
+def _known_file(url: str, output_path: Path) -> Optional[ImageResult]:
+    """Record an image stored before the manifest existed, if on disk."""
+    if not output_path.exists():
+        return None
+    try:
+        with Image.open(output_path) as img:
+            img.load()
+            width, height = img.size
+            lqip = make_lqip(img)
+            fingerprint = dhash(img)
+    except Exception:
+        return None
+    path = public_path(output_path)
+    get_manifest().record_success(url, path, width, height, dhash=fingerprint, lqip=lqip)
+    return ImageResult(path, lqip)
+
+
+def _done(result: ImageResult) -> Future:
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def submit_article_images(candidates: list[ImageCandidate]) -> list[Future]:
+    """Start ingesting every article's image at once.
+
+    Downloads run concurrently over one pooled HTTP client; decoding and
+    resizing run in a process pool. Articles that resolve to the same
+    file share one download. URLs already in the image manifest reuse
+    their stored file, and URLs (or hosts) that failed recently are
+    skipped until their backoff expires.
+
+    Args:
+        candidates: One ImageCandidate per article
+
+    Returns:
+        One future per candidate, in order, resolving to an ImageResult
+    """
+    downloads, _ = _get_pools()
+    manifest = get_manifest()
+    by_path: dict[Path, Future] = {}
+    futures = []
+
+    for candidate in candidates:
+        url = resolve_image_url(candidate.image_url, candidate.fallback_html)
         if not url:
-            url = extract_first_image(fallback_html)
+            futures.append(_done(ImageResult(PLACEHOLDER_IMAGE)))
+            continue
 
-    if not url:
-        return PLACEHOLDER_IMAGE
+        record = manifest.get(url)
+        if record and record.status == "ok":
+            futures.append(_done(ImageResult(record.path, manifest.lqip(record.path))))
+            continue
+        reason = manifest.skip_reason(url)
+        if reason:
+            futures.append(_done(ImageResult(PLACEHOLDER_IMAGE, error=f"Skipping image {url}: {reason}")))
+            continue
 
-    # Ensure URL is absolute
-    if url.startswith("//"):
-        url = "https:" + url
-    elif not url.startswith("http"):
-        return PLACEHOLDER_IMAGE
+        output_path = get_image_dir(candidate.date_str) / generate_image_filename(url, candidate.article_title)
+        if output_path not in by_path:
+            known = _known_file(url, output_path)
+            if known:
+                by_path[output_path] = _done(known)
+            else:
+                by_path[output_path] = downloads.submit(_ingest, url, output_path)
+        futures.append(by_path[output_path])
+
+    return futures
 
-    # Generate output path
-    img_dir = get_image_dir(date_str)
-    filename = generate_image_filename(url, article_title)
-    output_path = img_dir / filename
 
-    # Check if already cached
-    if output_path.exists():
-        # Return Hugo-relative path
-        rel_path = output_path.relative_to(Path(__file__).parent.parent / "static")
-        return f"/{rel_path.as_posix()}"
+def process_article_images(candidates: list[ImageCandidate]) -> list[str]:
+    """Download and cache images for many articles concurrently.
 
-    # Download and cache
-    if download_and_resize_image(url, output_path):
-        rel_path = output_path.relative_to(Path(__file__).parent.parent / "static")
-        return f"/{rel_path.as_posix()}"
+    Args:
+        candidates: One ImageCandidate per article
 
-    return PLACEHOLDER_IMAGE
+    Returns:
+        Hugo-relative image path (or placeholder) per candidate, in order
+    """
+    paths = []
+    for future in submit_article_images(candidates):
+        result = future.result()
+        if result.error:
+            print(result.error)
+        paths.append(result.path)
+    return paths
 
 
 def create_placeholder_image() -> None:
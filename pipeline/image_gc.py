@@ -0,0 +1,165 @@
+"""Remove images in static/images that no content references any more.
+
+Article images and theme images are written under static/images/YYYY/MM
+and static/images/themes, but nothing deleted them: images of articles
+cleared by `build.sh --fresh`, or of rejected and overwritten themes,
+stayed forever. An image is live if the frontmatter of any article, theme
+or digest references it (image:, image_srcset entries, digest themes) or
+a run checkpoint still holds it for a resumed run. References come from
+the SQLite content indexes, so only files changed since the last run are
+parsed.
+
+Run it after the pipeline, not during a run. It removes nothing when no
+references are found at all, or when more than MAX_GARBAGE_FRACTION of
+the scanned files would go: both usually mean the indexes or content
+are broken, not that the images are unused. Use --force to remove
+anyway.
+
+Usage:
+    python -m pipeline.image_gc --dry-run
+    python -m pipeline.image_gc
+    python -m pipeline.image_gc --archive ../windknots-image-archive
+    python -m pipeline.image_gc --force
+"""
+
+import argparse
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from .article_index import IMAGE_REF_RE, SECTIONS, ArticleIndex
+from .checkpoint import CHECKPOINT_DIR
+from .image_manifest import get_manifest
+from .image_variants import STATIC_DIR
+
+
+IMAGES_DIR = STATIC_DIR / "images"
+
+# Share of scanned files above which a run is assumed to be broken
+MAX_GARBAGE_FRACTION = 0.5
+
+
+@dataclass
+class GcReport:
+    """Unreferenced images found (and removed unless a dry run)."""
+    garbage: list[Path] = field(default_factory=list)
+    bytes: int = 0
+    live: int = 0  # Referenced paths
+    scanned: int = 0  # Files under static/images subdirectories
+    aborted: Optional[str] = None  # Why nothing was removed, if the guard tripped
+
+
+def live_images() -> set[str]:
+    """Hugo-relative image paths referenced by content or checkpoints."""
+    live = set()
+    for section in SECTIONS:
+        with ArticleIndex.for_section(section) as index:
+            index.reconcile()
+            live |= index.image_references()
+
+    if CHECKPOINT_DIR.exists():
+        for path in CHECKPOINT_DIR.glob("*.json"):
+            live |= set(IMAGE_REF_RE.findall(path.read_text(encoding="utf-8", errors="replace")))
+    return live
+
+
+def find_garbage(live: set[str]) -> GcReport:
+    """List files under static/images subdirectories not in live.
+
+    Files directly in static/images (the placeholder, site assets) are
+    never candidates; only the directories the pipeline writes to are.
+    """
+    report = GcReport(live=len(live))
+    for directory, _, filenames in os.walk(IMAGES_DIR):
+        if Path(directory) == IMAGES_DIR:
+            continue
+        for filename in filenames:
+            path = Path(directory) / filename
+            report.scanned += 1
+            if "/" + path.relative_to(STATIC_DIR).as_posix() not in live:
+                report.garbage.append(path)
+                report.bytes += path.stat().st_size
+    return report
+
+
+def check_report(report: GcReport) -> Optional[str]:
+    """Reason not to remove the report's files, or None if it looks sane."""
+    if not report.garbage:
+        return None
+    if report.live == 0:
+        return "no content references any image"
+    if len(report.garbage) > MAX_GARBAGE_FRACTION * report.scanned:
+        return (f"{len(report.garbage)} of {report.scanned} images unreferenced "
+                f"(limit {MAX_GARBAGE_FRACTION:.0%})")
+    return None
+
+
+def collect_garbage(dry_run: bool = False, archive_dir: Optional[Path] = None,
+                    force: bool = False) -> GcReport:
+    """Delete (or move to archive_dir) images no content references.
+
+    Args:
+        dry_run: Only report what would be removed
+        archive_dir: Move files here (keeping their static/ relative
+            path) instead of deleting them
+        force: Remove even if check_report finds the result suspicious
+
+    Returns:
+        GcReport of the unreferenced files; aborted is set if the guard
+        kept them
+    """
+    report = find_garbage(live_images())
+    if not force:
+        report.aborted = check_report(report)
+    if dry_run or report.aborted or not report.garbage:
+        return report
+
+    for path in report.garbage:
+        if archive_dir:
+            target = archive_dir / path.relative_to(STATIC_DIR)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(path, target)
+        else:
+            path.unlink()
+
+    # Drop month (and year) directories left empty, deepest first
+    directories = {parent for path in report.garbage for parent in path.parents
+                   if IMAGES_DIR in parent.parents}
+    for directory in sorted(directories, key=lambda d: len(d.parts), reverse=True):
+        if not any(directory.iterdir()):
+            directory.rmdir()
+
+    get_manifest().forget({"/" + path.relative_to(STATIC_DIR).as_posix() for path in report.garbage})
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Remove images no content references")
+    parser.add_argument("--dry-run", action="store_true", help="Report only, change nothing")
+    parser.add_argument("--archive", type=Path, metavar="DIR",
+                        help="Move unreferenced images to DIR instead of deleting them")
+    parser.add_argument("--force", action="store_true",
+                        help=f"Remove even with no references or over {MAX_GARBAGE_FRACTION:.0%} unreferenced")
+    args = parser.parse_args()
+
+    report = collect_garbage(dry_run=args.dry_run, archive_dir=args.archive, force=args.force)
+
+    if report.aborted and not args.dry_run:
+        print(f"{report.scanned} images, {report.live} referenced paths")
+        print(f"Removed nothing: {report.aborted}; check the content or rerun with --force")
+        return
+
+    if args.dry_run:
+        for path in report.garbage:
+            print(f"  {path.relative_to(STATIC_DIR)}")
+    action = "Would remove" if args.dry_run else ("Archived" if args.archive else "Removed")
+    print(f"{report.scanned} images, {report.live} referenced paths")
+    print(f"{action} {len(report.garbage)} unreferenced images ({report.bytes / 1024 / 1024:.1f} MB)")
+    if report.aborted:
+        print(f"A real run would remove nothing: {report.aborted}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""Persistent record of article image downloads, including failures.
+
+Every image URL the pipeline has tried is kept with the file it was stored
+as (and its dimensions) or, if it failed, the number of consecutive
+failures and when it may be retried. Failed URLs back off exponentially, so
+a dead link or an HTML page posing as an image costs one timeout every few
+days instead of one per run. Hosts that fail at the connection level are
+tracked too, and all their URLs are skipped while the host is backed off.
+
+Stored files keep their low-quality placeholder (LQIP), so articles that
+reuse a file get it without decoding anything. They are also indexed by
+content: the SHA-256 of the downloaded
+bytes and a 64-bit dHash of the picture. The same photo syndicated or
+cross-posted under another URL (possibly re-encoded or rescaled) then
+reuses the file already stored instead of adding a copy. dHashes are split
+into LSH bands, as for article fingerprints, so a lookup only compares
+against files sharing a band.
+
+The whole manifest is loaded into memory when opened, so lookups never
+touch the database or the filesystem; writes go straight to SQLite.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+from .image_variants import STATIC_DIR, Lqip
+from .near_dup import BANDS, MAX_DISTANCE, fingerprint_bands, hamming_distance
+
+
+MANIFEST_DB_PATH = Path(__file__).parent.parent / "data" / "cache" / "images.sqlite3"
+
+# Retry delay after the first failure, doubling per further failure
+BASE_BACKOFF_SECONDS = 12 * 3600
+MAX_BACKOFF_SECONDS = 30 * 24 * 3600
+
+# Consecutive connection-level failures before a whole host is skipped
+HOST_FAILURE_THRESHOLD = 3
+
+# Seconds a writer waits for another process to release the database
+BUSY_TIMEOUT = 30
+
+
+def backoff_seconds(failures: int) -> float:
+    """Delay before retrying after this many consecutive failures."""
+    return min(BASE_BACKOFF_SECONDS * 2 ** (failures - 1), MAX_BACKOFF_SECONDS)
+
+
+@dataclass
+class ImageRecord:
+    """Outcome of the latest download attempt for one image URL."""
+    url: str
+    status: str  # "ok" or "failed"
+    path: str = ""  # Hugo-relative path when ok
+    width: int = 0
+    height: int = 0
+    failures: int = 0  # Consecutive failures
+    retry_after: float = 0  # Unix time before which a failed URL is skipped
+    error: str = ""
+
+
+class ImageManifest:
+    """In-memory map of image URL -> ImageRecord, persisted in SQLite.
+
+    Safe to share between threads.
+
+    Usage:
+        manifest = get_manifest()
+        reason = manifest.skip_reason(url)
+        record = manifest.get(url)
+    """
+
+    def __init__(self, path: Path = MANIFEST_DB_PATH):
+        self.path = path
+        self.skipped = 0
+        self.reused = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS images (
+                   url TEXT PRIMARY KEY,
+                   status TEXT NOT NULL,
+                   path TEXT NOT NULL,
+                   width INTEGER NOT NULL,
+                   height INTEGER NOT NULL,
+                   failures INTEGER NOT NULL,
+                   retry_after REAL NOT NULL,
+                   error TEXT NOT NULL,
+                   updated REAL NOT NULL
+               ) WITHOUT ROWID"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS hosts (
+                   host TEXT PRIMARY KEY,
+                   failures INTEGER NOT NULL,
+                   retry_after REAL NOT NULL
+               ) WITHOUT ROWID"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS stored (
+                   path TEXT PRIMARY KEY,
+                   digest TEXT,
+                   dhash TEXT NOT NULL,
+                   width INTEGER NOT NULL,
+                   height INTEGER NOT NULL,
+                   color TEXT NOT NULL DEFAULT '',
+                   preview TEXT NOT NULL DEFAULT ''
+               ) WITHOUT ROWID"""
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(stored)")}
+        for column in ("color", "preview"):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE stored ADD COLUMN {column} TEXT NOT NULL DEFAULT ''")
+        self._conn.commit()
+
+        self._images = {
+            row[0]: ImageRecord(*row)
+            for row in self._conn.execute(
+                "SELECT url, status, path, width, height, failures, retry_after, error FROM images"
+            )
+        }
+        self._hosts = {
+            host: (failures, retry_after)
+            for host, failures, retry_after in self._conn.execute(
+                "SELECT host, failures, retry_after FROM hosts"
+            )
+        }
+
+        # Content index of stored files: digest -> path, and per band
+        # value -> paths with that band (dhash, size and LQIP kept per path)
+        self._dhashes: dict[str, int] = {}
+        self._sizes: dict[str, tuple[int, int]] = {}
+        self._lqips: dict[str, Lqip] = {}
+        self._by_digest: dict[str, str] = {}
+        self._bands: list[dict[int, list[str]]] = [{} for _ in range(BANDS)]
+        for path, digest, dhash, width, height, color, preview in self._conn.execute(
+            "SELECT path, digest, dhash, width, height, color, preview FROM stored"
+        ):
+            self._index(path, digest, int(dhash, 16))
+            self._sizes[path] = (width, height)
+            if color:
+                self._lqips[path] = Lqip(color, preview)
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def get(self, url: str) -> Optional[ImageRecord]:
+        """The recorded outcome for a URL, if it was tried before."""
+        with self._lock:
+            return self._images.get(url)
+
+    def skip_reason(self, url: str, now: Optional[float] = None) -> Optional[str]:
+        """Why a URL should not be downloaded this run, or None to try it.
+
+        A URL is skipped while its own backoff runs, or while its host has
+        failed HOST_FAILURE_THRESHOLD times in a row and is backed off.
+        """
+        now = time.time() if now is None else now
+        host = urlparse(url).hostname or ""
+        with self._lock:
+            record = self._images.get(url)
+            if record and record.status == "failed" and record.retry_after > now:
+                reason = f"failed {record.failures}x ({record.error})"
+            else:
+                failures, retry_after = self._hosts.get(host, (0, 0))
+                if failures >= HOST_FAILURE_THRESHOLD and retry_after > now:
+                    reason = f"host {host} unreachable {failures}x"
+                else:
+                    return None
+            self.skipped += 1
+            return reason
+
+    def _index(self, path: str, digest: Optional[str], dhash: int) -> None:
+        if path in self._dhashes:
+            return
+        self._dhashes[path] = dhash
+        if digest:
+            self._by_digest[digest] = path
+        for band, value in zip(self._bands, fingerprint_bands(dhash)):
+            band.setdefault(value, []).append(path)
+
+    def _unindex(self, path: str) -> None:
+        dhash = self._dhashes.pop(path, None)
+        self._sizes.pop(path, None)
+        self._lqips.pop(path, None)
+        if dhash is None:
+            return
+        self._by_digest = {d: p for d, p in self._by_digest.items() if p != path}
+        for band, value in zip(self._bands, fingerprint_bands(dhash)):
+            band[value].remove(path)
+
+    def lqip(self, path: str) -> Optional[Lqip]:
+        """Placeholder of a stored file, if recorded."""
+        with self._lock:
+            return self._lqips.get(path)
+
+    def find_by_digest(self, digest: str) -> Optional[str]:
+        """Path of a stored file downloaded from byte-identical data."""
+        with self._lock:
+            return self._by_digest.get(digest)
+
+    def match_or_reserve(self, path: str, digest: str, dhash: int,
+                         max_distance: int = MAX_DISTANCE) -> Optional[str]:
+        """Find a stored file that looks the same, or claim path for this image.
+
+        Checking and claiming happen atomically, so the same photo arriving
+        from two URLs in one run is stored once. A claimed path is indexed
+        in memory only until record_success (or release on failure).
+
+        Returns:
+            Hugo-relative path of the matching stored file, or None if this
+            image is new and path has been reserved for it
+        """
+        with self._lock:
+            match = self._by_digest.get(digest)
+            if match is None:
+                for band, value in zip(self._bands, fingerprint_bands(dhash)):
+                    match = next((p for p in band.get(value, [])
+                                  if hamming_distance(dhash, self._dhashes[p]) <= max_distance), None)
+                    if match:
+                        break
+            if match:
+                self.reused += 1
+                return match
+            self._index(path, digest, dhash)
+            return None
+
+    def release(self, path: str) -> None:
+        """Drop a path reserved by match_or_reserve whose image was not stored."""
+        with self._lock:
+            self._unindex(path)
+
+    def _write(self, record: ImageRecord) -> None:
+        self._images[record.url] = record
+        self._conn.execute(
+            "INSERT OR REPLACE INTO images (url, status, path, width, height, failures, "
+            "retry_after, error, updated) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (record.url, record.status, record.path, record.width, record.height,
+             record.failures, record.retry_after, record.error, time.time()),
+        )
+
+    def _write_host(self, host: str, failures: int, retry_after: float) -> None:
+        if failures:
+            self._hosts[host] = (failures, retry_after)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO hosts (host, failures, retry_after) VALUES (?, ?, ?)",
+                (host, failures, retry_after),
+            )
+        elif self._hosts.pop(host, None) is not None:
+            self._conn.execute("DELETE FROM hosts WHERE host = ?", (host,))
+
+    def record_success(self, url: str, path: str, width: int, height: int,
+                       digest: Optional[str] = None, dhash: Optional[int] = None,
+                       lqip: Optional[Lqip] = None) -> None:
+        """Record a stored image; clears the URL's and host's failures.
+
+        Args:
+            url: Image URL
+            path: Hugo-relative path of the stored file (possibly shared
+                with other URLs)
+            width: Stored width
+            height: Stored height
+            digest: SHA-256 of the downloaded bytes, if known
+            dhash: Perceptual hash, if the file is new to the content index
+            lqip: Placeholder of a new file
+        """
+        with self._lock:
+            self._write(ImageRecord(url, "ok", path, width, height))
+            self._write_host(urlparse(url).hostname or "", 0, 0)
+            if dhash is not None:
+                self._index(path, digest, dhash)
+                self._sizes[path] = (width, height)
+                if lqip:
+                    self._lqips[path] = lqip
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO stored (path, digest, dhash, width, height, color, preview) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (path, digest, f"{dhash:016x}", width, height,
+                     lqip.color if lqip else "", lqip.preview if lqip else ""),
+                )
+            self._conn.commit()
+
+    def record_reuse(self, url: str, path: str) -> None:
+        """Record a URL whose image matched an already stored file."""
+        with self._lock:
+            width, height = self._sizes.get(path, (0, 0))
+        self.record_success(url, path, width, height)
+
+    def record_failure(self, url: str, error: str, host_error: bool = False) -> None:
+        """Record a failed download and schedule the next retry.
+
+        Args:
+            url: Image URL
+            error: Short description of the failure
+            host_error: The host could not be reached at all (connection
+                error, timeout), as opposed to a bad response for this URL
+        """
+        now = time.time()
+        host = urlparse(url).hostname or ""
+        with self._lock:
+            previous = self._images.get(url)
+            failures = (previous.failures if previous else 0) + 1
+            self._write(ImageRecord(
+                url, "failed", failures=failures,
+                retry_after=now + backoff_seconds(failures), error=error[:200],
+            ))
+            if host_error:
+                host_failures = self._hosts.get(host, (0, 0))[0] + 1
+                self._write_host(host, host_failures, now + backoff_seconds(host_failures))
+            self._conn.commit()
+
+    def forget(self, paths: set[str]) -> int:
+        """Drop stored files (Hugo-relative paths) and the URLs pointing at them.
+
+        Returns:
+            Number of URL records removed
+        """
+        with self._lock:
+            urls = [url for url, record in self._images.items() if record.path in paths]
+            for url in urls:
+                del self._images[url]
+            for path in paths:
+                self._unindex(path)
+            self._conn.executemany("DELETE FROM images WHERE url = ?", [(url,) for url in urls])
+            self._conn.executemany("DELETE FROM stored WHERE path = ?", [(path,) for path in paths])
+            self._conn.commit()
+            return len(urls)
+
+    def forget_missing(self, static_dir: Path) -> int:
+        """Forget stored files that are not on disk.
+
+        A CI checkout restores the manifest from the cache but only has
+        the images that were committed. Each directory holding stored
+        files is listed once instead of stat-ing every file.
+
+        Returns:
+            Number of URL records removed
+        """
+        with self._lock:
+            stored = {record.path for record in self._images.values() if record.status == "ok"}
+            stored |= set(self._dhashes)
+        listings: dict[str, set[str]] = {}
+        missing = set()
+        for path in stored:
+            directory, _, name = path.rpartition("/")
+            if directory not in listings:
+                try:
+                    listings[directory] = set(os.listdir(static_dir / directory.lstrip("/")))
+                except OSError:
+                    listings[directory] = set()
+            if name not in listings[directory]:
+                missing.add(path)
+        return self.forget(missing) if missing else 0
+
+    def close(self) -> None:
+        """Checkpoint and close the database."""
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.close()
+
+
+_manifest: Optional[ImageManifest] = None
+_manifest_lock = threading.Lock()
+
+
+def get_manifest() -> ImageManifest:
+    """Return the process-wide manifest, loading it on first use.
+
+    Entries for files missing from static/ are dropped on load, so they
+    are downloaded again rather than referenced.
+    """
+    global _manifest
+    with _manifest_lock:
+        if _manifest is None:
+            _manifest = ImageManifest()
+            _manifest.forget_missing(STATIC_DIR)
+        return _manifest
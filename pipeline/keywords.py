@@ -0,0 +1,233 @@
+"""Single-pass keyword matching shared by the fetcher, tagger and theme extractor.
+
+Every keyword list in the pipeline is compiled into one engine. Instead of
+running each pattern over the text separately, the engine scans the text
+once with a trie-shaped regex of "trigger" prefixes (the literal letters a
+keyword must start with) and only confirms the handful of keywords whose
+trigger actually appears. Results are identical to testing every keyword
+on its own.
+
+Three kinds of list are supported:
+
+- patterns: regexes starting with \\b (e.g. FISHING_KEYWORDS), matched
+  case-insensitively with re.search semantics
+- substrings: plain keywords matched with ``kw in text`` semantics
+- words: whole [a-z0-9]+ tokens (e.g. CATEGORY_KEYWORDS)
+"""
+
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Iterable
+
+
+_LITERAL_CHARS = set("abcdefghijklmnopqrstuvwxyz0123456789")
+_QUANTIFIERS = set("?*+{")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _pattern_trigger(pattern: str) -> str:
+    """Return the literal word prefix a \\b-anchored regex must start with.
+
+    Returns an empty string when no safe trigger can be derived (no leading
+    \\b, top-level alternation, or a quantifier on the first letters).
+    """
+    if not pattern.startswith(r"\b") or "|" in pattern:
+        return ""
+    trigger = []
+    rest = pattern[2:]
+    for i, char in enumerate(rest):
+        if char not in _LITERAL_CHARS:
+            break
+        if i + 1 < len(rest) and rest[i + 1] in _QUANTIFIERS:
+            break
+        trigger.append(char)
+    return "".join(trigger)
+
+
+def _substring_trigger(keyword: str) -> str:
+    """Return the leading letters/digits of a plain keyword."""
+    match = re.match(r"[a-z0-9]+", keyword)
+    return match.group(0) if match else ""
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """Build a regex alternation shaped like a trie.
+
+    The regex always prefers the longest trigger at a position, and all
+    shorter triggers on the same path are prefixes of it.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        end = "" in node
+        branches = [re.escape(c) + build(child) for c, child in sorted(node.items()) if c]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if end:
+            return f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+@lru_cache(maxsize=4096)
+def word_set(text: str) -> frozenset[str]:
+    """Lowercase [a-z0-9]+ tokens of a text (cached for repeated titles)."""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+
+class KeywordEngine:
+    """Match many named keyword lists against a text in a single scan.
+
+    Usage:
+        engine = KeywordEngine()
+        engine.add_patterns("fishing", [r"\\btrout\\b", r"\\bfly rod"])
+        engine.add_words("species", {"trout", "bass"})
+        engine.scan("Big trout on a new fly rod")
+        # {"fishing": 2, "species": 1}
+    """
+
+    def __init__(self):
+        self._names: list[str] = []
+        # Each entry: (list name, keyword, matcher) where matcher(text, pos)
+        self._entries: list[tuple[str, str, object]] = []
+        self._word_start: dict[str, list[int]] = defaultdict(list)
+        self._anywhere: dict[str, list[int]] = defaultdict(list)
+        self._always: list[int] = []
+        self._words: dict[str, list[str]] = defaultdict(list)
+        self._compiled = False
+
+    def add_patterns(self, name: str, patterns: Iterable[str]) -> None:
+        """Add a list of regexes, matched case-insensitively anywhere."""
+        self._register(name)
+        for pattern in patterns:
+            compiled = re.compile(pattern, re.IGNORECASE)
+            trigger = _pattern_trigger(pattern)
+            if trigger:
+                self._add_entry(name, pattern, compiled.match, self._word_start[trigger])
+            else:
+                self._add_entry(name, pattern, lambda text, pos, c=compiled: c.search(text), self._always)
+
+    def add_substrings(self, name: str, keywords: Iterable[str]) -> None:
+        """Add plain keywords matched as substrings of the lowercased text."""
+        self._register(name)
+        for keyword in keywords:
+            keyword = keyword.lower()
+            trigger = _substring_trigger(keyword)
+            if trigger:
+                self._add_entry(name, keyword, lambda text, pos, k=keyword: text.startswith(k, pos),
+                                self._anywhere[trigger])
+            else:
+                self._add_entry(name, keyword, lambda text, pos, k=keyword: k in text, self._always)
+
+    def add_words(self, name: str, words: Iterable[str]) -> None:
+        """Add whole-word keywords matched against [a-z0-9]+ tokens."""
+        self._register(name)
+        for word in words:
+            self._words[word.lower()].append(name)
+
+    def _register(self, name: str) -> None:
+        if name not in self._names:
+            self._names.append(name)
+        self._compiled = False
+
+    def _add_entry(self, name: str, keyword: str, matcher, bucket: list[int]) -> None:
+        bucket.append(len(self._entries))
+        self._entries.append((name, keyword, matcher))
+
+    def _compile(self) -> None:
+        """Build the trigger scanners and prefix closures."""
+        def closure(triggers: dict[str, list[int]]) -> dict[str, list[int]]:
+            # A hit on a trigger also implies every shorter trigger that is a prefix of it
+            return {
+                t: [i for p, ids in triggers.items() if t.startswith(p) for i in ids]
+                for t in triggers
+            }
+
+        self._word_start_re = (
+            re.compile(r"\b(" + _trie_regex(self._word_start) + ")") if self._word_start else None
+        )
+        self._anywhere_re = (
+            re.compile("(?=(" + _trie_regex(self._anywhere) + "))") if self._anywhere else None
+        )
+        self._word_start_hits = closure(self._word_start)
+        self._anywhere_hits = closure(self._anywhere)
+        self._compiled = True
+
+    def match(self, text: str) -> dict[str, set[str]]:
+        """Return the keywords from each list that occur in text.
+
+        Args:
+            text: Text to scan (lowercased internally)
+
+        Returns:
+            Dict mapping every list name to the set of matching keywords
+        """
+        if not self._compiled:
+            self._compile()
+
+        text = text.lower()
+        hits: dict[str, set[str]] = {name: set() for name in self._names}
+        done: set[int] = set()
+
+        def confirm(candidates, pos):
+            for i in candidates:
+                if i in done:
+                    continue
+                name, keyword, matcher = self._entries[i]
+                if matcher(text, pos):
+                    hits[name].add(keyword)
+                    done.add(i)
+
+        if self._word_start_re:
+            for m in self._word_start_re.finditer(text):
+                confirm(self._word_start_hits[m.group(1)], m.start())
+        if self._anywhere_re:
+            for m in self._anywhere_re.finditer(text):
+                confirm(self._anywhere_hits[m.group(1)], m.start())
+        confirm(self._always, 0)
+
+        if self._words:
+            for word in word_set(text):
+                for name in self._words.get(word, ()):
+                    hits[name].add(word)
+
+        return hits
+
+    def scan(self, text: str) -> dict[str, int]:
+        """Return how many distinct keywords from each list occur in text."""
+        return {name: len(found) for name, found in self.match(text).items()}
+
+    def scan_many(self, texts: Iterable[str]) -> list[dict[str, int]]:
+        """Score a batch of documents (e.g. a backfill) in order."""
+        return [self.scan(text) for text in texts]
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> KeywordEngine:
+    """Return the engine holding every keyword list used by the pipeline.
+
+    List names:
+        fishing, exclude: fetcher.FISHING_KEYWORDS / EXCLUDE_KEYWORDS
+        tag:<group>: tagger.TAG_KEYWORDS
+        category:<name>: theme_extractor.CATEGORY_KEYWORDS
+    """
+    from .fetcher import EXCLUDE_KEYWORDS, FISHING_KEYWORDS
+    from .tagger import TAG_KEYWORDS
+    from .theme_extractor import CATEGORY_KEYWORDS
+
+    engine = KeywordEngine()
+    engine.add_patterns("fishing", FISHING_KEYWORDS)
+    engine.add_patterns("exclude", EXCLUDE_KEYWORDS)
+    for group, keywords in TAG_KEYWORDS.items():
+        engine.add_substrings(f"tag:{group}", keywords)
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        engine.add_words(f"category:{category}", keywords)
+    return engine
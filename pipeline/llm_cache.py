@@ -0,0 +1,188 @@
+"""Content-addressed on-disk cache for OpenAI chat completions.
+
+Responses are keyed by a SHA-256 of the request (model, messages and all
+other parameters), so re-running the pipeline on identical input (a
+retried CI job, a --fresh rebuild, a re-run digest) reuses earlier answers
+instead of paying for them again.
+
+Entries expire after a TTL and the cache is kept under a byte budget by
+evicting least-recently-used entries.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from .llm_executor import create_chat_completion
+
+
+CACHE_DB_PATH = Path(__file__).parent.parent / "data" / "cache" / "llm.sqlite3"
+
+# Entries older than this are treated as misses
+TTL_SECONDS = 30 * 24 * 3600
+
+# Evict least-recently-used entries beyond this many bytes of responses
+MAX_CACHE_BYTES = 50 * 1024 * 1024
+
+
+def cache_key(**request) -> str:
+    """Hash a chat completion request into a stable cache key."""
+    payload = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """SQLite-backed response cache with TTL and size-bounded LRU eviction.
+
+    Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        path: Path = CACHE_DB_PATH,
+        ttl_seconds: int = TTL_SECONDS,
+        max_bytes: int = MAX_CACHE_BYTES,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                   key TEXT PRIMARY KEY,
+                   value TEXT NOT NULL,
+                   size INTEGER NOT NULL,
+                   created REAL NOT NULL,
+                   last_used REAL NOT NULL
+               )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, or None on a miss or expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, value: str) -> None:
+        """Store a response."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value.encode("utf-8")), now, now),
+            )
+            self._conn.commit()
+
+    def evict(self) -> int:
+        """Drop expired entries, then LRU entries until under the byte budget.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            cutoff = time.time() - self.ttl_seconds
+            removed = self._conn.execute(
+                "DELETE FROM responses WHERE created < ?", (cutoff,)
+            ).rowcount
+
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                stale = []
+                for key, size in self._conn.execute(
+                    "SELECT key, size FROM responses ORDER BY last_used"
+                ):
+                    if total <= self.max_bytes:
+                        break
+                    stale.append((key,))
+                    total -= size
+                self._conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+                removed += len(stale)
+
+            self._conn.commit()
+            return removed
+
+    def close(self) -> None:
+        """Evict, checkpoint and close the database."""
+        self.evict()
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.close()
+
+
+_cache: Optional[LLMCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> LLMCache:
+    """Return the process-wide cache, opening it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMCache()
+        return _cache
+
+
+def cached_chat_completion(client, validate: Optional[Callable[[str], object]] = None, **request) -> str:
+    """Run a chat completion through the cache.
+
+    Args:
+        client: OpenAI client used on a miss (rate-limited and retried)
+        validate: Optional check run on a fresh response before caching
+            it (e.g. json.loads); if it raises, nothing is stored
+        **request: Arguments for client.chat.completions.create
+
+    Returns:
+        The message content of the (possibly cached) response
+    """
+    cache = get_cache()
+    key = cache_key(**request)
+
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    response = create_chat_completion(client, **request)
+    content = response.choices[0].message.content
+    if validate is not None:
+        validate(content)
+    if content:
+        cache.put(key, content)
+    return content
+
+
+def report_cache_stats() -> None:
+    """Print hit/miss counters for this run and trim the cache."""
+    if _cache is None:
+        return
+    total = _cache.hits + _cache.misses
+    rate = (_cache.hits / total * 100) if total else 0
+    removed = _cache.evict()
+    print(f"LLM cache: {_cache.hits} hits, {_cache.misses} misses ({rate:.0f}% hit rate), "
+          f"{removed} entries evicted")
@@ -0,0 +1,154 @@
+"""Shared OpenAI client, rate limits and concurrent execution for LLM calls.
+
+Every OpenAI request in the pipeline goes through this module:
+
+- one pooled OpenAI client instead of a new client per call
+- token buckets for requests-per-minute, tokens-per-minute and DALL-E
+  images-per-minute, shared across threads
+- retries on rate limits and transient errors, honoring Retry-After
+- a thread pool (run_concurrently) for independent calls
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional, TypeVar
+
+import httpx
+import openai
+from openai import OpenAI
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from .ratelimit import TokenBucket
+
+
+# Account limits (override per deployment with env vars)
+REQUESTS_PER_MINUTE = int(os.environ.get("OPENAI_RPM", 500))
+TOKENS_PER_MINUTE = int(os.environ.get("OPENAI_TPM", 200_000))
+IMAGES_PER_MINUTE = int(os.environ.get("OPENAI_IMAGES_PER_MINUTE", 5))
+
+# Concurrent LLM calls
+MAX_WORKERS = 8
+
+# Errors worth retrying: 429s, timeouts, dropped connections and 5xx
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+request_bucket = TokenBucket(REQUESTS_PER_MINUTE)
+token_bucket = TokenBucket(TOKENS_PER_MINUTE)
+image_bucket = TokenBucket(IMAGES_PER_MINUTE)
+
+_client: Optional[OpenAI] = None
+_client_lock = threading.Lock()
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def get_openai_client() -> Optional[OpenAI]:
+    """Get the shared OpenAI client if an API key is available."""
+    global _client
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        return None
+    with _client_lock:
+        if _client is None:
+            _client = OpenAI(
+                api_key=api_key,
+                max_retries=0,  # retries are handled below, with rate limiting
+                http_client=httpx.Client(
+                    timeout=httpx.Timeout(120, connect=10),
+                    limits=httpx.Limits(max_connections=MAX_WORKERS * 2,
+                                        max_keepalive_connections=MAX_WORKERS),
+                ),
+            )
+        return _client
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Read Retry-After (or retry-after-ms) from an OpenAI error response."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    return None
+
+
+_backoff = wait_exponential(multiplier=1, min=2, max=30)
+
+
+def _wait_for_retry(retry_state) -> float:
+    """Tenacity wait: the server's Retry-After if given, else exponential."""
+    error = retry_state.outcome.exception()
+    delay = retry_after_seconds(error)
+    if delay is None:
+        return _backoff(retry_state)
+    if isinstance(error, openai.RateLimitError):
+        # Hold every other thread back too
+        request_bucket.drain(delay)
+    return delay
+
+
+def estimate_request_tokens(request: dict) -> int:
+    """Approximate prompt + completion tokens for the TPM budget."""
+    prompt_chars = sum(len(str(m.get("content", ""))) for m in request.get("messages", []))
+    return prompt_chars // 4 + request.get("max_tokens", 256)
+
+
+@retry(
+    retry=retry_if_exception_type(RETRYABLE_ERRORS),
+    stop=stop_after_attempt(5),
+    wait=_wait_for_retry,
+    reraise=True,
+)
+def create_chat_completion(client: OpenAI, **request):
+    """Rate-limited chat completion with retries on transient errors."""
+    request_bucket.acquire()
+    token_bucket.acquire(estimate_request_tokens(request))
+    return client.chat.completions.create(**request)
+
+
+@retry(
+    retry=retry_if_exception_type(RETRYABLE_ERRORS),
+    stop=stop_after_attempt(3),
+    wait=_wait_for_retry,
+    reraise=True,
+)
+def create_image(client: OpenAI, **request):
+    """Rate-limited image generation (DALL-E) with retries."""
+    image_bucket.acquire()
+    request_bucket.acquire()
+    return client.images.generate(**request)
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the shared thread pool for LLM calls."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="llm")
+        return _executor
+
+
+def run_concurrently(fn: Callable[[T], R], items: Iterable[T]) -> list[R]:
+    """Apply fn to every item on the LLM thread pool.
+
+    Results come back in input order. fn is expected to handle its own
+    errors (the pipeline's LLM helpers all fall back on failure).
+    """
+    return list(get_executor().map(fn, items))
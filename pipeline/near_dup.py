@@ -0,0 +1,78 @@
+"""SimHash fingerprints for spotting the same story under different URLs."""
+
+import hashlib
+import re
+from collections import Counter
+from typing import Optional
+
+
+# Fingerprint size and LSH banding. With 4 bands of 16 bits, any two
+# fingerprints within MAX_DISTANCE=3 bits share at least one whole band.
+FINGERPRINT_BITS = 64
+BANDS = 4
+BAND_BITS = FINGERPRINT_BITS // BANDS
+MAX_DISTANCE = 3
+
+# Texts with fewer tokens are too short to fingerprint reliably
+# ("First trout!" posted by two different people is not a duplicate)
+MIN_TOKENS = 8
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_URL_RE = re.compile(r"https?://\S+")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_BOILERPLATE_RE = re.compile(r"the post .+ appeared first on .+", re.IGNORECASE)
+
+
+def normalize_text(title: str, description: str) -> list[str]:
+    """Lowercase, strip HTML/URLs/feed boilerplate and tokenize."""
+    text = f"{title} {description}"
+    text = _TAG_RE.sub(" ", text)
+    text = _BOILERPLATE_RE.sub(" ", text)
+    text = _URL_RE.sub(" ", text)
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _feature_hash(feature: str) -> int:
+    """Stable 64-bit hash (Python's hash() is randomized per process)."""
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(tokens: list[str]) -> int:
+    """Compute a 64-bit SimHash over word unigrams and bigrams."""
+    features = Counter(tokens)
+    features.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+
+    weights = [0] * FINGERPRINT_BITS
+    for feature, count in features.items():
+        h = _feature_hash(feature)
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += count if (h >> bit) & 1 else -count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def article_fingerprint(title: str, description: str) -> Optional[int]:
+    """Fingerprint an article's normalized title and description.
+
+    Returns:
+        64-bit SimHash, or None if the text is too short to compare
+    """
+    tokens = normalize_text(title, description)
+    if len(tokens) < MIN_TOKENS:
+        return None
+    return simhash(tokens)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return (a ^ b).bit_count()
+
+
+def fingerprint_bands(fingerprint: int) -> list[int]:
+    """Split a fingerprint into BANDS integers of BAND_BITS bits each."""
+    mask = (1 << BAND_BITS) - 1
+    return [(fingerprint >> (i * BAND_BITS)) & mask for i in range(BANDS)]
@@ -0,0 +1,57 @@
+"""Thread-safe token-bucket rate limiter."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `rate` tokens per `per` seconds.
+
+    acquire() blocks until enough tokens are available, so callers on many
+    threads share one budget (e.g. requests per minute to an API).
+
+    Usage:
+        rpm = TokenBucket(rate=500, per=60)
+        rpm.acquire()        # one request
+        tpm.acquire(1200)    # 1,200 tokens
+    """
+
+    def __init__(self, rate: float, per: float = 60.0, capacity: float = None):
+        self.rate = rate
+        self.per = per
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate / self.per)
+        self._updated = now
+
+    def acquire(self, amount: float = 1) -> float:
+        """Take `amount` tokens, waiting for them if necessary.
+
+        Requests larger than the bucket are clamped to its capacity so they
+        wait for a full bucket instead of blocking forever.
+
+        Returns:
+            Seconds spent waiting
+        """
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                delay = (amount - self._tokens) * self.per / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def drain(self, seconds: float) -> None:
+        """Empty the bucket and pause refills (e.g. after a 429 Retry-After)."""
+        with self._lock:
+            self._tokens = 0
+            self._updated = max(self._updated, time.monotonic() + seconds)
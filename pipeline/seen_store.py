@@ -0,0 +1,310 @@
+"""Persistent, time-indexed store of article URLs already published.
+
+The SQLite database in data/cache is the store of record; CI keeps it
+between runs with the actions cache. Every URL is also appended to
+SEEN_LOG_PATH, a text log committed to git, so a lost cache can be
+rebuilt. The log is append-only: a run writes only its own new rows,
+and an open imports only the part of the log past the offset the
+database has already read, so neither grows with the history.
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .near_dup import BANDS, MAX_DISTANCE, fingerprint_bands, hamming_distance
+
+
+SEEN_DB_PATH = Path(__file__).parent.parent / "data" / "cache" / "seen_urls.sqlite3"
+
+# Append-only log tracked in git: url, first seen and fingerprint (hex,
+# or empty) separated by tabs, one line per row added
+SEEN_LOG_PATH = Path(__file__).parent.parent / "data" / "seen_urls.tsv"
+
+# Pre-SQLite storage, imported once if still present
+LEGACY_SEEN_PATH = Path(__file__).parent.parent / "data" / "seen_urls.json"
+
+# URLs older than this are forgotten; feeds never resurface items this old
+MAX_AGE_DAYS = 730
+
+# Bytes before the log offset stored to check the log was only appended to
+LOG_TAIL_BYTES = 256
+
+# Seconds a writer waits for another process to release the database
+BUSY_TIMEOUT = 30
+
+
+def _to_signed(value: int) -> int:
+    """Map an unsigned 64-bit fingerprint onto SQLite's signed INTEGER."""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+class SeenStore:
+    """Set-like view of seen URLs backed by SQLite.
+
+    Membership checks are single indexed lookups, so the full history never
+    has to be loaded into memory. Each URL keeps the time it was first seen
+    and eviction is by age. The database runs in WAL mode with a busy
+    timeout so several pipeline processes can write to it safely.
+
+    The store also keeps a SimHash fingerprint per published article. Each
+    fingerprint is split into LSH bands with their own index, so a
+    near-duplicate lookup only compares against rows sharing a band.
+
+    Rows added through the store are appended to the log on close; rows
+    other runs appended are imported on open.
+
+    Usage:
+        with SeenStore() as seen:
+            if url not in seen:
+                seen.add(url)
+    """
+
+    def __init__(self, path: Optional[Path] = None, log_path: Optional[Path] = None):
+        self.path = path or SEEN_DB_PATH
+        self.log_path = log_path or SEEN_LOG_PATH
+        # Rows added since opening, appended to the log on close
+        self._new_urls: dict[str, str] = {}
+        self._new_fingerprints: dict[str, tuple[int, str]] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS seen_urls (
+                   url TEXT PRIMARY KEY,
+                   first_seen TEXT NOT NULL
+               ) WITHOUT ROWID"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS seen_urls_first_seen ON seen_urls (first_seen)"
+        )
+        band_columns = ", ".join(f"band{i} INTEGER NOT NULL" for i in range(BANDS))
+        self._conn.execute(
+            f"""CREATE TABLE IF NOT EXISTS fingerprints (
+                    url TEXT PRIMARY KEY,
+                    fingerprint INTEGER NOT NULL,
+                    {band_columns},
+                    first_seen TEXT NOT NULL
+                )"""
+        )
+        for i in range(BANDS):
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS fingerprints_band{i} ON fingerprints (band{i})"
+            )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS fingerprints_first_seen ON fingerprints (first_seen)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)")
+        self._conn.commit()
+        self._import_legacy()
+        self.import_log()
+
+    def __contains__(self, url: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM seen_urls WHERE url = ?", (url,)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM seen_urls").fetchone()[0]
+
+    def add(self, url: str, seen_at: Optional[datetime] = None) -> bool:
+        """Record a URL, keeping its original first-seen time if known.
+
+        Returns:
+            True if the URL was not seen before
+        """
+        stamp = (seen_at or datetime.now()).isoformat(timespec="seconds")
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO seen_urls (url, first_seen) VALUES (?, ?)", (url, stamp)
+        )
+        if cursor.rowcount == 1:
+            self._new_urls[url] = stamp
+            return True
+        return False
+
+    def add_many(self, urls: Iterable[str], seen_at: Optional[datetime] = None) -> int:
+        """Record several URLs with the same first-seen time.
+
+        Returns:
+            Number of URLs that were new
+        """
+        seen_at = seen_at or datetime.now()
+        return sum(self.add(url, seen_at) for url in urls)
+
+    def first_seen(self, url: str) -> Optional[datetime]:
+        """Return when a URL was first seen, or None."""
+        row = self._conn.execute(
+            "SELECT first_seen FROM seen_urls WHERE url = ?", (url,)
+        ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def add_fingerprint(self, url: str, fingerprint: int, seen_at: Optional[datetime] = None) -> None:
+        """Record the content fingerprint of a published article."""
+        stamp = (seen_at or datetime.now()).isoformat(timespec="seconds")
+        if self._insert_fingerprint(url, fingerprint, stamp):
+            self._new_fingerprints[url] = (fingerprint, stamp)
+
+    def _insert_fingerprint(self, url: str, fingerprint: int, stamp: str) -> bool:
+        cursor = self._conn.execute(
+            f"""INSERT OR IGNORE INTO fingerprints
+                (url, fingerprint, {", ".join(f"band{i}" for i in range(BANDS))}, first_seen)
+                VALUES (?, ?, {", ".join("?" * BANDS)}, ?)""",
+            (url, _to_signed(fingerprint), *fingerprint_bands(fingerprint), stamp),
+        )
+        return cursor.rowcount == 1
+
+    def find_near_duplicate(self, fingerprint: int, max_distance: int = MAX_DISTANCE) -> Optional[str]:
+        """Find an earlier article whose fingerprint is within max_distance bits.
+
+        Returns:
+            URL of the oldest matching (canonical) article, or None
+        """
+        bands = fingerprint_bands(fingerprint)
+        where = " OR ".join(f"band{i} = ?" for i in range(BANDS))
+        rows = self._conn.execute(
+            f"SELECT url, fingerprint FROM fingerprints WHERE {where} ORDER BY first_seen",
+            bands,
+        )
+        for url, stored in rows:
+            if hamming_distance(fingerprint, _to_unsigned(stored)) <= max_distance:
+                return url
+        return None
+
+    def prune(self, max_age_days: int = MAX_AGE_DAYS) -> int:
+        """Forget URLs and fingerprints first seen more than max_age_days ago.
+
+        Returns:
+            Number of URLs removed
+        """
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat(timespec="seconds")
+        self._conn.execute("DELETE FROM fingerprints WHERE first_seen < ?", (cutoff,))
+        cursor = self._conn.execute("DELETE FROM seen_urls WHERE first_seen < ?", (cutoff,))
+        return cursor.rowcount
+
+    def commit(self) -> None:
+        """Flush pending writes."""
+        self._conn.commit()
+
+    def _log_offset(self) -> int:
+        """Bytes of the log already imported, or 0 if the log was replaced."""
+        meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+        offset, tail = meta.get("log_offset", 0), meta.get("log_tail", b"")
+        if offset > self.log_path.stat().st_size:
+            return 0
+        with open(self.log_path, "rb") as f:
+            f.seek(offset - len(tail))
+            return offset if f.read(len(tail)) == tail else 0
+
+    def _set_log_offset(self, offset: int) -> None:
+        with open(self.log_path, "rb") as f:
+            f.seek(max(0, offset - LOG_TAIL_BYTES))
+            tail = f.read(offset - f.tell())
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [("log_offset", offset), ("log_tail", tail)],
+        )
+
+    def import_log(self) -> int:
+        """Import the rows appended to the log since the last import.
+
+        Reads from the stored byte offset. If the log no longer ends
+        there with the bytes last read (it was replaced, e.g. by a
+        checkout that does not match the cached database), it is read
+        from the start. Rows already in the database are kept as they are.
+
+        Returns:
+            Number of URLs that were new
+        """
+        if not self.log_path.exists():
+            return 0
+        offset = self._log_offset()
+
+        urls = []
+        fingerprints = []
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Being appended by another run; read it next time
+                offset += len(line)
+                fields = line.decode("utf-8").rstrip("\n").split("\t")
+                if len(fields) != 3:
+                    continue
+                url, first_seen, fingerprint = fields
+                urls.append((url, first_seen))
+                if fingerprint:
+                    fingerprints.append((url, int(fingerprint, 16), first_seen))
+
+        before = self._conn.total_changes
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO seen_urls (url, first_seen) VALUES (?, ?)", urls
+        )
+        added = self._conn.total_changes - before
+        for url, fingerprint, first_seen in fingerprints:
+            self._insert_fingerprint(url, fingerprint, first_seen)
+        self._set_log_offset(offset)
+        self._conn.commit()
+        return added
+
+    def append_log(self) -> None:
+        """Append the rows added since opening to the log.
+
+        Rows other runs appended in the meantime are imported first, so
+        the stored offset can move past both.
+        """
+        self.import_log()
+        lines = []
+        for url, first_seen in self._new_urls.items():
+            fingerprint = self._new_fingerprints.pop(url, None)
+            lines.append((url, first_seen, fingerprint[0] if fingerprint else None))
+        for url, (fingerprint, first_seen) in self._new_fingerprints.items():
+            lines.append((url, first_seen, fingerprint))
+        if not lines:
+            return
+
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            for url, first_seen, fingerprint in lines:
+                if "\t" in url or "\n" in url:
+                    continue
+                fingerprint = "" if fingerprint is None else f"{fingerprint:016x}"
+                f.write(f"{url}\t{first_seen}\t{fingerprint}\n")
+        self._set_log_offset(self.log_path.stat().st_size)
+        self._new_urls.clear()
+        self._new_fingerprints.clear()
+
+    def close(self) -> None:
+        """Commit, append new rows to the log, fold the WAL back and close."""
+        self._conn.commit()
+        self.append_log()
+        self._conn.commit()
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._conn.close()
+
+    def __enter__(self) -> "SeenStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _import_legacy(self) -> None:
+        """Import data/seen_urls.json once, then remove it."""
+        if not LEGACY_SEEN_PATH.exists():
+            return
+        try:
+            with open(LEGACY_SEEN_PATH, encoding="utf-8") as f:
+                urls = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        self.add_many(urls)
+        self._conn.commit()
+        LEGACY_SEEN_PATH.unlink()
+        print(f"Imported {len(urls)} seen URLs from {LEGACY_SEEN_PATH.name}")
@@ -0,0 +1,152 @@
+"""Staged, concurrent processing of items through bounded queues.
+
+Each stage runs on its own pool of worker threads and hands items to the
+next stage through a bounded queue, so a slow stage holds the earlier ones
+back (backpressure) instead of letting work pile up in memory. Items
+overlap across stages: while one article is being tagged another can be
+downloading its image.
+
+Results are yielded in input order, together with the lines each stage
+logged for that item. Stage functions log through the callable they are
+given instead of printing, so the consumer can print every item's lines
+as one block and console output is the same as a serial run.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+
+# Items waiting between two stages before upstream workers block
+DEFAULT_QUEUE_SIZE = 8
+
+# Seconds a blocked worker waits before checking whether to stop
+_POLL_INTERVAL = 0.1
+
+# Marks the end of the input on a queue
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """One step of a staged pipeline.
+
+    fn takes the value produced by the previous stage (or the input item)
+    and a log callable, and returns the value for the next one. Lines
+    passed to log are kept with the item, not printed.
+    """
+    name: str
+    fn: Callable[[Any, Callable[[str], None]], Any]
+    workers: int = 1
+
+
+@dataclass
+class StageResult:
+    """Outcome of one item after all stages."""
+    index: int
+    value: Any
+    error: Optional[BaseException] = None
+    stage: Optional[str] = None  # Stage that raised, if any
+    log: list[str] = field(default_factory=list)  # Lines logged by the stages for this item
+
+
+def run_stages(
+    items: Iterable[Any],
+    stages: list[Stage],
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> Iterator[StageResult]:
+    """Run every item through the stages concurrently.
+
+    An item whose stage raises skips the remaining stages and is reported
+    with the error; other items are unaffected. If the consumer stops
+    early (break, exception or close()), the workers finish the items
+    they hold, take no new ones and are joined before this returns.
+
+    Args:
+        items: Input items
+        stages: Stages in order
+        queue_size: Capacity of each queue between stages
+
+    Yields:
+        One StageResult per item, in input order
+    """
+    queues = [queue.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    stop = threading.Event()
+
+    def put(q: queue.Queue, item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def get(q: queue.Queue) -> Any:
+        while not stop.is_set():
+            try:
+                return q.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                pass
+        return _DONE
+
+    def feed() -> None:
+        for index, item in enumerate(items):
+            if not put(queues[0], StageResult(index=index, value=item)):
+                return
+        for _ in range(stages[0].workers):
+            put(queues[0], _DONE)
+
+    def work(position: int) -> None:
+        stage = stages[position]
+        inbox, outbox = queues[position], queues[position + 1]
+        while True:
+            result = get(inbox)
+            if result is _DONE:
+                break
+            if result.error is None:
+                try:
+                    result.value = stage.fn(result.value, result.log.append)
+                except Exception as e:
+                    result.error, result.stage = e, stage.name
+            if not put(outbox, result):
+                return
+
+        # The last worker out tells the next stage the input is finished
+        with remaining_lock:
+            remaining[position] -= 1
+            last = remaining[position] == 0
+        if last:
+            next_workers = stages[position + 1].workers if position + 1 < len(stages) else 1
+            for _ in range(next_workers):
+                put(outbox, _DONE)
+
+    remaining = [stage.workers for stage in stages]
+    remaining_lock = threading.Lock()
+
+    threads = [threading.Thread(target=feed, name="stage-feed", daemon=True)]
+    for position, stage in enumerate(stages):
+        threads += [
+            threading.Thread(target=work, args=(position,), name=f"stage-{stage.name}-{n}", daemon=True)
+            for n in range(stage.workers)
+        ]
+
+    for thread in threads:
+        thread.start()
+    try:
+        # Reorder: hold early finishers until their predecessors are done
+        pending: dict[int, StageResult] = {}
+        next_index = 0
+        while True:
+            result = queues[-1].get()
+            if result is _DONE:
+                break
+            pending[result.index] = result
+            while next_index in pending:
+                yield pending.pop(next_index)
+                next_index += 1
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
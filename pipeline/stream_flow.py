@@ -0,0 +1,370 @@
+"""Prefetch USGS stream flow near the fishing-report rivers.
+
+The Local Waters widget used to query waterservices.usgs.gov from every
+visitor's browser. This stage fetches the same data once per run and
+writes it as static JSON on the fishing-report tile grid:
+
+1. Gauges: the USGS site service is queried once per grid cell within
+   SEARCH_RADIUS_MILES of a report river (cached for SITE_TTL)
+2. Flow: instantaneous discharge for all of those gauges, in requests of
+   SITES_PER_REQUEST site IDs (cached for FLOW_TTL)
+3. Stats: daily flow percentiles for the next STATS_FETCH_DAYS days,
+   in requests of STAT_SITES_PER_REQUEST sites, fetched again once
+   fewer than STATS_DAYS of them remain
+
+Output is static/data/stream-flow/tiles/{row}_{col}.json per cell plus
+manifest.json listing every covered cell. Cells with no gauges are
+listed too, so the widget can tell "no gauges nearby" apart from "not
+prefetched" and only goes to USGS live for the latter.
+
+Set USGS_BASE_URL to run against another server, such as the stand-in
+in scripts/usgs_standin.py.
+
+Usage:
+    python -m pipeline.stream_flow
+    USGS_BASE_URL=http://127.0.0.1:8797/nwis python -m pipeline.stream_flow --output /tmp/flow
+"""
+
+import argparse
+import json
+import math
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .fishing_reports import REPORTS_PATH, TILE_DEGREES, load_reports
+from .transport import get_client
+
+
+USGS_BASE_URL = os.environ.get("USGS_BASE_URL", "https://waterservices.usgs.gov/nwis").rstrip("/")
+
+OUTPUT_DIR = REPORTS_PATH.parent / "stream-flow"
+CACHE_PATH = Path(__file__).parent.parent / "data" / "cache" / "stream_flow.json"
+
+# Gauges within this distance of a river are prefetched (the widget's
+# search radius)
+SEARCH_RADIUS_MILES = 50
+
+# USGS discharge parameter code (cubic feet per second)
+DISCHARGE = "00060"
+
+# Site IDs per request; the IV service takes long site lists, the
+# statistics service at most 10
+SITES_PER_REQUEST = 100
+STAT_SITES_PER_REQUEST = 10
+
+# Gauges rarely change, flow does. Percentiles are published for the
+# next STATS_DAYS days (the tiles may be served that long) and fetched
+# for STATS_FETCH_DAYS, so they are requested about once a week
+SITE_TTL = timedelta(days=7)
+FLOW_TTL = timedelta(minutes=15)
+STATS_DAYS = 7
+STATS_FETCH_DAYS = 14
+
+PERCENTILES = ("p10", "p25", "p50", "p75", "p90")
+
+
+def load_cache() -> dict:
+    """Load cached sites, flow and stats from data/cache/stream_flow.json."""
+    cache = {"sites": {}, "flow": {}, "stats": {}}
+    if CACHE_PATH.exists():
+        try:
+            with open(CACHE_PATH, encoding="utf-8") as f:
+                cache.update(json.load(f))
+        except (json.JSONDecodeError, OSError):
+            pass
+    return cache
+
+
+def save_cache(cache: dict) -> None:
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+
+
+def _now() -> str:
+    """Current time as a UTC ISO timestamp the widget can parse unambiguously."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _utc(timestamp: str) -> datetime:
+    # Caches written before timestamps carried an offset hold local time
+    return datetime.fromisoformat(timestamp).astimezone(timezone.utc)
+
+
+def _fresh(fetched: Optional[str], ttl: timedelta) -> bool:
+    return bool(fetched) and datetime.now(timezone.utc) - _utc(fetched) < ttl
+
+
+def _chunks(items: list, size: int) -> Iterable[list]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def parse_rdb(text: str) -> list[dict]:
+    """Parse a USGS RDB (tab-separated) response into row dicts.
+
+    Comment lines start with '#'; the first other line holds the column
+    names and the second their formats.
+    """
+    lines = [line for line in text.splitlines() if line and not line.startswith("#")]
+    if len(lines) < 2:
+        return []
+    columns = lines[0].split("\t")
+    return [dict(zip(columns, line.split("\t"))) for line in lines[2:]]
+
+
+def tile_bounds(key: str) -> tuple[float, float, float, float]:
+    """(south, west, north, east) of a grid cell."""
+    row, col = (int(part) for part in key.split("_"))
+    return row * TILE_DEGREES, col * TILE_DEGREES, (row + 1) * TILE_DEGREES, (col + 1) * TILE_DEGREES
+
+
+def tiles_near(lat: float, lon: float, radius_miles: float = SEARCH_RADIUS_MILES) -> set[str]:
+    """Grid cells overlapping the box radius_miles around a point."""
+    lat_delta = radius_miles / 69
+    lon_delta = radius_miles / (69 * max(math.cos(math.radians(lat)), 0.01))
+    rows = range(math.floor((lat - lat_delta) / TILE_DEGREES), math.floor((lat + lat_delta) / TILE_DEGREES) + 1)
+    cols = range(math.floor((lon - lon_delta) / TILE_DEGREES), math.floor((lon + lon_delta) / TILE_DEGREES) + 1)
+    return {f"{row}_{col}" for row in rows for col in cols}
+
+
+def fetch_tile_sites(key: str) -> dict[str, dict]:
+    """Active stream gauges with instantaneous discharge in one grid cell.
+
+    Returns:
+        Dict mapping site number to 'name', 'lat' and 'lon'
+    """
+    south, west, north, east = tile_bounds(key)
+    response = get_client().get(f"{USGS_BASE_URL}/site/", params={
+        "format": "rdb",
+        "bBox": f"{west},{south},{east},{north}",
+        "parameterCd": DISCHARGE,
+        "siteType": "ST",
+        "siteStatus": "active",
+        "hasDataTypeCd": "iv",
+    })
+    # The site service answers 404 when nothing matches
+    if response.status_code == 404:
+        return {}
+    response.raise_for_status()
+
+    sites = {}
+    for row in parse_rdb(response.text):
+        try:
+            sites[row["site_no"]] = {
+                "name": row["station_nm"],
+                "lat": float(row["dec_lat_va"]),
+                "lon": float(row["dec_long_va"]),
+            }
+        except (KeyError, ValueError):
+            continue
+    return sites
+
+
+def fetch_flow(site_codes: list[str]) -> dict[str, dict]:
+    """Latest discharge for gauges, SITES_PER_REQUEST sites per request.
+
+    Returns:
+        Dict mapping site number to 'flow' (cfs) and 'time' (ISO 8601)
+    """
+    values = {}
+    for batch in _chunks(site_codes, SITES_PER_REQUEST):
+        response = get_client().get(f"{USGS_BASE_URL}/iv/", params={
+            "format": "json",
+            "sites": ",".join(batch),
+            "parameterCd": DISCHARGE,
+            "siteStatus": "active",
+        })
+        if response.status_code == 404:
+            continue
+        response.raise_for_status()
+
+        for series in response.json().get("value", {}).get("timeSeries", []):
+            try:
+                code = series["sourceInfo"]["siteCode"][0]["value"]
+                no_data = series["variable"].get("noDataValue")
+                latest = series["values"][0]["value"][-1]
+                flow = float(latest["value"])
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue
+            if flow < 0 or flow == no_data:
+                continue
+            values[code] = {"flow": flow, "time": latest["dateTime"]}
+    return values
+
+
+def fetch_stats(site_codes: list[str], days: Iterable[str]) -> dict[str, dict]:
+    """Daily discharge percentiles for the given month-days ("MM-DD").
+
+    Returns:
+        Dict mapping site number to {month-day: [p10, p25, p50, p75, p90]}
+    """
+    wanted = set(days)
+    stats: dict[str, dict] = {}
+    for batch in _chunks(site_codes, STAT_SITES_PER_REQUEST):
+        response = get_client().get(f"{USGS_BASE_URL}/stat/", params={
+            "format": "rdb",
+            "sites": ",".join(batch),
+            "statReportType": "daily",
+            "statTypeCd": ",".join(PERCENTILES),
+            "parameterCd": DISCHARGE,
+        })
+        if response.status_code == 404:
+            continue
+        response.raise_for_status()
+
+        for row in parse_rdb(response.text):
+            try:
+                day = f"{int(row['month_nu']):02d}-{int(row['day_nu']):02d}"
+                if day not in wanted:
+                    continue
+                percentiles = [float(row[f"{p}_va"]) for p in PERCENTILES]
+            except (KeyError, ValueError):
+                continue
+            # Sites with several time series: keep the first
+            stats.setdefault(row["site_no"], {}).setdefault(day, percentiles)
+    return stats
+
+
+def upcoming_days(count: int) -> list[str]:
+    today = datetime.now()
+    return [(today + timedelta(days=i)).strftime("%m-%d") for i in range(count)]
+
+
+def refresh(cache: dict, tiles: set[str]) -> dict[str, dict]:
+    """Bring cached sites, flow and stats for the given cells up to date.
+
+    Returns:
+        Dict mapping every covered cell to its gauges (site number to
+        site info)
+    """
+    site_cache = cache["sites"]
+    stale = sorted(key for key in tiles if not _fresh(site_cache.get(key, {}).get("fetched"), SITE_TTL))
+    for key in stale:
+        try:
+            site_cache[key] = {"fetched": _now(),
+                               "sites": fetch_tile_sites(key)}
+        except Exception as e:
+            print(f"  Error fetching gauges for cell {key}: {e}")
+    print(f"  Gauge lists: {len(stale)} cells fetched, {len(tiles) - len(stale)} cached")
+
+    tile_sites = {key: site_cache[key]["sites"] for key in tiles if key in site_cache}
+    codes = sorted({code for sites in tile_sites.values() for code in sites})
+
+    # Gauges that reported no current value (ice, outages) are absent
+    # from values, so freshness is judged by the gauges that were asked
+    flow = cache["flow"]
+    if _fresh(flow.get("fetched"), FLOW_TTL) and set(codes) <= set(flow.get("checked", [])):
+        print(f"  Flow: {len(codes)} gauges cached")
+    else:
+        try:
+            cache["flow"] = {"fetched": _now(),
+                             "checked": codes,
+                             "values": fetch_flow(codes)}
+            print(f"  Flow: {len(cache['flow']['values'])} of {len(codes)} gauges reporting "
+                  f"({math.ceil(len(codes) / SITES_PER_REQUEST)} requests)")
+        except Exception as e:
+            print(f"  Error fetching flow: {e}")
+
+    # Gauges without percentiles are not asked again until the days
+    # requested for them run out
+    needed = set(upcoming_days(STATS_DAYS))
+    stats = cache["stats"]
+    missing = [code for code in codes if not needed <= set(stats.get(code, {}).get("checked", []))]
+    if missing:
+        try:
+            days = upcoming_days(STATS_FETCH_DAYS)
+            fetched = fetch_stats(missing, days)
+            for code in missing:
+                stats[code] = {"checked": days, "days": fetched.get(code, {})}
+            print(f"  Stats: {len(missing)} gauges fetched "
+                  f"({math.ceil(len(missing) / STAT_SITES_PER_REQUEST)} requests)")
+        except Exception as e:
+            print(f"  Error fetching stats: {e}")
+
+    return tile_sites
+
+
+def write_tiles(cache: dict, tile_sites: dict[str, dict], output_dir: Path = OUTPUT_DIR) -> dict:
+    """Write one JSON file per cell with gauges, plus the manifest.
+
+    Each gauge carries its latest flow and the percentiles for the next
+    STATS_DAYS days, from which the widget grades today's flow.
+
+    Returns:
+        The manifest
+    """
+    values = cache["flow"].get("values", {})
+    days = upcoming_days(STATS_DAYS)
+    tiles_dir = output_dir / "tiles"
+    tiles_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest_tiles = {}
+    written = set()
+    for key, sites in sorted(tile_sites.items()):
+        gauges = []
+        for code, site in sorted(sites.items()):
+            if code not in values:
+                continue
+            gauge = {"code": code, **site, **values[code]}
+            percentiles = cache["stats"].get(code, {}).get("days", {})
+            if any(day in percentiles for day in days):
+                gauge["stats"] = {day: percentiles[day] for day in days if day in percentiles}
+            gauges.append(gauge)
+
+        manifest_tiles[key] = {"count": len(gauges)}
+        if gauges:
+            with open(tiles_dir / f"{key}.json", "w") as f:
+                json.dump({"sites": gauges}, f, separators=(",", ":"))
+            written.add(key)
+
+    for path in tiles_dir.glob("*.json"):
+        if path.stem not in written:
+            path.unlink()
+
+    flow_fetched = cache["flow"].get("fetched")
+    manifest = {
+        "generated": _now(),
+        "flow_fetched": _utc(flow_fetched).isoformat() if flow_fetched else None,
+        "count": sum(tile["count"] for tile in manifest_tiles.values()),
+        "tile_degrees": TILE_DEGREES,
+        "tiles": manifest_tiles,
+    }
+    with open(output_dir / "manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def prefetch_stream_flow(output_dir: Path = OUTPUT_DIR) -> dict:
+    """Fetch flow for gauges near every report river and write the tiles.
+
+    Returns:
+        The manifest
+    """
+    reports = load_reports(REPORTS_PATH)
+    tiles = set()
+    for report in reports:
+        tiles |= tiles_near(report["lat"], report["lon"])
+    print(f"Prefetching stream flow for {len(reports)} rivers ({len(tiles)} grid cells)")
+
+    cache = load_cache()
+    tile_sites = refresh(cache, tiles)
+    save_cache(cache)
+
+    manifest = write_tiles(cache, tile_sites, output_dir)
+    print(f"Saved {manifest['count']} gauges in {len(manifest['tiles'])} cells to {output_dir}")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prefetch USGS stream flow near report rivers")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR,
+                        help="Directory for manifest.json and tiles/ (default static/data/stream-flow)")
+    args = parser.parse_args()
+    prefetch_stream_flow(args.output)
+
+
+if __name__ == "__main__":
+    main()
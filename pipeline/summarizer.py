@@ -1,32 +1,21 @@
 """AI-powered article summarization using OpenAI."""
 
-import os
 import re
-from typing import Optional
+from typing import Callable
 
-from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+from .llm_cache import cached_chat_completion
+from .llm_executor import create_chat_completion, get_openai_client
 
 
-def get_openai_client() -> Optional[OpenAI]:
-    """Get OpenAI client if API key is available."""
-    api_key = os.environ.get("OPENAI_API_KEY")
-    if not api_key:
-        return None
-    return OpenAI(api_key=api_key)
-
-
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10)
-)
-def summarize_article(title: str, description: str, source_name: str) -> str:
+def summarize_article(title: str, description: str, source_name: str,
+                      log: Callable[[str], None] = print) -> str:
     """Generate an engaging 2-3 sentence summary of an article.
 
     Args:
         title: Article title
         description: Article description or excerpt
         source_name: Name of the source publication
+        log: Where to report errors (a pipeline stage passes its item log)
 
     Returns:
         AI-generated summary or fallback to cleaned description
@@ -41,7 +30,8 @@ def summarize_article(title: str, description: str, source_name: str) -> str:
         return clean_description(description) if description else f"Read more about {title}."
 
     try:
-        response = client.chat.completions.create(
+        summary = cached_chat_completion(
+            client,
             model="gpt-4o-mini",
             messages=[
                 {
@@ -71,15 +61,13 @@ Style:
             temperature=0.7
         )
 
-        summary = response.choices[0].message.content.strip()
-
         # Clean up any quotes the model might add
-        summary = summary.strip('"')
+        summary = summary.strip().strip('"')
 
         return summary
 
     except Exception as e:
-        print(f"Error summarizing article: {e}")
+        log(f"Error summarizing article: {e}")
         return clean_description(description)
 
 
@@ -131,7 +119,8 @@ def generate_editorial_intro(articles: list, theme: str) -> str:
     )
 
     try:
-        response = client.chat.completions.create(
+        response = create_chat_completion(
+            client,
             model="gpt-4o-mini",
             messages=[
                 {
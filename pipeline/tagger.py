@@ -1,11 +1,11 @@
 """AI-powered tagging system for fishing articles."""
 
-import os
 import re
-from typing import Optional
+from typing import Callable
 
-from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+from .keywords import get_engine
+from .llm_cache import cached_chat_completion
+from .llm_executor import get_openai_client
 
 
 # Available tags for the fly fishing site
@@ -55,25 +55,43 @@ TAG_DESCRIPTIONS = {
 }
 
 
-def get_openai_client() -> Optional[OpenAI]:
-    """Get OpenAI client if API key is available."""
-    api_key = os.environ.get("OPENAI_API_KEY")
-    if not api_key:
-        return None
-    return OpenAI(api_key=api_key)
+# Keyword groups for fallback tagging (substring matches on lowercased text).
+# Most groups map straight to a tag; "bass" and "bass-context" together
+# drive the bass species rule in keyword_tag.
+TAG_KEYWORDS = {
+    "freshwater": ["bass", "trout", "walleye", "crappie", "bluegill", "catfish",
+                   "pike", "musky", "lake", "river", "pond", "stream"],
+    "saltwater": ["ocean", "offshore", "inshore", "tarpon", "tuna", "marlin",
+                  "snook", "redfish", "grouper", "snapper", "saltwater", "gulf",
+                  "coastal", "beach", "reef"],
+    "fly-fishing": ["fly fishing", "fly-fishing", "flyfishing", "fly rod", "fly tying",
+                    "nymph", "dry fly", "streamer"],
+    "gear": ["rod", "reel", "lure", "tackle", "gear", "review", "test"],
+    "techniques": ["how to", "tip", "technique", "tutorial", "rig", "cast"],
+    "travel": ["destination", "lodge", "trip", "travel", "guide service"],
+    "news": ["tournament", "record", "regulation", "news", "announce"],
+    "conservation": ["conservation", "habitat", "release", "sustainable"],
+    "bass": ["bass"],
+    "bass-context": ["largemouth", "smallmouth", "bass fish"],
+    "trout": ["trout"],
+    "redfish": ["redfish", "red drum"],
+    "tarpon": ["tarpon"],
+}
+
+# Groups that become a tag of the same name whenever any keyword matches
+_DIRECT_TAG_GROUPS = ["freshwater", "saltwater", "fly-fishing", "gear", "techniques",
+                      "travel", "news", "conservation", "trout", "redfish", "tarpon"]
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10)
-)
-def ai_tag(title: str, description: str, source_name: str = "") -> list[str]:
+def ai_tag(title: str, description: str, source_name: str = "",
+           log: Callable[[str], None] = print) -> list[str]:
     """Use AI to intelligently tag an article.
 
     Args:
         title: Article title
         description: Article description or content
         source_name: Source publication name
+        log: Where to report errors (a pipeline stage passes its item log)
 
     Returns:
         List of relevant tags (2-5 tags)
@@ -88,7 +106,8 @@ def ai_tag(title: str, description: str, source_name: str = "") -> list[str]:
     tag_context = "\n".join(f"- {tag}: {desc}" for tag, desc in TAG_DESCRIPTIONS.items())
 
     try:
-        response = client.chat.completions.create(
+        tag_text = cached_chat_completion(
+            client,
             model="gpt-4o-mini",
             messages=[
                 {
@@ -117,7 +136,7 @@ Rules:
         )
 
         # Parse response
-        tag_text = response.choices[0].message.content.strip().lower()
+        tag_text = tag_text.strip().lower()
         tags = [t.strip() for t in tag_text.split(",")]
 
         # Validate tags - only keep valid ones
@@ -130,52 +149,19 @@ Rules:
         return valid_tags[:5]  # Max 5 tags
 
     except Exception as e:
-        print(f"AI tagging error: {e}")
+        log(f"AI tagging error: {e}")
         return keyword_tag(title, description, source_name)
 
 
 def keyword_tag(title: str, description: str, source_name: str = "") -> list[str]:
     """Fallback keyword-based tagging when AI is unavailable."""
     text = f"{title} {description} {source_name}".lower()
-    tags = set()
-
-    # Water type
-    freshwater_kw = ["bass", "trout", "walleye", "crappie", "bluegill", "catfish",
-                     "pike", "musky", "lake", "river", "pond", "stream"]
-    saltwater_kw = ["ocean", "offshore", "inshore", "tarpon", "tuna", "marlin",
-                    "snook", "redfish", "grouper", "snapper", "saltwater", "gulf",
-                    "coastal", "beach", "reef"]
-    flyfish_kw = ["fly fishing", "fly-fishing", "flyfishing", "fly rod", "fly tying",
-                  "nymph", "dry fly", "streamer"]
-
-    if any(kw in text for kw in freshwater_kw):
-        tags.add("freshwater")
-    if any(kw in text for kw in saltwater_kw):
-        tags.add("saltwater")
-    if any(kw in text for kw in flyfish_kw):
-        tags.add("fly-fishing")
-
-    # Content type
-    if any(kw in text for kw in ["rod", "reel", "lure", "tackle", "gear", "review", "test"]):
-        tags.add("gear")
-    if any(kw in text for kw in ["how to", "tip", "technique", "tutorial", "rig", "cast"]):
-        tags.add("techniques")
-    if any(kw in text for kw in ["destination", "lodge", "trip", "travel", "guide service"]):
-        tags.add("travel")
-    if any(kw in text for kw in ["tournament", "record", "regulation", "news", "announce"]):
-        tags.add("news")
-    if any(kw in text for kw in ["conservation", "habitat", "release", "sustainable"]):
-        tags.add("conservation")
+    hits = get_engine().scan(text)
+    tags = {group for group in _DIRECT_TAG_GROUPS if hits[f"tag:{group}"]}
 
     # Species
-    if "bass" in text and ("largemouth" in text or "smallmouth" in text or "bass fish" in text):
+    if hits["tag:bass"] and hits["tag:bass-context"]:
         tags.add("bass")
-    if "trout" in text:
-        tags.add("trout")
-    if "redfish" in text or "red drum" in text:
-        tags.add("redfish")
-    if "tarpon" in text:
-        tags.add("tarpon")
 
     # Ensure at least one water type tag
     if not tags.intersection({"freshwater", "saltwater", "fly-fishing"}):
@@ -184,9 +170,10 @@ def keyword_tag(title: str, description: str, source_name: str = "") -> list[str
     return sorted(list(tags))[:5]
 
 
-def auto_tag(title: str, description: str, source_name: str = "") -> list[str]:
+def auto_tag(title: str, description: str, source_name: str = "",
+             log: Callable[[str], None] = print) -> list[str]:
     """Main entry point for tagging - uses AI if available, falls back to keywords."""
-    return ai_tag(title, description, source_name)
+    return ai_tag(title, description, source_name, log)
 
 
 def get_primary_tag(tags: list[str]) -> str:
@@ -1,21 +1,31 @@
 """AI-powered theme extraction for cross-article analysis."""
 
-import hashlib
 import json
 import logging
 import os
 import re
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
-import httpx
-from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+from .article_index import ArticleIndex
+from .checkpoint import Checkpoint, prune_checkpoints
+from .image_extractor import PLACEHOLDER_IMAGE
+from .image_variants import ResponsiveImage, download_image, encode_variants, image_stem
+from .keywords import get_engine, word_set
+from .llm_cache import cached_chat_completion
+from .llm_executor import create_image, get_openai_client
+from .stages import Stage, run_stages
 
 logger = logging.getLogger(__name__)
 
+THEMES_DIR = Path(__file__).parent.parent / "content" / "themes"
+
+# Themes generated concurrently (DALL-E is further limited per minute)
+THEME_WORKERS = 5
+
 # ---------------------------------------------------------------------------
 # Theme deduplication constants
 # ---------------------------------------------------------------------------
@@ -88,14 +98,13 @@ def classify_category(title: str, tags: list[str]) -> str:
     Returns:
         One of THEME_CATEGORIES, or "other"
     """
-    words = set(re.findall(r"[a-z0-9]+", title.lower()))
+    hits = get_engine().match(title)
     tag_words = set(t.lower() for t in tags)
-    combined = words | tag_words
 
     best_cat = "other"
     best_score = 0
     for cat, keywords in CATEGORY_KEYWORDS.items():
-        score = len(combined & keywords)
+        score = len(hits[f"category:{cat}"] | (tag_words & keywords))
         if score > best_score:
             best_score = score
             best_cat = cat
@@ -111,8 +120,7 @@ def extract_topic_keywords(title: str) -> set[str]:
     Returns:
         Set of significant lowercase keyword strings
     """
-    words = set(re.findall(r"[a-z0-9]+", title.lower()))
-    return words - STOPWORDS
+    return set(word_set(title)) - STOPWORDS
 
 
 @dataclass
@@ -124,10 +132,13 @@ class Theme:
     editorial_intro: str
     article_ids: list[str]  # List of article filenames
     tags: list[str]
-    image_path: str  # Path to generated image
+    image_path: str  # Path to generated image (JPEG fallback)
     takeaways: list[str]
     created: datetime
     author: str = ""
+    image_srcset: dict[str, str] = field(default_factory=dict)  # format -> srcset
+    image_color: str = ""  # LQIP average color
+    image_preview: str = ""  # LQIP data URI
 
 
 @dataclass
@@ -141,14 +152,6 @@ class ArticleData:
     date: datetime
 
 
-def get_openai_client() -> Optional[OpenAI]:
-    """Get OpenAI client if API key is available."""
-    api_key = os.environ.get("OPENAI_API_KEY")
-    if not api_key:
-        return None
-    return OpenAI(api_key=api_key)
-
-
 def load_personas() -> dict:
     """Load author personas from data/authors.json."""
     authors_path = Path(__file__).parent.parent / "data" / "authors.json"
@@ -193,78 +196,32 @@ def select_persona(tags: list[str]) -> dict:
 
 
 def load_recent_articles(days: int = 7) -> list[ArticleData]:
-    """Load recent articles from the content directory.
+    """Load recent articles from the article index.
+
+    The index is reconciled with content/articles first (a directory stat,
+    re-parsing only new or changed files), then queried by date.
 
     Args:
         days: Number of days to look back
 
     Returns:
-        List of ArticleData objects
+        List of ArticleData objects, newest first
     """
-    content_dir = Path(__file__).parent.parent / "content" / "articles"
-    articles = []
-
-    if not content_dir.exists():
-        return articles
-
-    for md_file in content_dir.glob("*.md"):
-        if md_file.name == "_index.md":
-            continue
-
-        try:
-            content = md_file.read_text(encoding="utf-8")
-
-            # Parse frontmatter (simple YAML parsing)
-            if content.startswith("---"):
-                parts = content.split("---", 2)
-                if len(parts) >= 3:
-                    frontmatter = parts[1]
-
-                    # Extract fields
-                    title = ""
-                    summary = ""
-                    tags = []
-                    source_name = ""
-                    date_str = ""
-
-                    for line in frontmatter.strip().split("\n"):
-                        if line.startswith("title:"):
-                            title = line.split(":", 1)[1].strip().strip('"')
-                        elif line.startswith("summary:"):
-                            summary = line.split(":", 1)[1].strip().strip('"')
-                        elif line.startswith("source_name:"):
-                            source_name = line.split(":", 1)[1].strip().strip('"')
-                        elif line.startswith("date:"):
-                            date_str = line.split(":", 1)[1].strip()
-                        elif line.strip().startswith('- "'):
-                            tag = line.strip()[3:-1]  # Remove '- "' and '"'
-                            tags.append(tag)
-
-                    # Parse date
-                    article_date = datetime.now()
-                    if date_str:
-                        try:
-                            article_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                        except:
-                            pass
-
-                    articles.append(ArticleData(
-                        filename=md_file.name,
-                        title=title,
-                        summary=summary,
-                        tags=tags,
-                        source_name=source_name,
-                        date=article_date
-                    ))
-
-        except Exception as e:
-            print(f"Error loading {md_file.name}: {e}")
-            continue
-
-    # Sort by date, newest first
-    articles.sort(key=lambda a: a.date, reverse=True)
-
-    return articles
+    with ArticleIndex() as index:
+        index.reconcile()
+        rows = index.recent(days)
+
+    return [
+        ArticleData(
+            filename=row["filename"],
+            title=row["title"],
+            summary=row["summary"],
+            tags=row["tags"],
+            source_name=row["source_name"],
+            date=row["date"]
+        )
+        for row in rows
+    ]
 
 
 def load_recent_themes(days: int = 7) -> list[dict]:
@@ -280,7 +237,7 @@ def load_recent_themes(days: int = 7) -> list[dict]:
     Returns:
         List of dicts with keys: title, tags, date, category
     """
-    themes_dir = Path(__file__).parent.parent / "content" / "themes"
+    themes_dir = THEMES_DIR
     if not themes_dir.exists():
         return []
 
@@ -337,10 +294,6 @@ def load_recent_themes(days: int = 7) -> list[dict]:
     return results
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10)
-)
 def identify_themes(articles: list[ArticleData], min_articles: int = 3, recent_themes: Optional[list[dict]] = None) -> list[dict]:
     """Use AI to identify themes across a set of articles.
 
@@ -383,7 +336,9 @@ BLOCKED topic keywords (do NOT build themes around these words):
 """
 
     try:
-        response = client.chat.completions.create(
+        content = cached_chat_completion(
+            client,
+            validate=json.loads,
             model="gpt-4o-mini",
             messages=[
                 {
@@ -434,7 +389,7 @@ Rules:
             response_format={"type": "json_object"}
         )
 
-        result = json.loads(response.choices[0].message.content)
+        result = json.loads(content)
         themes = result.get("themes", [])
 
         # Filter by quality score if present
@@ -495,11 +450,8 @@ def filter_duplicate_themes(
     return kept
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10)
-)
-def generate_theme_content(theme_title: str, theme_desc: str, articles: list[ArticleData], persona: Optional[dict] = None) -> dict:
+def generate_theme_content(theme_title: str, theme_desc: str, articles: list[ArticleData], persona: Optional[dict] = None,
+                           log: Callable[[str], None] = print) -> dict:
     """Generate editorial content for a theme.
 
     Args:
@@ -507,6 +459,7 @@ def generate_theme_content(theme_title: str, theme_desc: str, articles: list[Art
         theme_desc: Brief description
         articles: Articles in this theme
         persona: Author persona dict for voice styling
+        log: Where to report errors
 
     Returns:
         Dict with editorial_intro, enhanced_title, and takeaways
@@ -536,7 +489,9 @@ Bio: {persona['bio']}
 Write in {persona['name']}'s distinctive voice. Use first person (I, my) rather than first-person plural."""
 
     try:
-        response = client.chat.completions.create(
+        content = cached_chat_completion(
+            client,
+            validate=json.loads,
             model="gpt-4o-mini",
             messages=[
                 {
@@ -569,10 +524,10 @@ Style:
             response_format={"type": "json_object"}
         )
 
-        return json.loads(response.choices[0].message.content)
+        return json.loads(content)
 
     except Exception as e:
-        print(f"Error generating theme content: {e}")
+        log(f"Error generating theme content: {e}")
         return {
             "editorial_intro": theme_desc,
             "enhanced_title": theme_title,
@@ -580,32 +535,34 @@ Style:
         }
 
 
-@retry(
-    stop=stop_after_attempt(2),
-    wait=wait_exponential(multiplier=1, min=2, max=10)
-)
-def generate_theme_image(theme_title: str, theme_desc: str, tags: list[str]) -> str:
+def generate_theme_image(theme_title: str, theme_desc: str, tags: list[str],
+                         log: Callable[[str], None] = print) -> ResponsiveImage:
     """Generate an image for the theme using DALL-E.
 
+    The PNG is streamed down and saved as WebP variants plus a JPEG
+    fallback (see image_variants).
+
     Args:
         theme_title: Title of the theme
         theme_desc: Description of the theme
         tags: Theme tags for context
+        log: Where to report progress and errors
 
     Returns:
-        Relative path to saved image, or placeholder path
+        ResponsiveImage for the saved variants, or the placeholder
     """
     client = get_openai_client()
 
     if not client:
-        return "/images/placeholder.jpg"
+        return ResponsiveImage(src=PLACEHOLDER_IMAGE)
 
     # Create a fishing-focused image prompt
     tag_context = ", ".join(tags[:3]) if tags else "fishing"
 
     try:
         # Generate prompt for DALL-E
-        prompt_response = client.chat.completions.create(
+        image_prompt = cached_chat_completion(
+            client,
             model="gpt-4o-mini",
             messages=[
                 {
@@ -630,11 +587,12 @@ Return ONLY the prompt, nothing else. Keep it under 250 characters."""
             temperature=0.8
         )
 
-        image_prompt = prompt_response.choices[0].message.content.strip()
-        print(f"  Image prompt: {image_prompt[:60]}...")
+        image_prompt = image_prompt.strip()
+        log(f"  Image prompt: {image_prompt[:60]}...")
 
         # Generate image with DALL-E
-        image_response = client.images.generate(
+        image_response = create_image(
+            client,
             model="dall-e-3",
             prompt=image_prompt,
             size="1792x1024",  # Landscape for header
@@ -644,68 +602,85 @@ Return ONLY the prompt, nothing else. Keep it under 250 characters."""
 
         image_url = image_response.data[0].url
 
-        # Download and save image
+        # Download and save compressed variants
         static_dir = Path(__file__).parent.parent / "static" / "images" / "themes"
-        static_dir.mkdir(parents=True, exist_ok=True)
+        with download_image(image_url) as source:
+            image = encode_variants(source, static_dir, image_stem(theme_title))
 
-        # Create unique filename from theme title
-        slug = theme_title.lower()
-        slug = "".join(c if c.isalnum() or c == " " else "" for c in slug)
-        slug = "-".join(slug.split())[:30]
-        hash_suffix = hashlib.md5(theme_title.encode()).hexdigest()[:8]
-        filename = f"{slug}-{hash_suffix}.png"
+        log(f"  Generated image: {image.src}")
+        return image
 
-        # Download image
-        with httpx.Client(timeout=60) as http_client:
-            response = http_client.get(image_url)
-            response.raise_for_status()
-
-            file_path = static_dir / filename
-            file_path.write_bytes(response.content)
+    except Exception as e:
+        log(f"  Error generating image: {e}")
+        return ResponsiveImage(src=PLACEHOLDER_IMAGE)
 
-        print(f"  Generated image: {filename}")
-        return f"/images/themes/{filename}"
 
-    except Exception as e:
-        print(f"  Error generating image: {e}")
-        return "/images/placeholder.jpg"
+def theme_articles_for(theme_data: dict, articles: list[ArticleData]) -> list[ArticleData]:
+    """The articles an identified theme refers to."""
+    return [articles[i] for i in theme_data["article_indices"] if i < len(articles)]
 
 
-def create_theme_post(theme_data: dict, articles: list[ArticleData]) -> Theme:
+def create_theme_post(
+    theme_data: dict,
+    articles: list[ArticleData],
+    checkpoint: Optional[Checkpoint] = None,
+    step: str = "theme",
+    created: Optional[datetime] = None,
+    log: Callable[[str], None] = print
+) -> Theme:
     """Create a full theme post from identified theme and articles.
 
     Args:
         theme_data: Theme dict from identify_themes
         articles: Full list of articles
+        checkpoint: Run checkpoint; completed content and image steps are
+            reused from it instead of calling the APIs again
+        step: Checkpoint step prefix for this theme
+        created: Post date (defaults to now)
+        log: Where to report progress and errors
 
     Returns:
         Theme object ready to be saved
     """
+    def run_step(name, fn, keep=None):
+        return checkpoint.run(f"{step}:{name}", fn, keep) if checkpoint else fn()
+
     # Get articles for this theme
-    theme_articles = [articles[i] for i in theme_data["article_indices"] if i < len(articles)]
+    theme_articles = theme_articles_for(theme_data, articles)
 
     # Select author persona based on tags
     tags = theme_data.get("tags", [])
     persona = select_persona(tags)
-    print(f"  Author: {persona['name']} ({persona['specialty']})")
+    log(f"  Author: {persona['name']} ({persona['specialty']})")
 
-    # Generate editorial content
-    content = generate_theme_content(
+    # Generate editorial content (fallback content has no takeaways and
+    # is not checkpointed)
+    content = run_step("content", lambda: generate_theme_content(
         theme_data["title"],
         theme_data["description"],
         theme_articles,
-        persona=persona
-    )
+        persona=persona,
+        log=log
+    ), keep=lambda c: c.get("takeaways"))
 
     enhanced_title = content.get("enhanced_title", theme_data["title"])
 
-    # Generate image for the theme
-    print("  Generating header image...")
-    image_path = generate_theme_image(
-        enhanced_title,
-        theme_data["description"],
-        tags
-    )
+    # Generate image for the theme; a checkpointed image whose files are
+    # gone (fresh checkout after a failed run) is restored from the
+    # checkpoint's copies
+    log("  Generating header image...")
+
+    def make_image() -> dict:
+        image = generate_theme_image(enhanced_title, theme_data["description"], tags, log)
+        if checkpoint and image.src != PLACEHOLDER_IMAGE:
+            checkpoint.keep_files(image.files())
+        return asdict(image)
+
+    image_step = f"{step}:image"
+    if checkpoint and image_step in checkpoint:
+        if not checkpoint.restore_files(ResponsiveImage(**checkpoint.get(image_step)).files()):
+            checkpoint.save(image_step, make_image())
+    image = ResponsiveImage(**run_step("image", make_image, keep=lambda i: i["src"] != PLACEHOLDER_IMAGE))
 
     # Create slug
     slug = theme_data["title"].lower()
@@ -719,13 +694,55 @@ def create_theme_post(theme_data: dict, articles: list[ArticleData]) -> Theme:
         editorial_intro=content.get("editorial_intro", theme_data["description"]),
         article_ids=[a.filename for a in theme_articles],
         tags=tags,
-        image_path=image_path,
+        image_path=image.src,
         takeaways=content.get("takeaways", []),
-        created=datetime.now(),
-        author=persona["name"]
+        created=created or datetime.now(),
+        author=persona["name"],
+        image_srcset=image.srcset,
+        image_color=image.color,
+        image_preview=image.preview
     )
 
 
+def create_theme_posts(
+    themes: list[dict],
+    articles: list[ArticleData],
+    checkpoint: Optional[Checkpoint] = None,
+    created: Optional[datetime] = None,
+    workers: int = THEME_WORKERS
+) -> Iterator[tuple[int, Theme]]:
+    """Create theme posts concurrently (content, image prompt, DALL-E, download).
+
+    Each theme's progress output is printed as a block, in the original
+    theme order. DALL-E calls share the image rate limit in llm_executor.
+
+    Args:
+        themes: Theme dicts from identify_themes
+        articles: Full list of articles
+        checkpoint: Run checkpoint passed to create_theme_post
+        created: Post date for every theme
+        workers: Themes generated at once
+
+    Yields:
+        (index into themes, Theme) in the order of themes; themes that
+        fail are reported and skipped
+    """
+    def create(item: tuple[int, dict], log: Callable[[str], None]) -> Theme:
+        i, theme_data = item
+        return create_theme_post(theme_data, articles, checkpoint, step=f"theme-{i}", created=created, log=log)
+
+    stage = Stage("theme", create, workers)
+    with closing(run_stages(list(enumerate(themes)), [stage])) as results:
+        for result in results:
+            print(f"\nProcessing theme: {themes[result.index]['title']}")
+            for line in result.log:
+                print(line)
+            if result.error:
+                print(f"  -> Error creating theme: {result.error}")
+                continue
+            yield result.index, result.value
+
+
 def save_theme_post(theme: Theme) -> Path:
     """Save a theme as a Hugo markdown file.
 
@@ -735,7 +752,7 @@ def save_theme_post(theme: Theme) -> Path:
     Returns:
         Path to saved file
     """
-    content_dir = Path(__file__).parent.parent / "content" / "themes"
+    content_dir = THEMES_DIR
     content_dir.mkdir(parents=True, exist_ok=True)
 
     date_prefix = theme.created.strftime("%Y-%m-%d")
@@ -756,13 +773,19 @@ def save_theme_post(theme: Theme) -> Path:
     # Author line
     author_line = f'author: "{theme.author}"\n' if theme.author else ""
 
+    # Responsive image variants
+    srcset_yaml = "".join(f'  {fmt}: "{srcset}"\n' for fmt, srcset in theme.image_srcset.items())
+    srcset_block = f"image_srcset:\n{srcset_yaml}" if srcset_yaml else ""
+    if theme.image_preview:
+        srcset_block += f'image_color: "{theme.image_color}"\nimage_preview: "{theme.image_preview}"\n'
+
     markdown = f'''---
 title: "{theme.title}"
 date: {theme.created.strftime("%Y-%m-%dT%H:%M:%SZ")}
 type: "theme"
 description: "{theme.description}"
 image: "{theme.image_path}"
-{author_line}tags:
+{srcset_block}{author_line}tags:
 {tags_yaml}
 related_articles:
 {articles_yaml}
@@ -781,72 +804,93 @@ related_articles:
     return file_path
 
 
-def extract_themes_data(min_articles: int = 3, days: int = 14) -> list[dict]:
-    """Extract themes and return as structured data (for digest generation).
+def run_theme_job(
+    min_articles: int = 3,
+    days: int = 14,
+    run_date: Optional[date] = None
+) -> list[tuple[Path, dict]]:
+    """Identify themes in recent articles, then write and return theme posts.
+
+    Every step (article snapshot, identified themes, and per theme the
+    editorial content, the image and the saved file) is recorded in a
+    checkpoint for run_date. A re-run for the same date, after a crash or
+    from a second caller such as the digest, resumes from the completed
+    steps: paid API calls are not repeated and no duplicate theme files
+    are written. The first run of a date fixes min_articles and days.
 
     Args:
         min_articles: Minimum articles needed per theme
         days: Number of days to look back for articles
+        run_date: Date the run belongs to (defaults to today)
 
     Returns:
-        List of theme dicts with all data needed for digest
+        (theme file path, theme dict for the digest) per theme, in order
     """
-    print("Loading recent articles...")
-    articles = load_recent_articles(days=days)
+    run_date = run_date or date.today()
+    prune_checkpoints()
+    checkpoint = Checkpoint.for_run("themes", run_date.isoformat())
+    if "articles" in checkpoint:
+        print(f"Resuming theme run for {run_date} from {checkpoint.path.name}")
+
+    created = datetime.fromisoformat(
+        checkpoint.run("started", lambda: datetime.now().isoformat(timespec="seconds"))
+    )
+    run_days = checkpoint.run("days", lambda: days)
+    if days > run_days:
+        logger.warning("Theme run for %s covers %d days of articles, not the %d requested",
+                       run_date, run_days, days)
+    # Article dates are UTC; started is local time
+    cutoff = created.astimezone(timezone.utc) - timedelta(days=days) if days < run_days else None
+
+    def load_articles() -> list[dict]:
+        print("Loading recent articles...")
+        return [{**asdict(a), "date": a.date.isoformat()} for a in load_recent_articles(days=days)]
+
+    articles = [
+        ArticleData(**{**a, "date": datetime.fromisoformat(a["date"])})
+        for a in checkpoint.run("articles", load_articles)
+    ]
     print(f"Found {len(articles)} articles")
 
     if len(articles) < min_articles:
         print("Not enough articles for theme extraction")
         return []
 
-    recent_themes = load_recent_themes(days=7)
-    if recent_themes:
-        print(f"Loaded {len(recent_themes)} recent theme titles to avoid repeats")
-
-    print("Identifying themes with AI...")
-    themes = identify_themes(articles, min_articles, recent_themes=recent_themes)
-    print(f"Found {len(themes)} potential themes")
+    def find_themes() -> list[dict]:
+        recent_themes = load_recent_themes(days=7)
+        if recent_themes:
+            print(f"Loaded {len(recent_themes)} recent theme titles to avoid repeats")
 
-    # Post-generation fuzzy dedup
-    if recent_themes:
-        before = len(themes)
-        themes = filter_duplicate_themes(themes, recent_themes)
-        if len(themes) < before:
-            print(f"Filtered to {len(themes)} themes after dedup")
-
-    theme_data_list = []
-    for theme_info in themes:
-        print(f"\nProcessing theme: {theme_info['title']}")
-
-        # Get articles for this theme
-        theme_articles = [articles[i] for i in theme_info["article_indices"] if i < len(articles)]
-
-        # Select author persona based on tags
-        tags = theme_info.get("tags", [])
-        persona = select_persona(tags)
-        print(f"  Author: {persona['name']} ({persona['specialty']})")
-
-        # Generate editorial content
-        content = generate_theme_content(
-            theme_info["title"],
-            theme_info["description"],
-            theme_articles,
-            persona=persona
-        )
+        print("Identifying themes with AI...")
+        themes = identify_themes(articles, min_articles, recent_themes=recent_themes)
+        print(f"Found {len(themes)} potential themes")
 
-        enhanced_title = content.get("enhanced_title", theme_info["title"])
+        # Post-generation fuzzy dedup
+        if recent_themes:
+            before = len(themes)
+            themes = filter_duplicate_themes(themes, recent_themes)
+            if len(themes) < before:
+                print(f"Filtered to {len(themes)} themes after dedup")
+        return themes
 
-        # Generate image for the theme
-        print("  Generating header image...")
-        image_path = generate_theme_image(
-            enhanced_title,
-            theme_info["description"],
-            tags
-        )
+    themes = checkpoint.run("themes", find_themes, keep=bool)
 
-        # Build article data for digest
+    results = []
+    for i, theme in create_theme_posts(themes, articles, checkpoint, created=created):
+        # Re-write a checkpointed theme file that is missing from this
+        # checkout (a failed run never committed it)
+        saved_step = f"theme-{i}:saved"
+        if saved_step in checkpoint and not (THEMES_DIR / checkpoint.get(saved_step)).exists():
+            checkpoint.save(saved_step, save_theme_post(theme).name)
+        saved_path = THEMES_DIR / checkpoint.run(saved_step, lambda: save_theme_post(theme).name)
+
+        # Build article data for digest, limited to the caller's window
+        in_window = [a for a in theme_articles_for(themes[i], articles) if cutoff is None or a.date >= cutoff]
+        if cutoff is not None and len(in_window) < min_articles:
+            print(f"  -> Skipped for the {days}-day window: {saved_path.name}")
+            continue
         article_data = []
-        for a in theme_articles:
+        for a in in_window:
             article_data.append({
                 "filename": a.filename,
                 "title": a.title,
@@ -854,87 +898,56 @@ def extract_themes_data(min_articles: int = 3, days: int = 14) -> list[dict]:
                 "summary": a.summary[:200] if a.summary else ""
             })
 
-        # Create slug from original theme title
-        slug = theme_info["title"].lower()
-        slug = "".join(c if c.isalnum() or c == " " else "" for c in slug)
-        slug = "-".join(slug.split())[:50]
-
-        # Save standalone theme page
-        theme_obj = Theme(
-            title=enhanced_title,
-            slug=slug,
-            description=theme_info["description"],
-            editorial_intro=content.get("editorial_intro", theme_info["description"]),
-            article_ids=[a.filename for a in theme_articles],
-            tags=tags,
-            image_path=image_path,
-            takeaways=content.get("takeaways", []),
-            created=datetime.now(),
-            author=persona["name"]
-        )
-        saved_path = save_theme_post(theme_obj)
-
-        # Derive the Hugo URL from the saved filename
-        theme_url = f"/themes/{saved_path.stem}/"
-
-        theme_data_list.append({
-            "title": enhanced_title,
-            "description": theme_info["description"],
-            "editorial_intro": content.get("editorial_intro", theme_info["description"]),
-            "image": image_path,
-            "tags": tags,
+        results.append((saved_path, {
+            "title": theme.title,
+            "description": theme.description,
+            "editorial_intro": theme.editorial_intro,
+            "image": theme.image_path,
+            "image_srcset": theme.image_srcset,
+            "image_color": theme.image_color,
+            "image_preview": theme.image_preview,
+            "tags": theme.tags,
             "articles": article_data,
-            "takeaways": content.get("takeaways", []),
-            "url": theme_url,
-            "author": persona["name"]
-        })
+            "takeaways": theme.takeaways,
+            # Derive the Hugo URL from the saved filename
+            "url": f"/themes/{saved_path.stem}/",
+            "author": theme.author
+        }))
 
-        print(f"  -> Processed: {enhanced_title}")
+        print(f"  -> Saved: {saved_path.name}")
 
-    return theme_data_list
+    return results
 
 
-def extract_and_save_themes(min_articles: int = 3) -> list[Path]:
-    """Main entry point: analyze recent articles and create theme posts.
+def extract_themes_data(
+    min_articles: int = 3,
+    days: int = 14,
+    run_date: Optional[date] = None
+) -> list[dict]:
+    """Extract themes and return as structured data (for digest generation).
 
     Args:
         min_articles: Minimum articles needed per theme
+        days: Number of days to look back for articles
+        run_date: Date of the run (defaults to today)
 
     Returns:
-        List of paths to created theme files
+        List of theme dicts with all data needed for digest
     """
-    print("Loading recent articles...")
-    articles = load_recent_articles(days=14)
-    print(f"Found {len(articles)} articles")
+    return [data for _, data in run_theme_job(min_articles, days, run_date)]
 
-    if len(articles) < min_articles:
-        print("Not enough articles for theme extraction")
-        return []
 
-    recent_themes = load_recent_themes(days=7)
-    if recent_themes:
-        print(f"Loaded {len(recent_themes)} recent theme titles to avoid repeats")
+def extract_and_save_themes(min_articles: int = 3, run_date: Optional[date] = None) -> list[Path]:
+    """Main entry point: analyze recent articles and create theme posts.
 
-    print("Identifying themes with AI...")
-    themes = identify_themes(articles, min_articles, recent_themes=recent_themes)
-    print(f"Found {len(themes)} potential themes")
+    Args:
+        min_articles: Minimum articles needed per theme
+        run_date: Date of the run (defaults to today)
 
-    # Post-generation fuzzy dedup
-    if recent_themes:
-        before = len(themes)
-        themes = filter_duplicate_themes(themes, recent_themes)
-        if len(themes) < before:
-            print(f"Filtered to {len(themes)} themes after dedup")
-
-    created_files = []
-    for theme_data in themes:
-        print(f"\nProcessing theme: {theme_data['title']}")
-        theme = create_theme_post(theme_data, articles)
-        file_path = save_theme_post(theme)
-        created_files.append(file_path)
-        print(f"  -> Saved: {file_path.name}")
-
-    return created_files
+    Returns:
+        List of paths to created theme files
+    """
+    return [path for path, _ in run_theme_job(min_articles, days=14, run_date=run_date)]
 
 
 if __name__ == "__main__":
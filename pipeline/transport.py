@@ -0,0 +1,325 @@
+"""Shared pooled HTTP clients for every pipeline fetcher.
+
+Feeds, scraped pages, APIs and images are all fetched through the clients
+built here instead of a new httpx.Client per call:
+
+- one sync client per process, safe to share between threads, and an
+  async client factory for each asyncio.run(); both keep connections
+  alive between requests and negotiate HTTP/2 when h2 is installed
+- gzip/deflate always, brotli when the brotli package is installed
+- resolved addresses cached for DNS_TTL seconds
+- at most MAX_CONNECTIONS_PER_HOST requests in flight to one host
+- GET/HEAD retried on connection errors, timeouts, 429 and 5xx gateway
+  errors, with exponential backoff or the server's Retry-After
+
+Usage:
+    response = get_client().get(url)
+
+    async with async_client() as client:
+        response = await client.get(url)
+"""
+
+import asyncio
+import importlib.util
+import socket
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+import httpx
+
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+HEADERS = {"User-Agent": USER_AGENT}
+
+# Default per-request timeout (seconds); callers can pass timeout= per call
+TIMEOUT = httpx.Timeout(30, connect=10)
+
+# Pool size across hosts and concurrent requests to any single host
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+MAX_CONNECTIONS_PER_HOST = 6
+KEEPALIVE_EXPIRY = 30
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Seconds a resolved address is reused
+DNS_TTL = 300
+
+# Retry policy: attempts in total, backoff bounds and retried responses
+RETRY_ATTEMPTS = 3
+RETRY_MIN_DELAY = 1
+RETRY_MAX_DELAY = 10
+# A longer Retry-After is not waited for; the response is returned as is
+MAX_RETRY_AFTER = 60
+RETRY_METHODS = {"GET", "HEAD"}
+RETRY_STATUSES = {429, 502, 503, 504}
+RETRY_ERRORS = (httpx.ConnectError, httpx.TimeoutException, httpx.RemoteProtocolError)
+
+
+_getaddrinfo = socket.getaddrinfo
+_dns_cache: dict[tuple, tuple[float, list]] = {}
+_dns_lock = threading.Lock()
+
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """socket.getaddrinfo with successful lookups kept for DNS_TTL seconds."""
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    with _dns_lock:
+        cached = _dns_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+    result = _getaddrinfo(host, port, family, type, proto, flags)
+    with _dns_lock:
+        _dns_cache[key] = (now + DNS_TTL, result)
+    return result
+
+
+def _install_dns_cache() -> None:
+    """Route lookups through the cache.
+
+    httpx has no resolver hook: both its sync and async (anyio) backends
+    resolve with socket.getaddrinfo, so the cache wraps that.
+    """
+    socket.getaddrinfo = _cached_getaddrinfo
+
+
+def retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Read Retry-After (seconds or an HTTP date) from a response."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_delay(attempt: int, request: httpx.Request,
+                response: Optional[httpx.Response] = None,
+                error: Optional[Exception] = None) -> Optional[float]:
+    """Seconds to wait before retrying, or None to give up.
+
+    Args:
+        attempt: Attempts made so far (1 after the first)
+        request: The request that failed
+        response: Response received, if any
+        error: Transport error raised, if any
+
+    Returns:
+        Delay in seconds, or None if the outcome is final
+    """
+    if attempt >= RETRY_ATTEMPTS or request.method not in RETRY_METHODS:
+        return None
+    if error is not None:
+        if not isinstance(error, RETRY_ERRORS):
+            return None
+    elif response is None or response.status_code not in RETRY_STATUSES:
+        return None
+
+    delay = retry_after_seconds(response) if response is not None else None
+    if delay is None:
+        return min(RETRY_MAX_DELAY, RETRY_MIN_DELAY * 2 ** (attempt - 1))
+    return delay if delay <= MAX_RETRY_AFTER else None
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """Response body that frees its host slot once closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._release:
+                self._release()
+                self._release = None
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    """Async response body that frees its host slot once closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release:
+                self._release()
+                self._release = None
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+class PooledTransport(httpx.BaseTransport):
+    """Connection pool with a per-host cap and retries.
+
+    A request holds its host's slot until the response body is closed,
+    so streamed downloads count against the cap too. before_attempt, if
+    given, is called before every attempt sent to the network, retries
+    included (e.g. to take a rate-limit token).
+    """
+
+    def __init__(self, max_per_host: int = MAX_CONNECTIONS_PER_HOST,
+                 before_attempt: Optional[Callable[[httpx.Request], None]] = None):
+        self.max_per_host = max_per_host
+        self.before_attempt = before_attempt
+        self._transport = httpx.HTTPTransport(http2=HTTP2, limits=_limits())
+        self._hosts: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._hosts[host]
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        slot = self._slot(request.url.host)
+        slot.acquire()
+        try:
+            attempt = 0
+            while True:
+                attempt += 1
+                if self.before_attempt:
+                    self.before_attempt(request)
+                try:
+                    response = self._transport.handle_request(request)
+                except Exception as e:
+                    delay = retry_delay(attempt, request, error=e)
+                    if delay is None:
+                        raise
+                else:
+                    delay = retry_delay(attempt, request, response=response)
+                    if delay is None:
+                        return httpx.Response(
+                            response.status_code,
+                            headers=response.headers,
+                            stream=_ReleasingStream(response.stream, slot.release),
+                            extensions=response.extensions,
+                        )
+                    response.close()
+                time.sleep(delay)
+        except BaseException:
+            slot.release()
+            raise
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncPooledTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of PooledTransport, bound to one event loop."""
+
+    def __init__(self, max_per_host: int = MAX_CONNECTIONS_PER_HOST):
+        self.max_per_host = max_per_host
+        self._transport = httpx.AsyncHTTPTransport(http2=HTTP2, limits=_limits())
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+
+    def _slot(self, host: str) -> asyncio.Semaphore:
+        if host not in self._hosts:
+            self._hosts[host] = asyncio.Semaphore(self.max_per_host)
+        return self._hosts[host]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        slot = self._slot(request.url.host)
+        await slot.acquire()
+        try:
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    response = await self._transport.handle_async_request(request)
+                except Exception as e:
+                    delay = retry_delay(attempt, request, error=e)
+                    if delay is None:
+                        raise
+                else:
+                    delay = retry_delay(attempt, request, response=response)
+                    if delay is None:
+                        return httpx.Response(
+                            response.status_code,
+                            headers=response.headers,
+                            stream=_AsyncReleasingStream(response.stream, slot.release),
+                            extensions=response.extensions,
+                        )
+                    await response.aclose()
+                await asyncio.sleep(delay)
+        except BaseException:
+            slot.release()
+            raise
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def new_client(before_attempt: Optional[Callable[[httpx.Request], None]] = None) -> httpx.Client:
+    """Build a sync client with the shared settings and its own pool.
+
+    Use get_client() unless the client needs its own before_attempt
+    hook (see PooledTransport).
+    """
+    _install_dns_cache()
+    return httpx.Client(
+        transport=PooledTransport(before_attempt=before_attempt),
+        timeout=TIMEOUT,
+        headers=HEADERS,
+        follow_redirects=True,
+    )
+
+
+def get_client() -> httpx.Client:
+    """Return the process-wide sync client, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = new_client()
+        return _client
+
+
+def async_client(max_per_host: int = MAX_CONNECTIONS_PER_HOST) -> httpx.AsyncClient:
+    """Build an async client with the shared settings.
+
+    Async connections belong to the event loop that opened them, so each
+    asyncio.run() uses its own client; open it with `async with`.
+
+    Args:
+        max_per_host: Maximum concurrent requests to a single host
+    """
+    _install_dns_cache()
+    return httpx.AsyncClient(
+        transport=AsyncPooledTransport(max_per_host),
+        timeout=TIMEOUT,
+        headers=HEADERS,
+        follow_redirects=True,
+    )
@@ -9,9 +9,10 @@ from pathlib import Path
 from typing import Optional
 
 import feedparser
-import httpx
 from bs4 import BeautifulSoup
 
+from .transport import get_client
+
 
 @dataclass
 class RedditDiscussion:
@@ -86,9 +87,9 @@ def fetch_reddit_discussions(limit: int = 10) -> list[RedditDiscussion]:
 
     for subreddit in subreddits:
         try:
-            feed = feedparser.parse(
-                f"https://www.reddit.com/r/{subreddit}/hot.rss?limit=25"
-            )
+            response = get_client().get(f"https://www.reddit.com/r/{subreddit}/hot.rss?limit=25")
+            response.raise_for_status()
+            feed = feedparser.parse(response.content, response_headers=dict(response.headers))
 
             for entry in feed.entries:
                 # Detect self-posts by checking for text content in div.md
@@ -131,57 +132,53 @@ def fetch_orvis_deals(limit: int = 5) -> list[GearDeal]:
         List of GearDeal objects
     """
     deals = []
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    }
-
     try:
-        with httpx.Client(timeout=30, headers=headers, follow_redirects=True) as client:
-            # Try the fly fishing sale page
-            response = client.get("https://www.orvis.com/fly-fishing-sale")
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
+        client = get_client()
+        # Try the fly fishing sale page
+        response = client.get("https://www.orvis.com/fly-fishing-sale")
+        response.raise_for_status()
 
-            # Find product cards - Orvis uses various selectors
-            products = soup.select(".product-tile, .product-card, [data-component='ProductTile']")
+        soup = BeautifulSoup(response.text, "html.parser")
 
-            for product in products[:limit * 2]:  # Get extra to filter
-                try:
-                    # Try various selectors for product data
-                    title_el = product.select_one(".product-name, .product-title, h3, h2")
-                    link_el = product.select_one("a[href*='/p/']")
-                    price_els = product.select(".price, .product-price span")
+        # Find product cards - Orvis uses various selectors
+        products = soup.select(".product-tile, .product-card, [data-component='ProductTile']")
 
-                    if not title_el or not link_el:
-                        continue
+        for product in products[:limit * 2]:  # Get extra to filter
+            try:
+                # Try various selectors for product data
+                title_el = product.select_one(".product-name, .product-title, h3, h2")
+                link_el = product.select_one("a[href*='/p/']")
+                price_els = product.select(".price, .product-price span")
 
-                    title = title_el.get_text(strip=True)
-                    url = link_el.get("href", "")
-                    if not url.startswith("http"):
-                        url = f"https://www.orvis.com{url}"
-
-                    # Extract prices if available
-                    original_price = None
-                    sale_price = None
-                    for price_el in price_els:
-                        price_text = price_el.get_text(strip=True)
-                        if "was" in price_el.get("class", []) or "original" in str(price_el.get("class", [])):
-                            original_price = price_text
-                        elif "$" in price_text:
-                            sale_price = price_text
-
-                    deals.append(GearDeal(
-                        title=title,
-                        url=url,
-                        source="Orvis",
-                        original_price=original_price,
-                        sale_price=sale_price
-                    ))
-
-                except Exception:
+                if not title_el or not link_el:
                     continue
 
+                title = title_el.get_text(strip=True)
+                url = link_el.get("href", "")
+                if not url.startswith("http"):
+                    url = f"https://www.orvis.com{url}"
+
+                # Extract prices if available
+                original_price = None
+                sale_price = None
+                for price_el in price_els:
+                    price_text = price_el.get_text(strip=True)
+                    if "was" in price_el.get("class", []) or "original" in str(price_el.get("class", [])):
+                        original_price = price_text
+                    elif "$" in price_text:
+                        sale_price = price_text
+
+                deals.append(GearDeal(
+                    title=title,
+                    url=url,
+                    source="Orvis",
+                    original_price=original_price,
+                    sale_price=sale_price
+                ))
+
+            except Exception:
+                continue
+
     except Exception as e:
         print(f"Error fetching Orvis deals: {e}")
 
@@ -198,52 +195,48 @@ def fetch_simms_deals(limit: int = 5) -> list[GearDeal]:
         List of GearDeal objects
     """
     deals = []
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    }
-
     try:
-        with httpx.Client(timeout=30, headers=headers, follow_redirects=True) as client:
-            response = client.get("https://www.simmsfishing.com/sale")
-            response.raise_for_status()
+        client = get_client()
+        response = client.get("https://www.simmsfishing.com/sale")
+        response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, "html.parser")
 
-            # Find product elements
-            products = soup.select(".product-item, .product-card, .product-tile")
+        # Find product elements
+        products = soup.select(".product-item, .product-card, .product-tile")
 
-            for product in products[:limit * 2]:
-                try:
-                    title_el = product.select_one(".product-item-name, .product-name, h3, h2")
-                    link_el = product.select_one("a[href*='simmsfishing.com']") or product.select_one("a")
+        for product in products[:limit * 2]:
+            try:
+                title_el = product.select_one(".product-item-name, .product-name, h3, h2")
+                link_el = product.select_one("a[href*='simmsfishing.com']") or product.select_one("a")
 
-                    if not title_el:
-                        continue
+                if not title_el:
+                    continue
 
-                    title = title_el.get_text(strip=True)
-                    url = ""
-                    if link_el:
-                        url = link_el.get("href", "")
-                        if not url.startswith("http"):
-                            url = f"https://www.simmsfishing.com{url}"
+                title = title_el.get_text(strip=True)
+                url = ""
+                if link_el:
+                    url = link_el.get("href", "")
+                    if not url.startswith("http"):
+                        url = f"https://www.simmsfishing.com{url}"
 
-                    # Look for price elements
-                    original_el = product.select_one(".old-price, .was-price, .original-price")
-                    sale_el = product.select_one(".special-price, .sale-price, .current-price")
+                # Look for price elements
+                original_el = product.select_one(".old-price, .was-price, .original-price")
+                sale_el = product.select_one(".special-price, .sale-price, .current-price")
 
-                    original_price = original_el.get_text(strip=True) if original_el else None
-                    sale_price = sale_el.get_text(strip=True) if sale_el else None
+                original_price = original_el.get_text(strip=True) if original_el else None
+                sale_price = sale_el.get_text(strip=True) if sale_el else None
 
-                    deals.append(GearDeal(
-                        title=title,
-                        url=url,
-                        source="Simms",
-                        original_price=original_price,
-                        sale_price=sale_price
-                    ))
+                deals.append(GearDeal(
+                    title=title,
+                    url=url,
+                    source="Simms",
+                    original_price=original_price,
+                    sale_price=sale_price
+                ))
 
-                except Exception:
-                    continue
+            except Exception:
+                continue
 
     except Exception as e:
         print(f"Error fetching Simms deals: {e}")
@@ -261,56 +254,52 @@ def fetch_yellowdog_trips(limit: int = 5) -> list[Trip]:
         List of Trip objects
     """
     trips = []
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    }
-
     try:
-        with httpx.Client(timeout=30, headers=headers, follow_redirects=True) as client:
-            response = client.get(
-                "https://www.yellowdogflyfishing.com/collections/fly-fishing-current-trip-specials"
-            )
-            response.raise_for_status()
+        client = get_client()
+        response = client.get(
+            "https://www.yellowdogflyfishing.com/collections/fly-fishing-current-trip-specials"
+        )
+        response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, "html.parser")
 
-            # Trip special cards use .destLodge__linkWrapper
-            cards = soup.select("a.destLodge__linkWrapper")
+        # Trip special cards use .destLodge__linkWrapper
+        cards = soup.select("a.destLodge__linkWrapper")
 
-            for card in cards[:limit]:
-                try:
-                    title_el = card.select_one(".destLodge__title")
-                    region_el = card.select_one(".destLodge__region")
-                    special_el = card.select_one(".destSidebarCard__specialHeader")
-                    dates_el = card.select_one(".destSidebarCard__specialDesc")
+        for card in cards[:limit]:
+            try:
+                title_el = card.select_one(".destLodge__title")
+                region_el = card.select_one(".destLodge__region")
+                special_el = card.select_one(".destSidebarCard__specialHeader")
+                dates_el = card.select_one(".destSidebarCard__specialDesc")
 
-                    if not title_el:
-                        continue
+                if not title_el:
+                    continue
 
-                    title = title_el.get_text(strip=True)
-                    href = card.get("href", "")
-                    if not href.startswith("http"):
-                        href = f"https://www.yellowdogflyfishing.com{href}"
+                title = title_el.get_text(strip=True)
+                href = card.get("href", "")
+                if not href.startswith("http"):
+                    href = f"https://www.yellowdogflyfishing.com{href}"
 
-                    destination = region_el.get_text(strip=True) if region_el else ""
+                destination = region_el.get_text(strip=True) if region_el else ""
 
-                    desc_parts = []
-                    if special_el:
-                        desc_parts.append(special_el.get_text(strip=True))
-                    if dates_el:
-                        desc_parts.append(dates_el.get_text(strip=True))
-                    description = " — ".join(desc_parts) if desc_parts else None
+                desc_parts = []
+                if special_el:
+                    desc_parts.append(special_el.get_text(strip=True))
+                if dates_el:
+                    desc_parts.append(dates_el.get_text(strip=True))
+                description = " — ".join(desc_parts) if desc_parts else None
 
-                    trips.append(Trip(
-                        title=title,
-                        url=href,
-                        destination=destination,
-                        source="Yellow Dog",
-                        description=description
-                    ))
+                trips.append(Trip(
+                    title=title,
+                    url=href,
+                    destination=destination,
+                    source="Yellow Dog",
+                    description=description
+                ))
 
-                except Exception:
-                    continue
+            except Exception:
+                continue
 
     except Exception as e:
         print(f"Error fetching Yellow Dog trips: {e}")
@@ -363,61 +352,61 @@ def fetch_youtube_videos(limit: int = 6) -> list[YouTubeVideo]:
     published_after = (datetime.now(timezone.utc) - timedelta(hours=48)).isoformat()
 
     try:
-        with httpx.Client(timeout=30) as client:
-            # Search for recent fly fishing videos
-            search_response = client.get(
-                "https://www.googleapis.com/youtube/v3/search",
-                params={
-                    "part": "snippet",
-                    "q": "fly fishing",
-                    "type": "video",
-                    "order": "relevance",
-                    "publishedAfter": published_after,
-                    "maxResults": limit,
-                    "key": api_key,
-                },
-            )
-            search_response.raise_for_status()
-            search_data = search_response.json()
-
-            items = search_data.get("items", [])
-            if not items:
-                return []
-
-            # Get video details (view count, duration) in a single call
-            video_ids = ",".join(item["id"]["videoId"] for item in items)
-            details_response = client.get(
-                "https://www.googleapis.com/youtube/v3/videos",
-                params={
-                    "part": "contentDetails,statistics",
-                    "id": video_ids,
-                    "key": api_key,
-                },
-            )
-            details_response.raise_for_status()
-            details_data = details_response.json()
-
-            # Build lookup of video details
-            details_map = {}
-            for detail in details_data.get("items", []):
-                details_map[detail["id"]] = detail
-
-            for item in items:
-                video_id = item["id"]["videoId"]
-                snippet = item["snippet"]
-                detail = details_map.get(video_id, {})
-                stats = detail.get("statistics", {})
-                content = detail.get("contentDetails", {})
-
-                videos.append(YouTubeVideo(
-                    title=snippet.get("title", ""),
-                    url=f"https://www.youtube.com/watch?v={video_id}",
-                    channel=snippet.get("channelTitle", ""),
-                    views=_format_views(stats.get("viewCount", "0")),
-                    duration=_format_duration(content.get("duration", "")),
-                    thumbnail=snippet.get("thumbnails", {}).get("medium", {}).get("url", ""),
-                    published=snippet.get("publishedAt", ""),
-                ))
+        client = get_client()
+        # Search for recent fly fishing videos
+        search_response = client.get(
+            "https://www.googleapis.com/youtube/v3/search",
+            params={
+                "part": "snippet",
+                "q": "fly fishing",
+                "type": "video",
+                "order": "relevance",
+                "publishedAfter": published_after,
+                "maxResults": limit,
+                "key": api_key,
+            },
+        )
+        search_response.raise_for_status()
+        search_data = search_response.json()
+
+        items = search_data.get("items", [])
+        if not items:
+            return []
+
+        # Get video details (view count, duration) in a single call
+        video_ids = ",".join(item["id"]["videoId"] for item in items)
+        details_response = client.get(
+            "https://www.googleapis.com/youtube/v3/videos",
+            params={
+                "part": "contentDetails,statistics",
+                "id": video_ids,
+                "key": api_key,
+            },
+        )
+        details_response.raise_for_status()
+        details_data = details_response.json()
+
+        # Build lookup of video details
+        details_map = {}
+        for detail in details_data.get("items", []):
+            details_map[detail["id"]] = detail
+
+        for item in items:
+            video_id = item["id"]["videoId"]
+            snippet = item["snippet"]
+            detail = details_map.get(video_id, {})
+            stats = detail.get("statistics", {})
+            content = detail.get("contentDetails", {})
+
+            videos.append(YouTubeVideo(
+                title=snippet.get("title", ""),
+                url=f"https://www.youtube.com/watch?v={video_id}",
+                channel=snippet.get("channelTitle", ""),
+                views=_format_views(stats.get("viewCount", "0")),
+                duration=_format_duration(content.get("duration", "")),
+                thumbnail=snippet.get("thumbnails", {}).get("medium", {}).get("url", ""),
+                published=snippet.get("publishedAt", ""),
+            ))
 
     except Exception as e:
         print(f"Error fetching YouTube videos: {e}")
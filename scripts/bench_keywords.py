@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Benchmark the shared keyword engine against per-pattern matching.
+
+Builds a synthetic corpus of article-like texts, scores it with the old
+approach (one regex search / substring test per keyword) and with
+pipeline.keywords, checks the results are identical, and prints timings.
+
+Usage:
+    python scripts/bench_keywords.py            # 20,000 documents
+    python scripts/bench_keywords.py --docs 100000
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.fetcher import EXCLUDE_KEYWORDS, FISHING_KEYWORDS, is_fishing_score
+from pipeline.keywords import get_engine
+from pipeline.tagger import TAG_KEYWORDS
+
+
+FILLER = (
+    "the a river morning water cold clear we on with after before long day season "
+    "anglers guide cast fish fly rod reel hatch line leader boat trip lake story "
+    "trout brown rainbow steelhead bass deer hunting rifle news record test tip "
+    "report creek flows warm runoff snow spring fall winter summer caught landed"
+).split()
+
+PHRASES = [
+    "fly fishing", "dry fly", "euro nymphing", "brook trout", "strip set",
+    "dead drift", "pheasant tail", "elk hair caddis", "spinning reel",
+    "bass boat", "red drum", "how to", "bass fishing", "smallmouth",
+]
+
+
+def make_corpus(n: int, seed: int = 7) -> list[str]:
+    """Generate n pseudo-articles of 40-200 words."""
+    rng = random.Random(seed)
+    docs = []
+    for _ in range(n):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(40, 200))]
+        for _ in range(rng.randint(0, 4)):
+            words.insert(rng.randrange(len(words)), rng.choice(PHRASES))
+        docs.append(" ".join(words).capitalize() + ".")
+    return docs
+
+
+def baseline(docs: list[str]) -> list[tuple]:
+    """Score documents the pre-engine way."""
+    fishing = [re.compile(kw, re.IGNORECASE) for kw in FISHING_KEYWORDS]
+    exclude = [re.compile(kw, re.IGNORECASE) for kw in EXCLUDE_KEYWORDS]
+    results = []
+    for doc in docs:
+        text = doc.lower()
+        f = sum(1 for p in fishing if p.search(text))
+        e = sum(1 for p in exclude if p.search(text))
+        groups = tuple(any(kw in text for kw in kws) for kws in TAG_KEYWORDS.values())
+        results.append((f > 0 and f >= e, groups))
+    return results
+
+
+def engine(docs: list[str]) -> list[tuple]:
+    """Score documents with the shared engine in one pass each."""
+    results = []
+    for hits in get_engine().scan_many(docs):
+        groups = tuple(bool(hits[f"tag:{g}"]) for g in TAG_KEYWORDS)
+        results.append((is_fishing_score(hits), groups))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyword engine micro-benchmark")
+    parser.add_argument("--docs", type=int, default=20000, help="Corpus size")
+    args = parser.parse_args()
+
+    docs = make_corpus(args.docs)
+    get_engine().scan("warm up")  # compile outside the timed region
+
+    start = time.perf_counter()
+    expected = baseline(docs)
+    base_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = engine(docs)
+    engine_time = time.perf_counter() - start
+
+    if actual != expected:
+        mismatches = sum(1 for a, b in zip(actual, expected) if a != b)
+        print(f"MISMATCH: {mismatches} documents scored differently")
+        sys.exit(1)
+
+    print(f"Documents:       {len(docs):,}")
+    print(f"Per-pattern:     {base_time:.2f}s ({len(docs) / base_time:,.0f} docs/s)")
+    print(f"Keyword engine:  {engine_time:.2f}s ({len(docs) / engine_time:,.0f} docs/s)")
+    print(f"Speedup:         {base_time / engine_time:.1f}x (results identical)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Convert existing theme PNGs to WebP variants plus a JPEG fallback.
+
+Rewrites the image references in content/themes and content/digests to
+the new files (adding image_srcset and the LQIP placeholder, as new
+themes have) and deletes the PNGs.
+
+Usage:
+    python scripts/convert_theme_images.py --dry-run
+    python scripts/convert_theme_images.py
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.image_variants import STATIC_DIR, encode_variants  # noqa: E402
+
+ROOT = Path(__file__).parent.parent
+THEME_IMAGES = STATIC_DIR / "images" / "themes"
+CONTENT_DIRS = [ROOT / "content" / "themes", ROOT / "content" / "digests"]
+
+IMAGE_LINE = re.compile(r'^(\s*)image: ("?)(/images/themes/[^"\s]+\.png)"?\s*$', re.MULTILINE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert theme PNGs to responsive WebP/JPEG")
+    parser.add_argument("--dry-run", action="store_true", help="Report only, change nothing")
+    args = parser.parse_args()
+
+    pngs = sorted(THEME_IMAGES.glob("*.png"))
+    before = sum(p.stat().st_size for p in pngs)
+    converted = {}
+    after = 0
+
+    for png in pngs:
+        if args.dry_run:
+            continue
+        with open(png, "rb") as source:
+            image = encode_variants(source, THEME_IMAGES, png.stem)
+        converted[f"/images/themes/{png.name}"] = image
+        after += sum(p.stat().st_size for p in THEME_IMAGES.glob(f"{png.stem}-*.*"))
+
+    def replace(match: re.Match) -> str:
+        indent, quote, old = match.groups()
+        image = converted.get(old)
+        if image is None:
+            return match.group(0)
+        lines = [f"{indent}image: {quote}{image.src}{quote}", f"{indent}image_srcset:"]
+        lines += [f'{indent}  {fmt}: "{srcset}"' for fmt, srcset in image.srcset.items()]
+        lines += [f'{indent}image_color: "{image.color}"', f'{indent}image_preview: "{image.preview}"']
+        return "\n".join(lines)
+
+    rewritten = 0
+    for content_dir in CONTENT_DIRS:
+        for md_file in sorted(content_dir.glob("*.md")):
+            text = md_file.read_text(encoding="utf-8")
+            if not IMAGE_LINE.search(text):
+                continue
+            rewritten += 1
+            if not args.dry_run:
+                md_file.write_text(IMAGE_LINE.sub(replace, text), encoding="utf-8")
+
+    if not args.dry_run:
+        for png in pngs:
+            png.unlink()
+
+    print(f"{len(pngs)} PNGs ({before / 1024 / 1024:.1f} MB), {rewritten} content files referencing them")
+    if not args.dry_run:
+        print(f"Converted to {after / 1024 / 1024:.1f} MB of WebP/JPEG variants")
+
+
+if __name__ == "__main__":
+    main()
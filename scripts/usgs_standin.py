@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Serve synthetic USGS Water Services responses for pipeline.stream_flow.
+
+Answers the three endpoints the stage uses from files in
+scripts/fixtures/usgs, narrowed to each request like the real service:
+
+    /nwis/site/  site.rdb rows inside bBox (404 if none, as USGS does)
+    /nwis/iv/    iv.json time series for the requested sites
+    /nwis/stat/  stat.rdb rows for the requested sites
+
+Each request is logged with the number of sites it asked for, so the
+batching can be checked. The fixtures are hand-written test data in the
+services' formats (RDB for site and stat, WaterML JSON for iv), not
+recordings: they cover a dozen gauges near the rivers in
+static/data/fishing-reports.json, and stat.rdb has flat percentiles for
+only two of them. To test against real data, save actual responses over
+them, e.g.
+
+    curl 'https://waterservices.usgs.gov/nwis/iv/?format=json&parameterCd=00060&sites=06041000,...'
+
+Usage:
+    python scripts/usgs_standin.py --port 8797
+    USGS_BASE_URL=http://127.0.0.1:8797/nwis python -m pipeline.stream_flow --output /tmp/flow
+"""
+
+import argparse
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "usgs"
+
+
+def split_rdb(text: str) -> tuple[list[str], list[str], list[dict]]:
+    """Comment and header lines, column names and row dicts of an RDB file."""
+    lines = text.splitlines()
+    comments = [line for line in lines if line.startswith("#")]
+    body = [line for line in lines if line and not line.startswith("#")]
+    columns = body[0].split("\t")
+    rows = [dict(zip(columns, line.split("\t"))) for line in body[2:]]
+    return comments + body[:2], columns, rows
+
+
+def join_rdb(head: list[str], columns: list[str], rows: list[dict]) -> str:
+    return "\n".join(head + ["\t".join(row[c] for c in columns) for row in rows]) + "\n"
+
+
+class UsgsHandler(BaseHTTPRequestHandler):
+    fixtures_dir = FIXTURES_DIR
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: str, content_type: str) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        sites = set(params["sites"].split(",")) if "sites" in params else None
+        endpoint = url.path.rstrip("/").rsplit("/", 1)[-1]
+        print(f"{endpoint:5} sites={len(sites) if sites else '-':>4} {params.get('bBox', '')}", flush=True)
+
+        if endpoint == "site":
+            head, columns, rows = split_rdb((self.fixtures_dir / "site.rdb").read_text())
+            west, south, east, north = (float(v) for v in params["bBox"].split(","))
+            rows = [row for row in rows
+                    if south <= float(row["dec_lat_va"]) <= north and west <= float(row["dec_long_va"]) <= east]
+            if not rows:
+                self._send(404, "No sites found matching all criteria", "text/plain")
+                return
+            self._send(200, join_rdb(head, columns, rows), "text/plain")
+
+        elif endpoint == "iv":
+            data = json.loads((self.fixtures_dir / "iv.json").read_text())
+            data["value"]["timeSeries"] = [
+                series for series in data["value"]["timeSeries"]
+                if sites is None or series["sourceInfo"]["siteCode"][0]["value"] in sites
+            ]
+            self._send(200, json.dumps(data), "application/json")
+
+        elif endpoint == "stat":
+            head, columns, rows = split_rdb((self.fixtures_dir / "stat.rdb").read_text())
+            rows = [row for row in rows if sites is None or row["site_no"] in sites]
+            if not rows:
+                self._send(404, "No sites found matching all criteria", "text/plain")
+                return
+            self._send(200, join_rdb(head, columns, rows), "text/plain")
+
+        else:
+            self._send(404, "Not found", "text/plain")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve synthetic USGS responses")
+    parser.add_argument("--port", type=int, default=8797)
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR, help="Directory of response fixtures")
+    args = parser.parse_args()
+
+    UsgsHandler.fixtures_dir = args.fixtures
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), UsgsHandler)
+    print(f"Serving {args.fixtures} at http://127.0.0.1:{args.port}/nwis")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Check that EntryFilter's keyword pre-filter never drops an article the
+full is_fishing_content check would accept.
+
+Usage:
+    python -m pytest test_entry_filter.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+# Make sure the pipeline package is importable
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pipeline.fetcher import EntryFilter, is_fishing_content
+
+WORDS = ["Report", "trout", "fly", "fishing", "dry", "hunting", "deer", "river", "&amp;", "-fishing", "rainbow"]
+TAGS = [("<p>", "</p>"), ("<b>", "</b>"), ("<li>", "</li>"), ("", "")]
+
+
+def reddit_description(html: str) -> str:
+    """What parse_reddit_entries extracts from a self-post."""
+    md_div = BeautifulSoup(html, "html.parser").select_one("div.md")
+    return md_div.get_text(strip=True)[:500] if md_div else ""
+
+
+def test_adjacent_tags_not_glued():
+    description = "<p>Report</p><p>trout</p>"
+    assert is_fishing_content("Weekend report", description)
+    assert EntryFilter(set()).might_be_fishing("Weekend report", description)
+
+
+def test_attribute_text_kept():
+    description = '<img alt="fly fishing" src="x.jpg"> Weekend photos'
+    assert is_fishing_content("Weekend photos", description)
+    assert EntryFilter(set()).might_be_fishing("Weekend photos", description)
+
+
+def test_prefilter_is_superset_of_full_check():
+    rng = random.Random(20)
+    entry_filter = EntryFilter(set())
+    for _ in range(3000):
+        parts = []
+        for _ in range(rng.randint(1, 5)):
+            start, end = rng.choice(TAGS)
+            parts.append(start + " ".join(rng.choices(WORDS, k=rng.randint(1, 3))) + end)
+        html = '<div class="md">' + rng.choice(["", " "]).join(parts) + "</div>"
+        title = rng.choice(["Weekend report", "Morning", "Trip notes"])
+
+        # RSS: the description is the raw summary HTML
+        if is_fishing_content(title, html):
+            assert entry_filter.might_be_fishing(title, html), html
+        # Reddit: the description is text extracted from the post HTML
+        if is_fishing_content(title, reddit_description(html)):
+            assert entry_filter.might_be_fishing(title, html), html
@@ -0,0 +1,123 @@
+"""Check the incremental fishing-report crawl against a mock Orvis site.
+
+Requests go through transport._client, replaced by an httpx.MockTransport
+client, and crawl state, reports and tiles are written to a temporary
+directory.
+
+Usage:
+    python -m pytest test_fishing_reports.py
+"""
+
+import hashlib
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import httpx
+import pytest
+
+# Make sure the pipeline package is importable
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pipeline import fishing_reports, transport
+from pipeline.fishing_reports import FishingReport, fetch_all_reports, refresh_river_report
+
+RIVER = {"name": "Test River", "url": f"{fishing_reports.BASE_URL}/west/montana/test-river",
+         "lat": 45.5, "lon": -111.6}
+PAGE = b"<html><body><p>Water Temperature: 48 F</p><p>Updated: 10/15/2026</p></body></html>"
+
+
+class MockSite:
+    """Answers river page requests with a canned status, body and ETag."""
+
+    def __init__(self, status: int = 200, body: bytes = PAGE, etag: str = '"v1"'):
+        self.status = status
+        self.body = body
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.status == 304 or request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304, headers={"etag": self.etag})
+        return httpx.Response(self.status, content=self.body, headers={"etag": self.etag})
+
+
+@pytest.fixture
+def site(monkeypatch, tmp_path):
+    site = MockSite()
+    monkeypatch.setattr(transport, "_client", httpx.Client(transport=httpx.MockTransport(site)))
+    monkeypatch.setattr(fishing_reports, "CRAWL_STATE_PATH", tmp_path / "state.json")
+    monkeypatch.setattr(fishing_reports, "REPORTS_PATH", tmp_path / "reports.json")
+    monkeypatch.setattr(fishing_reports, "TILES_DIR", tmp_path / "fishing-reports")
+    return site
+
+
+def previous_report() -> FishingReport:
+    return FishingReport(name="Test River", url=RIVER["url"], state="Montana", region="West",
+                         lat=45.5, lon=-111.6, conditions="from last run")
+
+
+def crawl_state(etag: Optional[str] = '"v1"', body: bytes = PAGE, fetched: Optional[datetime] = None) -> dict:
+    """Crawl state as left by an earlier fetch of RIVER (a day ago by default)."""
+    fetched = fetched or datetime.now() - timedelta(days=1)
+    return {"states": {}, "rivers": {RIVER["url"]: {
+        "etag": etag, "last_modified": None, "hash": hashlib.sha256(body).hexdigest(),
+        "updated": None, "fetched": fetched.isoformat(timespec="seconds"),
+    }}}
+
+
+def test_not_modified_keeps_previous_report(site):
+    state = crawl_state()
+    previous = previous_report()
+    report = refresh_river_report(RIVER, "west", "montana", state, previous)
+
+    assert site.requests[0].headers["if-none-match"] == '"v1"'
+    assert report is previous
+    assert datetime.fromisoformat(state["rivers"][RIVER["url"]]["fetched"]) > datetime.now() - timedelta(minutes=1)
+
+
+def test_unchanged_body_is_not_parsed(site, monkeypatch):
+    site.etag = '"v2"'  # Validator changed, content did not
+    monkeypatch.setattr(fishing_reports, "parse_river_report", lambda *args: pytest.fail("parsed"))
+    state = crawl_state()
+    previous = previous_report()
+
+    assert refresh_river_report(RIVER, "west", "montana", state, previous) is previous
+    assert state["rivers"][RIVER["url"]]["etag"] == '"v2"'
+
+
+def test_changed_body_is_parsed(site):
+    site.etag = '"v2"'
+    state = crawl_state(body=b"older page")
+    report = refresh_river_report(RIVER, "west", "montana", state, previous_report())
+
+    assert report.water_temp == "48°F"
+    assert report.conditions is None
+
+
+def test_error_keeps_previous_report_and_stays_stale(site):
+    site.status = 500
+    state = crawl_state(etag=None)
+    before = dict(state["rivers"][RIVER["url"]])
+    previous = previous_report()
+
+    assert refresh_river_report(RIVER, "west", "montana", state, previous) is previous
+    assert state["rivers"][RIVER["url"]] == before
+
+
+def test_fresh_river_is_not_requested(site, monkeypatch):
+    monkeypatch.setattr(fishing_reports, "REGIONS", {"west": ["montana"]})
+    state = crawl_state(fetched=datetime.now())
+    state["states"]["west/montana"] = {"fetched": datetime.now().isoformat(timespec="seconds"),
+                                       "rivers": [RIVER]}
+    fishing_reports.save_crawl_state(state)
+    fishing_reports.save_reports([previous_report()], fishing_reports.REPORTS_PATH)
+
+    reports = fetch_all_reports(concurrent=False)
+
+    assert site.requests == []
+    assert [report.conditions for report in reports] == ["from last run"]
+    assert json.loads(fishing_reports.CRAWL_STATE_PATH.read_text()) == state
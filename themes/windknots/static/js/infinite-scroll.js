@@ -31,6 +31,16 @@
         return div.innerHTML;
     }
 
+    /**
+     * Inline style painting an item's low-quality image placeholder
+     */
+    function placeholderStyle(item) {
+        const preview = item.image_preview || '';
+        if (!preview.startsWith('data:image/webp;base64,')) return '';
+        const color = /^#[0-9a-f]{6}$/i.test(item.image_color || '') ? item.image_color : 'transparent';
+        return ` style="background:${color} url(${escapeHtml(preview)}) center/cover no-repeat"`;
+    }
+
     /**
      * Format date string
      */
@@ -58,7 +68,7 @@
                 if (i === 0) {
                     // Lead story — hero with overlay
                     const imageHtml = theme.image
-                        ? `<img src="${escapeHtml(theme.image)}" alt="${escapeHtml(theme.title)}" class="w-full h-72 md:h-96 object-cover group-hover:scale-105 transition-transform duration-500">`
+                        ? `<img src="${escapeHtml(theme.image)}" alt="${escapeHtml(theme.title)}" class="w-full h-72 md:h-96 object-cover group-hover:scale-105 transition-transform duration-500"${placeholderStyle(theme)}>`
                         : `<div class="w-full h-72 md:h-96 bg-gradient-to-br from-slate-700 to-slate-900"></div>`;
 
                     const tagsHtml = (theme.tags || []).slice(0, 2).map(tag =>
@@ -81,7 +91,7 @@
                     // Horizontal card
                     const borderClass = i > 1 ? 'border-t border-slate-200' : '';
                     const imageHtml = theme.image
-                        ? `<img src="${escapeHtml(theme.image)}" alt="${escapeHtml(theme.title)}" class="w-28 h-20 md:w-36 md:h-24 object-cover rounded flex-shrink-0">`
+                        ? `<img src="${escapeHtml(theme.image)}" alt="${escapeHtml(theme.title)}" class="w-28 h-20 md:w-36 md:h-24 object-cover rounded flex-shrink-0"${placeholderStyle(theme)}>`
                         : `<div class="w-28 h-20 md:w-36 md:h-24 bg-slate-200 rounded flex-shrink-0"></div>`;
 
                     const tagsHtml = (theme.tags || []).slice(0, 2).map(tag =>
@@ -155,7 +165,7 @@
         ).join('');
 
         const imageHtml = article.image
-            ? `<img src="${escapeHtml(article.image)}" alt="${escapeHtml(article.title)}" class="w-full h-full object-cover hover:scale-105 transition-transform duration-300" loading="lazy" onerror="this.src='/images/placeholder.jpg'">`
+            ? `<img src="${escapeHtml(article.image)}" alt="${escapeHtml(article.title)}" class="w-full h-full object-cover hover:scale-105 transition-transform duration-300" loading="lazy" onerror="this.src='/images/placeholder.jpg'"${placeholderStyle(article)}>`
             : `<div class="w-full h-full bg-gradient-to-br from-slate-300 to-slate-500 flex items-center justify-center">
                 <svg class="h-16 w-16 text-white opacity-50" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                     <path stroke-linecap="round" stroke-linejoin="round" stroke-width="1.5" d="M4 16l4.586-4.586a2 2 0 012.828 0L16 16m-2-2l1.586-1.586a2 2 0 012.828 0L20 14m-6-6h.01M6 20h12a2 2 0 002-2V6a2 2 0 00-2-2H6a2 2 0 00-2 2v12a2 2 0 002 2z"/>
@@ -10,7 +10,14 @@
     const SEARCH_RADIUS_MILES = 50;
     const MAX_RIVERS = 6;
     const MAX_REPORTS = 4;
-    const REPORTS_URL = '/data/fishing-reports.json';
+    const REPORTS_MANIFEST_URL = '/data/fishing-reports/manifest.json';
+    const REPORTS_TILE_URL = key => `/data/fishing-reports/tiles/${key}.json`;
+    const REPORT_TILES_FIRST_BATCH = 4;
+    // Stream flow prefetched by pipeline/stream_flow.py; used instead of a
+    // live USGS query when it covers the search area and is recent enough
+    const FLOW_MANIFEST_URL = '/data/stream-flow/manifest.json';
+    const FLOW_TILE_URL = key => `/data/stream-flow/tiles/${key}.json`;
+    const STATIC_FLOW_MAX_AGE = 24 * 60 * 60 * 1000; // 24 hours
 
     const FLOW_GRADES = {
         VERY_LOW: { label: 'Very Low', color: 'flow-grade-very-low', maxPercentile: 10 },
@@ -112,6 +119,78 @@
             const cached = this.getCache(cacheKey, USGS_CACHE_DURATION);
             if (cached) return cached;
 
+            let sites = null;
+            try {
+                sites = await this.fetchStaticSites(lat, lon);
+            } catch (e) {
+                sites = null;
+            }
+            if (!sites) {
+                sites = await this.fetchLiveSites(lat, lon);
+            }
+
+            this.setCache(cacheKey, sites);
+            return sites;
+        },
+
+        // Grid cells (see pipeline/stream_flow.tiles_near) overlapping the
+        // search box around a point
+        tilesNear(lat, lon, size) {
+            const bbox = this.getBoundingBox(lat, lon, SEARCH_RADIUS_MILES);
+            const keys = [];
+            for (let row = Math.floor(bbox.south / size); row <= Math.floor(bbox.north / size); row++) {
+                for (let col = Math.floor(bbox.west / size); col <= Math.floor(bbox.east / size); col++) {
+                    keys.push(`${row}_${col}`);
+                }
+            }
+            return keys;
+        },
+
+        // Prefetched gauges, or null if the search area is not covered
+        async fetchStaticSites(lat, lon) {
+            const manifestResponse = await fetch(FLOW_MANIFEST_URL);
+            if (!manifestResponse.ok) return null;
+            const manifest = await manifestResponse.json();
+            if (Date.now() - new Date(manifest.flow_fetched).getTime() > STATIC_FLOW_MAX_AGE) return null;
+
+            const keys = this.tilesNear(lat, lon, manifest.tile_degrees);
+            if (!keys.every(key => key in manifest.tiles)) return null;
+
+            const shards = await Promise.all(keys
+                .filter(key => manifest.tiles[key].count > 0)
+                .map(async key => {
+                    const response = await fetch(FLOW_TILE_URL(key));
+                    if (!response.ok) throw new Error('Failed to fetch stream flow');
+                    return (await response.json()).sites || [];
+                }));
+
+            const today = new Date();
+            const monthDay = `${String(today.getMonth() + 1).padStart(2, '0')}-${String(today.getDate()).padStart(2, '0')}`;
+
+            const sites = [].concat(...shards).map(gauge => {
+                const percentiles = gauge.stats?.[monthDay];
+                const [p10, p25, p50, p75, p90] = percentiles || [];
+                return {
+                    siteCode: gauge.code,
+                    name: this.cleanSiteName(gauge.name),
+                    lat: gauge.lat,
+                    lon: gauge.lon,
+                    distance: calculateDistance(lat, lon, gauge.lat, gauge.lon),
+                    flow: gauge.flow,
+                    flowUnit: 'cfs',
+                    dateTime: gauge.time,
+                    grade: percentiles && p50 > 0
+                        ? this.gradeFromPercentiles(gauge.flow, { p10, p25, p50, p75, p90 })
+                        : this.estimateGrade(gauge.flow),
+                    percentile: null
+                };
+            }).filter(site => site.distance <= SEARCH_RADIUS_MILES && site.flow >= 0);
+
+            sites.sort((a, b) => a.distance - b.distance);
+            return sites.slice(0, MAX_RIVERS);
+        },
+
+        async fetchLiveSites(lat, lon) {
             const bbox = this.getBoundingBox(lat, lon, SEARCH_RADIUS_MILES);
             const url = new URL('https://waterservices.usgs.gov/nwis/iv/');
             url.searchParams.set('format', 'json');
@@ -129,7 +208,6 @@
                 await this.fetchStatistics(sites);
             }
 
-            this.setCache(cacheKey, sites);
             return sites;
         },
 
@@ -281,44 +359,70 @@
     };
 
     // ========== Fishing Reports Service ==========
+    // Reports are sharded into grid tiles (see pipeline/fishing_reports.py).
+    // Tiles are loaded nearest first until no unloaded tile can hold a
+    // report closer than the MAX_REPORTS nearest found so far.
     const ReportsService = {
-        CACHE_KEY: 'fishing_reports_cache',
+        CACHE_KEY_PREFIX: 'fishing_reports_',
 
         async fetchReports(lat, lon) {
-            const cached = this.getCache();
-            let reports = cached;
-
-            if (!reports) {
-                const response = await fetch(REPORTS_URL);
-                if (!response.ok) throw new Error('Failed to fetch reports');
-                const data = await response.json();
-                reports = data.reports || [];
-                this.setCache(reports);
+            const manifest = await this.fetchJson(REPORTS_MANIFEST_URL, `${this.CACHE_KEY_PREFIX}manifest`);
+            const size = manifest.tile_degrees;
+            const tiles = Object.keys(manifest.tiles || {})
+                .map(key => ({ key, distance: distanceToTile(lat, lon, key, size) }))
+                .sort((a, b) => a.distance - b.distance);
+
+            let reports = [];
+            let next = 0;
+            while (next < tiles.length) {
+                const kth = reports.length >= MAX_REPORTS ? reports[MAX_REPORTS - 1].distance : Infinity;
+                if (tiles[next].distance > kth) break;
+
+                const batchSize = next === 0 ? REPORT_TILES_FIRST_BATCH : 1;
+                const batch = tiles.slice(next, next + batchSize);
+                next += batch.length;
+
+                const shards = await Promise.all(batch.map(tile => this.fetchTile(tile.key)));
+                reports = reports
+                    .concat(...shards.map(shard => shard.map(report => ({
+                        ...report,
+                        distance: calculateDistance(lat, lon, report.lat, report.lon)
+                    }))))
+                    .sort((a, b) => a.distance - b.distance);
             }
 
-            // Sort by distance
-            return reports
-                .map(report => ({
-                    ...report,
-                    distance: calculateDistance(lat, lon, report.lat, report.lon)
-                }))
-                .sort((a, b) => a.distance - b.distance)
-                .slice(0, MAX_REPORTS);
+            return reports.slice(0, MAX_REPORTS);
+        },
+
+        async fetchTile(key) {
+            const data = await this.fetchJson(REPORTS_TILE_URL(key), `${this.CACHE_KEY_PREFIX}${key}`);
+            return data.reports || [];
         },
 
-        getCache() {
-            const cached = sessionStorage.getItem(this.CACHE_KEY);
+        async fetchJson(url, cacheKey) {
+            const cached = this.getCache(cacheKey);
+            if (cached) return cached;
+
+            const response = await fetch(url);
+            if (!response.ok) throw new Error('Failed to fetch reports');
+            const data = await response.json();
+            this.setCache(cacheKey, data);
+            return data;
+        },
+
+        getCache(key) {
+            const cached = sessionStorage.getItem(key);
             if (!cached) return null;
             const { data, timestamp } = JSON.parse(cached);
             if (Date.now() - timestamp > REPORTS_CACHE_DURATION) {
-                sessionStorage.removeItem(this.CACHE_KEY);
+                sessionStorage.removeItem(key);
                 return null;
             }
             return data;
         },
 
-        setCache(data) {
-            sessionStorage.setItem(this.CACHE_KEY, JSON.stringify({
+        setCache(key, data) {
+            sessionStorage.setItem(key, JSON.stringify({
                 data: data,
                 timestamp: Date.now()
             }));
@@ -337,6 +441,16 @@
         return R * c;
     }
 
+    // Miles from a point to the nearest edge of a grid tile (0 inside it)
+    function distanceToTile(lat, lon, key, size) {
+        const [row, col] = key.split('_').map(Number);
+        const south = row * size;
+        const west = col * size;
+        const nearestLat = Math.min(Math.max(lat, south), south + size);
+        const nearestLon = Math.min(Math.max(lon, west), west + size);
+        return calculateDistance(lat, lon, nearestLat, nearestLon);
+    }
+
     function formatFlow(flow) {
         if (flow >= 10000) return `${(flow / 1000).toFixed(1)}k`;
         if (flow >= 1000) return flow.toFixed(0);